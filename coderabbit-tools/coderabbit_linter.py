@@ -14,10 +14,14 @@ Examples:
 """
 
 import argparse
+import logging
+import multiprocessing
 import os
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
 
 # Import all linters
 from linters.golang.go_module_linter import GoModuleLinter
@@ -42,16 +46,16 @@ from linters.nodejs.react_linter import ReactLinter
 from linters.nodejs.security_linter import NodeJSSecurityLinter
 from linters.nodejs.performance_linter import NodeJSPerformanceLinter
 from linters.nodejs.accessibility_linter import AccessibilityLinter
-from linters.base_linter import LintIssue, LintSeverity
+from linters.base_linter import GoLinter, LintIssue, LintSeverity, prune_issue_cache
 
 class CodeRabbitLinter:
     """Main linter orchestrator that runs all configured linters"""
     
-    def __init__(self, project_path: str):
+    def __init__(self, project_path: str, cache_dir: Optional[str] = None, offline: bool = False):
         self.project_path = Path(project_path).resolve()
         self.linters = {
             # Go linters
-            'go_module': GoModuleLinter(),
+            'go_module': GoModuleLinter(offline=offline),
             'go_security': SecurityLinter(),
             'go_context': ContextLinter(),
             'go_format': FormatLinter(),
@@ -81,6 +85,13 @@ class CodeRabbitLinter:
             'accessibility': AccessibilityLinter(),
         }
         
+        # Persist per-file Go and markdownlint issues so unchanged files are skipped on the next run
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        if cache_dir:
+            for linter in self.linters.values():
+                if isinstance(linter, (GoLinter, MarkdownLintLinter)):
+                    linter.cache_dir = Path(cache_dir)
+        
     def run_linters(self, linter_names: List[str] = None, auto_fix: bool = False) -> List[LintIssue]:
         """Run specified linters or all linters if none specified"""
         if linter_names is None:
@@ -101,12 +112,16 @@ class CodeRabbitLinter:
                 fixed_count = linter.fix_issues(issues, self.project_path)
                 if fixed_count > 0:
                     print(f"  Fixed {fixed_count} issues automatically")
-                    # Re-run linter to get remaining issues
+                    # Files changed on disk - drop memoized results and re-run linter
+                    linter.clear_cache()
                     issues = linter.lint(self.project_path)
             
             all_issues.extend(issues)
             print(f"  Found {len(issues)} issues")
         
+        if self.cache_dir is not None:
+            prune_issue_cache(self.cache_dir)
+        
         return all_issues
     
     def fix_issues(self, issues: List[LintIssue], project_path: Path) -> int:
@@ -184,12 +199,36 @@ class CodeRabbitLinter:
                     print(f"    💡 {issue.suggestion}")
                 print()
 
+def setup_logging(verbose: bool = False) -> QueueListener:
+    """Route log records through a queue drained by one thread, so linters never block on stderr"""
+    try:
+        # A multiprocessing queue also carries records from forked lint workers
+        log_queue = multiprocessing.Queue()
+    except OSError:
+        log_queue = queue.Queue()
+    
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter("%(message)s"))
+    listener = QueueListener(log_queue, handler)
+    
+    root = logging.getLogger()
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(logging.DEBUG if verbose else logging.WARNING)
+    listener.start()
+    return listener
+
 def main():
     parser = argparse.ArgumentParser(description="CodeRabbit Linter - Catch issues before commit")
     parser.add_argument('--path', default='.', help='Path to project directory (default: current directory)')
     parser.add_argument('--linters', help='Comma-separated list of linters to run (default: all)')
     parser.add_argument('--fix', action='store_true', help='Auto-fix issues where possible')
     parser.add_argument('--list-linters', action='store_true', help='List available linters')
+    parser.add_argument('--verbose', action='store_true', help='Include tracebacks for linter errors')
+    parser.add_argument('--cache-dir', help='Directory for cached Go and markdownlint results, keyed on file content '
+                                            '(e.g. .coderabbit-cache; default: no caching). '
+                                            'Entries unused for 30 days are pruned')
+    parser.add_argument('--offline', action='store_true',
+                        help='Skip network lookups, such as checking Go dependencies for newer versions')
     
     args = parser.parse_args()
     
@@ -229,8 +268,12 @@ def main():
         linter_names = [name.strip() for name in args.linters.split(',')]
     
     # Initialize and run linter
-    linter = CodeRabbitLinter(args.path)
-    issues = linter.run_linters(linter_names, args.fix)
+    listener = setup_logging(args.verbose)
+    try:
+        linter = CodeRabbitLinter(args.path, args.cache_dir, args.offline)
+        issues = linter.run_linters(linter_names, args.fix)
+    finally:
+        listener.stop()
     linter.print_results(issues)
     
     # Exit with error code if critical issues found
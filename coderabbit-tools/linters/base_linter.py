@@ -2,11 +2,29 @@
 Base linter classes and utilities for the CodeRabbit linting system
 """
 
+import atexit
+import hashlib
+import inspect
+import json
+import logging
+import mmap
+import os
+import re
+import sys
+import time
 from abc import ABC, abstractmethod
+from bisect import bisect_right
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass
 from enum import Enum
+from fnmatch import fnmatchcase
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, Iterator, Pattern, Sequence, Tuple, Union
+
+logger = logging.getLogger(__name__)
 
 
 class LintSeverity(Enum):
@@ -16,7 +34,144 @@ class LintSeverity(Enum):
     LOW = "low"        # Style, documentation
 
 
-@dataclass
+# Slotted dataclasses (Python 3.10+) drop the per-instance __dict__, which
+# matters when a large project produces many thousands of issues
+_DATACLASS_OPTIONS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+# Below this many files the cost of starting worker processes outweighs the gain
+PARALLEL_MIN_FILES = 8
+
+# Directories never linted (dependencies, VCS metadata, build output)
+SKIP_DIRS = frozenset({
+    '.git', 'node_modules', 'vendor', '.vscode', '.idea',
+    'gen', '__pycache__', '.pytest_cache', 'dist', 'build'
+})
+
+# Bump to invalidate every persisted issue cache entry (e.g. when LintIssue changes shape)
+ISSUE_CACHE_VERSION = 1
+
+# Cache entries unused for this long are pruned; a used entry's mtime is refreshed
+# at most once per interval, which is also how often pruning runs
+ISSUE_CACHE_MAX_AGE_SECONDS = 30 * 24 * 3600
+ISSUE_CACHE_TOUCH_INTERVAL = 24 * 3600
+
+# A file modified this recently may change again within the same mtime tick
+# without its (mtime, size) changing, so it gets no stat-keyed cache entry
+RACY_MTIME_NS = 1_000_000_000
+
+# Generated-code markers must appear within the first lines of a Go file
+GENERATED_HEADER_BYTES = 2048
+
+# Go files named like generator output (protoc, grpc-gateway, ...), skipped without opening them
+GENERATED_NAME_SUFFIXES = ('.pb.go', '.pb.gw.go', '_generated.go')
+GENERATED_NAME_PREFIXES = ('generated_',)
+
+# Go files larger than this are almost always generated code or embedded data
+MAX_GO_FILE_BYTES = 1024 * 1024
+
+# Skips code, line comments and interpreted string/rune literals up to the next
+# /* */ comment or raw string literal (group 1, running to the end of the content
+# if unterminated). Group 1 can always match where the skipping stops, so the
+# engine never has to backtrack through what it skipped.
+_RE_NEXT_BLOCK_LITERAL = re.compile(
+    rb'(?s)(?:[^/"\'`]+|/(?![/*])|//[^\n]*|"(?:[^"\\\n]|\\.)*"|\'(?:[^\'\\\n]|\\.)*\'|["\'])*'
+    rb'(/\*.*?(?:\*/|\Z)|`[^`]*(?:`|\Z)|\Z)')
+
+
+def iter_files(root: Path, suffixes: Tuple[str, ...]) -> Iterator[Path]:
+    """Yield all files under root ending in one of suffixes, pruning skipped directories without descending"""
+    try:
+        with os.scandir(root) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in SKIP_DIRS:
+                        yield from iter_files(Path(entry.path), suffixes)
+                elif entry.name.endswith(suffixes) and entry.is_file():
+                    yield Path(entry.path)
+    except OSError:
+        return
+
+
+def prune_issue_cache(cache_dir: Path) -> None:
+    """Delete issue cache entries that have not been used for ISSUE_CACHE_MAX_AGE_SECONDS
+    
+    The directory is scanned at most once per ISSUE_CACHE_TOUCH_INTERVAL.
+    """
+    stamp = Path(cache_dir) / ".pruned"
+    now = time.time()
+    try:
+        if now - stamp.stat().st_mtime < ISSUE_CACHE_TOUCH_INTERVAL:
+            return
+    except OSError:
+        pass
+    
+    cutoff = now - ISSUE_CACHE_MAX_AGE_SECONDS
+    try:
+        with os.scandir(cache_dir) as entries:
+            for entry in entries:
+                if entry.name.endswith(('.json', '.tmp')) and entry.is_file(follow_symlinks=False):
+                    try:
+                        if entry.stat().st_mtime < cutoff:
+                            os.unlink(entry.path)
+                    except OSError:
+                        pass
+        stamp.touch()
+    except OSError:
+        pass
+
+
+def in_skipped_dir(path: Path) -> bool:
+    """Check whether path is, or is inside, a directory that linting skips"""
+    return any(part.name in SKIP_DIRS for part in (path, *path.parents))
+
+
+def iter_go_files(root: Path) -> Iterator[Path]:
+    """Yield all .go files under root, pruning skipped directories without descending"""
+    return iter_files(root, ('.go',))
+
+
+_worker_pool: Optional[ProcessPoolExecutor] = None
+
+
+def _shared_worker_pool() -> ProcessPoolExecutor:
+    """Worker processes shared by every Go linter, so they start once per run"""
+    global _worker_pool
+    if _worker_pool is None:
+        _worker_pool = ProcessPoolExecutor(max_workers=os.cpu_count() or 1)
+        atexit.register(_worker_pool.shutdown)
+    return _worker_pool
+
+
+def _discard_worker_pool() -> None:
+    """Drop a broken shared pool so the next batch starts a fresh one"""
+    global _worker_pool
+    if _worker_pool is not None:
+        _worker_pool.shutdown(wait=False)
+        _worker_pool = None
+
+
+@lru_cache(maxsize=None)
+def _linter_fingerprint(linter_cls: type) -> bytes:
+    """Identify a linter implementation, so editing its source invalidates cached issues"""
+    parts = [f"{linter_cls.__module__}.{linter_cls.__qualname__}", str(ISSUE_CACHE_VERSION)]
+    for source in (inspect.getsourcefile(linter_cls), __file__):
+        try:
+            st = os.stat(source)
+            parts.append(f"{source}:{st.st_mtime_ns}:{st.st_size}")
+        except (OSError, TypeError):
+            parts.append(str(source))
+    return '\0'.join(parts).encode('utf-8', 'surrogateescape')
+
+
+def is_generated_header(head: bytes) -> bool:
+    """Check the leading bytes of a Go file for a generated-code marker"""
+    for line in head[:GENERATED_HEADER_BYTES].split(b'\n', 5)[:5]:
+        if b'Code generated' in line or b'DO NOT EDIT' in line:
+            return True
+    return False
+
+
+@dataclass(**_DATACLASS_OPTIONS)
 class LintIssue:
     """Represents a single linting issue found in code"""
     file_path: Path
@@ -33,12 +188,36 @@ class LintIssue:
         return f"{severity_emoji} {self.file_path}:{self.line_number} [{self.rule_id}] {self.message}"
 
 
+class LineInfo:
+    """Per-line features shared by several line-based Go rules
+    
+    Classifying a line once avoids each rule repeating the same strip()
+    and prefix checks.
+    """
+    __slots__ = ('raw', 'stripped', 'is_comment', 'is_blank', 'is_import', 'starts_func')
+    
+    def __init__(self, raw: str):
+        stripped = raw.strip()
+        self.raw = raw
+        self.stripped = stripped
+        self.is_comment = stripped.startswith('//')
+        self.is_blank = not stripped
+        self.is_import = stripped.startswith('import')
+        self.starts_func = stripped.startswith('func ')
+
+
 class BaseLinter(ABC):
     """Base class for all language-specific linters"""
     
+    # rule_id -> (severity, message, suggestion, auto_fixable) for rules reported via _emit
+    rules: Dict[str, Tuple[LintSeverity, str, Optional[str], bool]] = {}
+    
     def __init__(self, name: str, file_patterns: List[str]):
         self.name = name
         self.file_patterns = file_patterns
+        # Directory for persisted per-file issues keyed on content hash (None disables;
+        # only linters that read it cache anything)
+        self.cache_dir: Optional[Path] = None
         
     @abstractmethod
     def lint_file(self, file_path: Path) -> List[LintIssue]:
@@ -49,45 +228,67 @@ class BaseLinter(ABC):
         """Lint all applicable files in a project"""
         all_issues = []
         
+        for file_path in self._collect_files(project_path):
+            all_issues.extend(self._lint_file_safely(file_path))
+                    
+        return all_issues
+    
+    def _collect_files(self, project_path: Path) -> List[Path]:
+        """Find all files in a project matching this linter's patterns"""
+        files = []
+        
         for pattern in self.file_patterns:
             for file_path in project_path.rglob(pattern):
                 # Skip certain directories
                 if self._should_skip_file(file_path):
                     continue
-                    
-                try:
-                    issues = self.lint_file(file_path)
-                    all_issues.extend(issues)
-                except Exception as e:
-                    # Log error but continue linting other files
-                    print(f"Warning: Error linting {file_path}: {e}")
-                    
-        return all_issues
+                files.append(file_path)
+        
+        return files
+    
+    def _lint_file_safely(self, file_path: Path) -> List[LintIssue]:
+        """Lint a single file, reporting errors instead of raising them"""
+        try:
+            return self.lint_file(file_path)
+        except Exception as e:
+            # Log error but continue linting other files
+            logger.warning("Error linting %s: %s", file_path, e,
+                           exc_info=logger.isEnabledFor(logging.DEBUG))
+            return []
     
     def fix_issues(self, issues: List[LintIssue], project_path: Path) -> int:
         """Auto-fix issues where possible. Returns count of fixed issues."""
         fixed_count = 0
         
+        # Group by file so linters can apply all fixes for a file in one pass
+        issues_by_file: Dict[Path, List[LintIssue]] = {}
         for issue in issues:
             if issue.auto_fixable:
-                try:
-                    if self._fix_issue(issue):
-                        fixed_count += 1
-                except Exception as e:
-                    print(f"Warning: Could not auto-fix {issue.file_path}:{issue.line_number}: {e}")
+                issues_by_file.setdefault(issue.file_path, []).append(issue)
+        
+        for file_path, file_issues in issues_by_file.items():
+            fixed_count += self._fix_issues_for_file(file_path, file_issues)
                     
         return fixed_count
     
+    def _fix_issues_for_file(self, file_path: Path, issues: List[LintIssue]) -> int:
+        """Auto-fix issues in a single file. Override to batch the file I/O."""
+        fixed_count = 0
+        
+        for issue in issues:
+            try:
+                if self._fix_issue(issue):
+                    fixed_count += 1
+            except Exception as e:
+                print(f"Warning: Could not auto-fix {issue.file_path}:{issue.line_number}: {e}")
+        
+        return fixed_count
+    
     def _should_skip_file(self, file_path: Path) -> bool:
         """Check if file should be skipped during linting"""
-        skip_dirs = {
-            '.git', 'node_modules', 'vendor', '.vscode', '.idea',
-            'gen', '__pycache__', '.pytest_cache', 'dist', 'build'
-        }
-        
         # Check if any parent directory should be skipped
         for parent in file_path.parents:
-            if parent.name in skip_dirs:
+            if parent.name in SKIP_DIRS:
                 return True
                 
         return False
@@ -96,45 +297,290 @@ class BaseLinter(ABC):
         """Override in subclasses to implement auto-fixing"""
         return False
     
+    def clear_cache(self) -> None:
+        """Override in subclasses that memoize per-project results"""
+        pass
+    
     def _create_issue(self, file_path: Path, line_number: int, severity: LintSeverity, 
                      rule_id: str, message: str, suggestion: str = None, 
                      auto_fixable: bool = False) -> LintIssue:
         """Helper to create LintIssue objects"""
-        return LintIssue(
-            file_path=file_path,
-            line_number=line_number,
-            severity=severity,
-            linter_name=self.name,
-            rule_id=rule_id,
-            message=message,
-            suggestion=suggestion,
-            auto_fixable=auto_fixable
-        )
+        # Positional arguments skip the dataclass __init__'s keyword matching
+        return LintIssue(file_path, line_number, severity, self.name, rule_id,
+                         message, suggestion, auto_fixable)
+    
+    def _emit(self, issues: List[LintIssue], rule_id: str, file_path: Path,
+              line_number: int, **details: Any) -> None:
+        """Append an issue for a rule in self.rules
+        
+        Keyword arguments fill {placeholders} in the rule's message and suggestion.
+        """
+        severity, message, suggestion, auto_fixable = self.rules[rule_id]
+        if details:
+            message = message.format(**details)
+            if suggestion:
+                suggestion = suggestion.format(**details)
+        issues.append(LintIssue(file_path, line_number, severity, self.name, rule_id,
+                                message, suggestion, auto_fixable))
+    
+    def _cache_entry(self, key: bytes) -> Path:
+        """Path of the persisted issue cache entry for a key"""
+        return Path(self.cache_dir) / f"{hashlib.sha256(key).hexdigest()}.json"
+    
+    def _load_cached_issues(self, entry: Path, file_path: Path) -> Optional[List[LintIssue]]:
+        """Issues stored in a cache entry, or None if it is missing or unreadable"""
+        try:
+            with open(entry, 'rb') as f:
+                data = f.read()
+                if time.time() - os.fstat(f.fileno()).st_mtime > ISSUE_CACHE_TOUCH_INTERVAL:
+                    # Mark the entry as used, so prune_issue_cache keeps it
+                    try:
+                        os.utime(entry)
+                    except OSError:
+                        pass
+            # Files without issues - most of them - have empty entries, which skip JSON decoding
+            if not data:
+                return []
+            rows = json.loads(data)
+            return [LintIssue(file_path, line_number, LintSeverity(severity), self.name,
+                              rule_id, message, suggestion, auto_fixable)
+                    for line_number, severity, rule_id, message, suggestion, auto_fixable in rows]
+        except (OSError, ValueError, TypeError):
+            return None
+    
+    def _store_cached_issues(self, entry: Path, issues: List[LintIssue]) -> None:
+        """Persist issues to a cache entry, ignoring I/O errors"""
+        rows = [(issue.line_number, issue.severity.value, issue.rule_id, issue.message,
+                 issue.suggestion, issue.auto_fixable) for issue in issues]
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # Write then rename, so concurrent workers never see a partial entry
+            tmp_path = entry.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                if rows:
+                    json.dump(rows, f)
+            os.replace(tmp_path, entry)
+        except OSError:
+            pass
 
 
 class GoLinter(BaseLinter):
     """Base class for Go-specific linters"""
     
+    # project path -> Go files, walked once and shared by every Go linter
+    _go_files_cache: Dict[Path, List[Path]] = {}
+    
     def __init__(self, name: str):
         super().__init__(name, ["*.go"])
+    
+    @classmethod
+    def invalidate(cls, project_path: Optional[Path] = None) -> None:
+        """Forget the cached Go file list for a project, or for all projects"""
+        if project_path is None:
+            GoLinter._go_files_cache.clear()
+        else:
+            GoLinter._go_files_cache.pop(project_path, None)
+    
+    def clear_cache(self) -> None:
+        self.invalidate()
+    
+    def _go_files(self, project_path: Path) -> List[Path]:
+        """All lintable .go files in a project, from a single shared directory walk"""
+        files = GoLinter._go_files_cache.get(project_path)
+        if files is None:
+            files = [file_path for file_path in iter_go_files(project_path)
+                     if not self._should_skip_file(file_path)]
+            GoLinter._go_files_cache[project_path] = files
+        return files
+    
+    def _should_skip_file(self, file_path: Path) -> bool:
+        name = file_path.name
+        return (name.endswith(GENERATED_NAME_SUFFIXES) or name.startswith(GENERATED_NAME_PREFIXES)
+                or super()._should_skip_file(file_path))
+    
+    def _collect_files(self, project_path: Path) -> List[Path]:
+        return [file_path for file_path in self._go_files(project_path)
+                if any(fnmatchcase(file_path.name, pattern) for pattern in self.file_patterns)]
+    
+    def lint(self, project_path: Path) -> List[LintIssue]:
+        """Lint all Go files in a project, using worker processes for larger projects"""
+        return self.lint_files(self._collect_files(project_path))
+    
+    def lint_files(self, paths: Sequence[Path]) -> List[LintIssue]:
+        """Lint a batch of Go files, fanning out to worker processes for larger batches"""
+        workers = min(os.cpu_count() or 1, len(paths))
         
-    def _is_generated_file(self, file_path: Path) -> bool:
-        """Check if Go file is generated (should be skipped)"""
+        if len(paths) >= PARALLEL_MIN_FILES and workers > 1:
+            chunksize = max(1, len(paths) // (workers * 4))
+            try:
+                return list(chain.from_iterable(
+                    _shared_worker_pool().map(self._lint_file_safely, paths, chunksize=chunksize)))
+            except (OSError, BrokenProcessPool) as e:
+                # Process pools are unavailable in some sandboxes - lint serially instead
+                _discard_worker_pool()
+                logger.warning("Parallel linting unavailable (%s), falling back to serial", e)
+        
+        return list(chain.from_iterable(map(self._lint_file_safely, paths)))
+        
+    def _should_skip_content(self, file_path: Path) -> bool:
+        """Check if Go file is generated or oversized (should be skipped)"""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                first_lines = [f.readline().strip() for _ in range(5)]
-                for line in first_lines:
-                    if 'Code generated' in line or 'DO NOT EDIT' in line:
-                        return True
-        except Exception:
+            # Only the size and header matter - sniff raw bytes without decoding the file
+            with open(file_path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size > MAX_GO_FILE_BYTES:
+                    return True
+                return is_generated_header(f.read(GENERATED_HEADER_BYTES))
+        except OSError:
             pass
         return False
     
+    def _iter_candidate_lines(self, file_path: Path,
+                              triggers: Tuple[bytes, ...]) -> Iterator[Tuple[int, str]]:
+        """Yield (line_number, line) for lines containing any of the trigger bytes
+        
+        The file is memory-mapped and screened at the byte level, so only the
+        lines that can possibly match a rule are decoded to str.
+        """
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                size = len(mm)
+                start = 0
+                line_num = 0
+                while start < size:
+                    end = mm.find(b'\n', start)
+                    if end == -1:
+                        end = size
+                    line_num += 1
+                    segment = mm[start:end]
+                    if any(trigger in segment for trigger in triggers):
+                        if segment.endswith(b'\r'):
+                            segment = segment[:-1]
+                        # Undecodable bytes must not end the scan of the rest of the file
+                        yield line_num, segment.decode('utf-8', 'replace')
+                    start = end + 1
+    
+    def _iter_matching_lines(self, content: Union[bytes, mmap.mmap],
+                             pattern: Pattern) -> Iterator[Tuple[int, str]]:
+        """Yield (line_number, line) for each line of content that pattern matches in
+        
+        content is the raw file (bytes or a memory map) and pattern a bytes
+        regex. The engine scans the whole buffer for the next match, so lines
+        that cannot trigger any rule are never visited or decoded.
+        """
+        pos = 0
+        line_num = 1
+        counted = 0
+        while True:
+            match = pattern.search(content, pos)
+            if match is None:
+                return
+            start = content.rfind(b'\n', 0, match.start()) + 1
+            end = content.find(b'\n', match.start())
+            if end == -1:
+                end = len(content)
+            line_num += content[counted:start].count(b'\n')
+            counted = start
+            line = content[start:end]
+            if line.endswith(b'\r'):
+                line = line[:-1]
+            yield line_num, line.decode('utf-8', 'replace')
+            pos = end + 1
+    
+    def _iter_matching_code_lines(self, content: Union[bytes, mmap.mmap],
+                                  pattern: Pattern) -> Iterator[Tuple[int, str]]:
+        """_iter_matching_lines, leaving out lines inside comments and raw strings"""
+        ranges = self._literal_line_ranges(content)
+        for line_num, line in self._iter_matching_lines(content, pattern):
+            index = bisect_right(ranges, (line_num, float('inf'))) - 1
+            if index < 0 or line_num > ranges[index][1]:
+                yield line_num, line
+    
+    def _literal_line_ranges(self, content: Union[bytes, mmap.mmap]) -> List[Tuple[int, int]]:
+        """(first, last) line spans lying wholly inside a multi-line /* */ comment or raw string
+        
+        The lines a literal opens and closes on only count when nothing but
+        whitespace precedes or follows it there.
+        """
+        ranges = []
+        # Explicit start: a memory map's find() otherwise searches from its file position
+        if content.find(b'/*', 0) == -1 and content.find(b'`', 0) == -1:
+            return ranges
+        
+        pos = 0
+        line_num = 1
+        counted = 0
+        while True:
+            start, end = _RE_NEXT_BLOCK_LITERAL.match(content, pos).span(1)
+            if start == end:
+                return ranges
+            pos = end
+            if content.find(b'\n', start, end) == -1:
+                continue
+            
+            # The line the literal opens on
+            line_start = content.rfind(b'\n', 0, start) + 1
+            line_num += content[counted:line_start].count(b'\n')
+            counted = line_start
+            first = line_num if not content[line_start:start].strip() else line_num + 1
+            
+            # The line it closes on
+            line_start = content.rfind(b'\n', 0, end) + 1
+            line_num += content[counted:line_start].count(b'\n')
+            counted = line_start
+            line_end = content.find(b'\n', end)
+            if line_end == -1:
+                line_end = len(content)
+            last = line_num if not content[end:line_end].strip() else line_num - 1
+            
+            if first <= last:
+                ranges.append((first, last))
+    
     def lint_file(self, file_path: Path) -> List[LintIssue]:
-        if self._is_generated_file(file_path):
+        if self._should_skip_content(file_path):
             return []
+        if self.cache_dir is not None:
+            return self._lint_go_file_cached(file_path)
         return self._lint_go_file(file_path)
     
+    def _lint_go_file_cached(self, file_path: Path) -> List[LintIssue]:
+        """_lint_go_file, reusing issues persisted for an unchanged file
+        
+        An entry keyed on the file's size and mtime answers without reading the
+        file; failing that, one keyed on the content hash still matches files
+        whose mtime changed but whose content did not (e.g. after a checkout).
+        """
+        # Rules may depend on the file name too (e.g. _test.go, main.go)
+        identity = (_linter_fingerprint(type(self)) + b'\0'
+                    + os.path.abspath(file_path).encode('utf-8', 'surrogateescape') + b'\0')
+        try:
+            with open(file_path, 'rb') as f:
+                st = os.fstat(f.fileno())
+                stat_entry = self._cache_entry(identity + f"stat:{st.st_mtime_ns}:{st.st_size}".encode())
+                issues = self._load_cached_issues(stat_entry, file_path)
+                if issues is not None:
+                    return issues
+                
+                if hasattr(hashlib, 'file_digest'):
+                    content_digest = hashlib.file_digest(f, 'sha256').digest()
+                else:
+                    content_digest = hashlib.sha256(f.read()).digest()
+        except OSError:
+            return self._lint_go_file(file_path)
+        
+        content_entry = self._cache_entry(identity + b'content:' + content_digest)
+        issues = self._load_cached_issues(content_entry, file_path)
+        if issues is None:
+            issues = self._lint_go_file(file_path)
+            self._store_cached_issues(content_entry, issues)
+        # Like git's racy-index check: a same-size rewrite within the current mtime
+        # tick would otherwise be answered from the stat entry
+        if time.time_ns() - st.st_mtime_ns >= RACY_MTIME_NS:
+            self._store_cached_issues(stat_entry, issues)
+        
+        return issues
+    
     @abstractmethod
     def _lint_go_file(self, file_path: Path) -> List[LintIssue]:
         """Implement Go-specific linting logic"""
@@ -146,6 +592,16 @@ class MarkdownLinter(BaseLinter):
     
     def __init__(self, name: str):
         super().__init__(name, ["*.md", "*.markdown"])
+    
+    def _collect_files(self, project_path: Path) -> List[Path]:
+        """Find all markdown files in a project with a single directory walk"""
+        # The patterns are all "*.<extension>", so a suffix test matches them
+        suffixes = tuple(pattern.lstrip('*') for pattern in self.file_patterns)
+        # The walk prunes skipped directories below the project, so the only ones a file
+        # can still be inside are the project directory and its ancestors - check them once
+        if in_skipped_dir(project_path):
+            return []
+        return list(iter_files(project_path, suffixes))
 
 
 class NodeJSLinter(BaseLinter):
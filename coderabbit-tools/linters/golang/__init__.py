@@ -1 +1,5 @@
-# Go-specific linters
\ No newline at end of file
+# Go-specific linters
+#
+# Patterns are compiled with the stdlib re engine. A rule whose pattern could
+# backtrack super-linearly on a long line is checked in linear time instead,
+# by anchoring the pattern or splitting it into ordered searches.
\ No newline at end of file
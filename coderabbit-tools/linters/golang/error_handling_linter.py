@@ -3,16 +3,71 @@ Go error handling linter
 Catches issues with error wrapping, sentinel errors, and error patterns
 """
 
+import logging
 import re
 from pathlib import Path
 from typing import List
 
 from ..base_linter import GoLinter, LintIssue, LintSeverity
 
+logger = logging.getLogger(__name__)
+
+_RE_SENTINEL_DEF = re.compile(r'var\s+Err\w+\s*=\s*errors\.New')
+_RE_ERR_STRUCT_LITERAL = re.compile(r'&\w+Error\{')
+_RE_ERR_STRUCT_TYPE = re.compile(r'type\s+\w+Error\s+struct')
+_RE_ERR_ASSIGN = re.compile(r'(\w+)\s*,\s*err\s*:?=')
+
+# Every rule needs at least one of these substrings on the line
+_LINE_TRIGGERS = (b'err', b'Err', b'panic(', b'_ = ')
+
+
+def _returns_struct_error(line: str) -> bool:
+    """Whether 'return' is followed by an &<Name>Error{ literal and then a '}'
+    
+    Equivalent to searching for return.*&\\w+Error\\{.*\\}, but the earliest
+    of each part is always the best candidate, so one left-to-right scan does.
+    """
+    start = line.find('return')
+    if start == -1:
+        return False
+    match = _RE_ERR_STRUCT_LITERAL.search(line, start + len('return'))
+    return match is not None and line.find('}', match.end()) != -1
+
+# rule_id -> (severity, message, suggestion, auto_fixable)
+_RULES = {
+    "ERR_001": (LintSeverity.MEDIUM, "fmt.Errorf without %w verb - error chain may be lost",
+                "Use %w verb to wrap errors: fmt.Errorf(\"context: %w\", err)", False),
+    "ERR_002": (LintSeverity.HIGH, "Multiple %w verbs in single fmt.Errorf call",
+                "Use only one %w verb per fmt.Errorf call "
+                "(unless using sentinel + custom error pattern)", False),
+    "ERR_003": (LintSeverity.MEDIUM, "errors.New() when error wrapping might be needed",
+                "Consider using fmt.Errorf(\"%w\", err) to preserve error chain", False),
+    "ERR_004": (LintSeverity.MEDIUM, "Sentinel error should use errors.New()",
+                "Define sentinel errors with: var ErrName = errors.New(\"description\")", False),
+    "ERR_005": (LintSeverity.MEDIUM, "Direct error struct return without sentinel error wrapping",
+                "Wrap with sentinel error: fmt.Errorf(\"%w: %w\", ErrSentinel, &CustomError{})", False),
+    "ERR_006": (LintSeverity.HIGH, "errors.Is() with pointer - should use value",
+                "Use errors.Is(err, ErrSentinel) not errors.Is(err, &structError{})", False),
+    "ERR_007": (LintSeverity.MEDIUM, "Custom error type should implement Error() method",
+                "Implement func (e *CustomError) Error() string method", False),
+    "ERR_008": (LintSeverity.HIGH, "panic() used instead of proper error handling",
+                "Return error instead of panicking for recoverable conditions", False),
+    "ERR_009": (LintSeverity.MEDIUM, "Ignored error without explanation comment",
+                "Add //nolint:errcheck // reason comment or handle the error", True),
+    "ERR_010": (LintSeverity.MEDIUM, "Error variable assigned but not checked",
+                "Add error handling: if err != nil { return err }", False),
+    "ERR_011": (LintSeverity.LOW, "Returning error without additional context",
+                "Add context with fmt.Errorf(\"operation failed: %w\", err)", False),
+    "ERR_012": (LintSeverity.MEDIUM, "Custom error types without corresponding sentinel errors",
+                "Define sentinel errors for custom error types for easier error checking", False),
+}
+
 
 class ErrorHandlingLinter(GoLinter):
     """Linter for Go error handling patterns"""
     
+    rules = _RULES
+    
     def __init__(self):
         super().__init__("error_handling")
     
@@ -21,21 +76,28 @@ class ErrorHandlingLinter(GoLinter):
         issues = []
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                lines = content.splitlines()
+            has_custom_errors = False
+            has_sentinel_errors = False
+            is_mainlike = file_path.name == 'main.go' or file_path.name.endswith('_test.go')
             
-            for line_num, line in enumerate(lines, 1):
+            for line_num, line in self._iter_candidate_lines(file_path, _LINE_TRIGGERS):
                 issues.extend(self._check_error_wrapping(file_path, line_num, line))
                 issues.extend(self._check_sentinel_errors(file_path, line_num, line))
-                issues.extend(self._check_error_creation(file_path, line_num, line))
+                issues.extend(self._check_error_creation(file_path, line_num, line, is_mainlike))
                 issues.extend(self._check_error_handling(file_path, line_num, line))
                 
+                # Track file-level error definitions in the same pass
+                if not has_custom_errors and _RE_ERR_STRUCT_TYPE.search(line):
+                    has_custom_errors = True
+                if not has_sentinel_errors and _RE_SENTINEL_DEF.search(line):
+                    has_sentinel_errors = True
+                
             # Check file-level error patterns
-            issues.extend(self._check_error_definitions(file_path, content))
+            issues.extend(self._check_error_definitions(file_path, has_custom_errors, has_sentinel_errors))
                 
-        except Exception as e:
-            print(f"Error reading {file_path}: {e}")
+        except (OSError, ValueError) as e:
+            logger.warning("Error reading %s: %s", file_path, e,
+                           exc_info=logger.isEnabledFor(logging.DEBUG))
         
         return issues
     
@@ -45,42 +107,19 @@ class ErrorHandlingLinter(GoLinter):
         
         # fmt.Errorf without %w verb for error wrapping
         if 'fmt.Errorf(' in line and '%w' not in line and 'err' in line:
-            issues.append(self._create_issue(
-                file_path=file_path,
-                line_number=line_num,
-                severity=LintSeverity.MEDIUM,
-                rule_id="ERR_001",
-                message="fmt.Errorf without %w verb - error chain may be lost",
-                suggestion="Use %w verb to wrap errors: fmt.Errorf(\"context: %w\", err)",
-                auto_fixable=False
-            ))
+            self._emit(issues, "ERR_001", file_path, line_num)
         
         # Double error wrapping (fmt.Errorf with multiple %w) - but allow sentinel + custom error pattern
-        if 'fmt.Errorf(' in line and line.count('%w') > 1:
+        first_wrap = line.find('%w')
+        if (first_wrap != -1 and line.find('%w', first_wrap + 2) != -1
+                and 'fmt.Errorf(' in line):
             # Allow the pattern: fmt.Errorf("%w: %w", ErrSentinel, &CustomError{})
             if not ('Err' in line and '&' in line and 'Error{' in line):
-                issues.append(self._create_issue(
-                    file_path=file_path,
-                    line_number=line_num,
-                    severity=LintSeverity.HIGH,
-                    rule_id="ERR_002",
-                    message="Multiple %w verbs in single fmt.Errorf call",
-                    suggestion="Use only one %w verb per fmt.Errorf call "
-                              "(unless using sentinel + custom error pattern)",
-                    auto_fixable=False
-                ))
+                self._emit(issues, "ERR_002", file_path, line_num)
         
         # errors.New when should wrap existing error
         if 'errors.New(' in line and 'err' in line and 'fmt.Errorf' not in line:
-            issues.append(self._create_issue(
-                file_path=file_path,
-                line_number=line_num,
-                severity=LintSeverity.MEDIUM,
-                rule_id="ERR_003",
-                message="errors.New() when error wrapping might be needed",
-                suggestion="Consider using fmt.Errorf(\"%w\", err) to preserve error chain",
-                auto_fixable=False
-            ))
+            self._emit(issues, "ERR_003", file_path, line_num)
         
         return issues
     
@@ -89,75 +128,36 @@ class ErrorHandlingLinter(GoLinter):
         issues = []
         
         # Sentinel error definition patterns
-        if re.match(r'var\s+Err\w+\s*=\s*errors\.New', line):
+        if _RE_SENTINEL_DEF.match(line):
             # Good sentinel error pattern
             pass
         elif 'var Err' in line and '=' in line and 'errors.New' not in line:
-            issues.append(self._create_issue(
-                file_path=file_path,
-                line_number=line_num,
-                severity=LintSeverity.MEDIUM,
-                rule_id="ERR_004",
-                message="Sentinel error should use errors.New()",
-                suggestion="Define sentinel errors with: var ErrName = errors.New(\"description\")",
-                auto_fixable=False
-            ))
+            self._emit(issues, "ERR_004", file_path, line_num)
         
         # Direct struct error return without sentinel wrapping
-        if re.search(r'return.*&\w+Error{.*}', line) and 'fmt.Errorf' not in line:
-            issues.append(self._create_issue(
-                file_path=file_path,
-                line_number=line_num,
-                severity=LintSeverity.MEDIUM,
-                rule_id="ERR_005",
-                message="Direct error struct return without sentinel error wrapping",
-                suggestion="Wrap with sentinel error: fmt.Errorf(\"%w: %w\", ErrSentinel, &CustomError{})",
-                auto_fixable=False
-            ))
+        if 'fmt.Errorf' not in line and _returns_struct_error(line):
+            self._emit(issues, "ERR_005", file_path, line_num)
         
         # errors.Is usage with wrong pattern
         if 'errors.Is(' in line and '&' in line:
-            issues.append(self._create_issue(
-                file_path=file_path,
-                line_number=line_num,
-                severity=LintSeverity.HIGH,
-                rule_id="ERR_006",
-                message="errors.Is() with pointer - should use value",
-                suggestion="Use errors.Is(err, ErrSentinel) not errors.Is(err, &structError{})",
-                auto_fixable=False
-            ))
+            self._emit(issues, "ERR_006", file_path, line_num)
         
         return issues
     
-    def _check_error_creation(self, file_path: Path, line_num: int, line: str) -> List[LintIssue]:
+    def _check_error_creation(self, file_path: Path, line_num: int, line: str,
+                              is_mainlike: bool) -> List[LintIssue]:
         """Check for error creation patterns"""
         issues = []
         
         # Error struct without Error() method
-        if re.match(r'type\s+\w+Error\s+struct', line):
+        if _RE_ERR_STRUCT_TYPE.match(line):
             # This would need multi-line analysis to check for Error() method
             # For now, just suggest it
-            issues.append(self._create_issue(
-                file_path=file_path,
-                line_number=line_num,
-                severity=LintSeverity.MEDIUM,
-                rule_id="ERR_007",
-                message="Custom error type should implement Error() method",
-                suggestion="Implement func (e *CustomError) Error() string method",
-                auto_fixable=False
-            ))
+            self._emit(issues, "ERR_007", file_path, line_num)
         
         # Panic instead of proper error return
-        if 'panic(' in line and file_path.name != 'main.go' and '_test.go' not in file_path.name:
-            issues.append(self._create_issue(
-                file_path=file_path,
-                line_number=line_num,
-                severity=LintSeverity.HIGH,
-                rule_id="ERR_008",
-                message="panic() used instead of proper error handling",
-                suggestion="Return error instead of panicking for recoverable conditions",
-                auto_fixable=False
-            ))
+        if not is_mainlike and 'panic(' in line:
+            self._emit(issues, "ERR_008", file_path, line_num)
         
         return issues
     
@@ -168,67 +168,26 @@ class ErrorHandlingLinter(GoLinter):
         # Ignored error without comment
         if '_ = ' in line and '(' in line and ')' in line and 'nolint' not in line:
             # Likely ignoring an error return
-            issues.append(self._create_issue(
-                file_path=file_path,
-                line_number=line_num,
-                severity=LintSeverity.MEDIUM,
-                rule_id="ERR_009",
-                message="Ignored error without explanation comment",
-                suggestion="Add //nolint:errcheck // reason comment or handle the error",
-                auto_fixable=True
-            ))
+            self._emit(issues, "ERR_009", file_path, line_num)
         
         # Error assignment without handling
-        if re.search(r'(\w+)\s*,\s*err\s*:?=', line) and 'if err' not in line:
-            issues.append(self._create_issue(
-                file_path=file_path,
-                line_number=line_num,
-                severity=LintSeverity.MEDIUM,
-                rule_id="ERR_010",
-                message="Error variable assigned but not checked",
-                suggestion="Add error handling: if err != nil { return err }",
-                auto_fixable=False
-            ))
+        if _RE_ERR_ASSIGN.search(line) and 'if err' not in line:
+            self._emit(issues, "ERR_010", file_path, line_num)
         
         # Generic error messages without context
         if 'return err' in line and 'fmt.Errorf' not in line and 'errors.New' not in line:
-            issues.append(self._create_issue(
-                file_path=file_path,
-                line_number=line_num,
-                severity=LintSeverity.LOW,
-                rule_id="ERR_011",
-                message="Returning error without additional context",
-                suggestion="Add context with fmt.Errorf(\"operation failed: %w\", err)",
-                auto_fixable=False
-            ))
+            self._emit(issues, "ERR_011", file_path, line_num)
         
         return issues
     
-    def _check_error_definitions(self, file_path: Path, content: str) -> List[LintIssue]:
+    def _check_error_definitions(self, file_path: Path, has_custom_errors: bool,
+                                 has_sentinel_errors: bool) -> List[LintIssue]:
         """Check file-level error definition patterns"""
         issues = []
         
         # Missing sentinel error for custom error types
-        lines = content.splitlines()
-        has_custom_errors = False
-        has_sentinel_errors = False
-        
-        for line in lines:
-            if re.search(r'type\s+\w+Error\s+struct', line):
-                has_custom_errors = True
-            if re.search(r'var\s+Err\w+\s*=\s*errors\.New', line):
-                has_sentinel_errors = True
-        
         if has_custom_errors and not has_sentinel_errors:
-            issues.append(self._create_issue(
-                file_path=file_path,
-                line_number=1,
-                severity=LintSeverity.MEDIUM,
-                rule_id="ERR_012",
-                message="Custom error types without corresponding sentinel errors",
-                suggestion="Define sentinel errors for custom error types for easier error checking",
-                auto_fixable=False
-            ))
+            self._emit(issues, "ERR_012", file_path, 1)
         
         return issues
     
@@ -259,6 +218,7 @@ class ErrorHandlingLinter(GoLinter):
                     return True
                     
         except Exception as e:
-            print(f"Error auto-fixing {issue.file_path}:{issue.line_number}: {e}")
+            logger.warning("Error auto-fixing %s:%s: %s", issue.file_path, issue.line_number, e,
+                           exc_info=logger.isEnabledFor(logging.DEBUG))
             
         return False
\ No newline at end of file
@@ -3,16 +3,47 @@ Go format and style linter
 Catches formatting issues like trailing whitespace, duplicate comments, etc.
 """
 
+import logging
 import re
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
-from ..base_linter import GoLinter, LintIssue, LintSeverity
+from ..base_linter import GoLinter, LineInfo, LintIssue, LintSeverity
+
+logger = logging.getLogger(__name__)
+
+# Only ever matched at the start of a line, which keeps the receiver's [^)]* linear
+_RE_FUNC_NAME = re.compile(r'func\s+(?:\([^)]*\)\s+)?(\w+)')
+_RE_SINGLE_IMPORT = re.compile(r'^import\s+"[^"]+"$')
+
+# rule_id -> (severity, message, suggestion, auto_fixable)
+_RULES = {
+    "FMT_001": (LintSeverity.LOW, "Trailing whitespace detected",
+                "Remove trailing spaces and tabs", True),
+    "FMT_002": (LintSeverity.MEDIUM, "Mixed tabs and spaces for indentation",
+                "Use consistent indentation (Go standard is tabs)", False),
+    "FMT_003": (LintSeverity.LOW, "Duplicate consecutive comment detected",
+                "Remove duplicate comment line", True),
+    "FMT_004": (LintSeverity.LOW, "Function comment should start with function name '{func_name}'",
+                "Start comment with '{func_name} ...'", False),
+    "FMT_005": (LintSeverity.LOW, "Use Go import alias syntax (import alias \"package\")",
+                "Use: import alias \"package\" instead of import \"package\" as alias", False),
+    "FMT_006": (LintSeverity.LOW, "Line too long ({line_length} characters)",
+                "Break long lines for better readability", False),
+    "FMT_007": (LintSeverity.LOW, "Multiple consecutive blank lines ({blank_line_count})",
+                "Use at most 2 consecutive blank lines", True),
+    "FMT_008": (LintSeverity.LOW, "File should end with newline",
+                "Add newline at end of file", True),
+    "FMT_009": (LintSeverity.LOW, "Multiple single imports ({count}) should use import block",
+                "Group imports in import ( ... ) block", False),
+}
 
 
 class FormatLinter(GoLinter):
     """Linter for Go code formatting and style issues"""
     
+    rules = _RULES
+    
     def __init__(self):
         super().__init__("format")
     
@@ -24,121 +55,91 @@ class FormatLinter(GoLinter):
             with open(file_path, 'r', encoding='utf-8') as f:
                 lines = f.readlines()
             
-            for line_num, line in enumerate(lines, 1):
-                issues.extend(self._check_whitespace_issues(file_path, line_num, line))
-                issues.extend(self._check_comment_issues(file_path, line_num, line, lines))
-                issues.extend(self._check_import_issues(file_path, line_num, line))
-                issues.extend(self._check_line_length(file_path, line_num, line))
+            infos = [LineInfo(line) for line in lines]
+            
+            # Pair each line with its successor (None after the last line)
+            next_infos = infos[1:] + [None]
+            
+            for line_num, (info, next_info) in enumerate(zip(infos, next_infos), 1):
+                issues.extend(self._check_whitespace_issues(file_path, line_num, info))
+                issues.extend(self._check_comment_issues(file_path, line_num, info, next_info))
+                issues.extend(self._check_import_issues(file_path, line_num, info))
+                issues.extend(self._check_line_length(file_path, line_num, info.raw))
             
             # Check file-level issues
-            issues.extend(self._check_file_level_issues(file_path, lines))
+            issues.extend(self._check_file_level_issues(file_path, infos))
             
-        except Exception as e:
-            print(f"Error reading {file_path}: {e}")
+        except (OSError, ValueError) as e:
+            logger.warning("Error reading %s: %s", file_path, e,
+                           exc_info=logger.isEnabledFor(logging.DEBUG))
         
         return issues
     
-    def _check_whitespace_issues(self, file_path: Path, line_num: int, line: str) -> List[LintIssue]:
+    def _check_whitespace_issues(self, file_path: Path, line_num: int, info: LineInfo) -> List[LintIssue]:
         """Check for whitespace-related issues"""
         issues = []
+        line = info.raw
         
         # Trailing whitespace
         if line.rstrip() != line.rstrip('\n'):
-            issues.append(self._create_issue(
-                file_path=file_path,
-                line_number=line_num,
-                severity=LintSeverity.LOW,
-                rule_id="FMT_001",
-                message="Trailing whitespace detected",
-                suggestion="Remove trailing spaces and tabs",
-                auto_fixable=True
-            ))
+            self._emit(issues, "FMT_001", file_path, line_num)
         
         # Mixed tabs and spaces for indentation
         if '\t' in line and line.lstrip() != line.lstrip(' '):
             if line.startswith(' ') and '\t' in line[:len(line) - len(line.lstrip())]:
-                issues.append(self._create_issue(
-                    file_path=file_path,
-                    line_number=line_num,
-                    severity=LintSeverity.MEDIUM,
-                    rule_id="FMT_002",
-                    message="Mixed tabs and spaces for indentation",
-                    suggestion="Use consistent indentation (Go standard is tabs)"
-                ))
+                self._emit(issues, "FMT_002", file_path, line_num)
         
         # Multiple consecutive blank lines
-        if line.strip() == '' and line_num > 1:
+        if info.is_blank and line_num > 1:
             # We'll check this in file-level issues to avoid duplicate reports
             pass
         
         return issues
     
-    def _check_comment_issues(self, file_path: Path, line_num: int, line: str, all_lines: List[str]) -> List[LintIssue]:
+    def _check_comment_issues(self, file_path: Path, line_num: int, info: LineInfo,
+                              next_info: Optional[LineInfo]) -> List[LintIssue]:
         """Check for comment-related issues"""
         issues = []
         
+        if not info.is_comment or next_info is None:
+            return issues
+        
         # Duplicate consecutive comments
-        if line.strip().startswith('//'):
-            comment_text = line.strip()[2:].strip()
-            
-            # Check if next line has the same comment
-            if line_num < len(all_lines):
-                next_line = all_lines[line_num].strip()
-                if next_line.startswith('//'):
-                    next_comment = next_line[2:].strip()
-                    if comment_text == next_comment and comment_text:
-                        issues.append(self._create_issue(
-                            file_path=file_path,
-                            line_number=line_num,
-                            severity=LintSeverity.LOW,
-                            rule_id="FMT_003",
-                            message="Duplicate consecutive comment detected",
-                            suggestion="Remove duplicate comment line",
-                            auto_fixable=True
-                        ))
+        comment_text = info.stripped[2:].strip()
+        
+        # Check if next line has the same comment
+        if next_info.is_comment:
+            next_comment = next_info.stripped[2:].strip()
+            if comment_text == next_comment and comment_text:
+                self._emit(issues, "FMT_003", file_path, line_num)
         
         # Function comments that don't start with function name
-        if line.strip().startswith('// ') and line_num < len(all_lines):
-            next_line = all_lines[line_num].strip()
-            if next_line.startswith('func '):
-                # Extract function name
-                func_match = re.search(r'func\s+(?:\([^)]*\)\s+)?(\w+)', next_line)
-                if func_match:
-                    func_name = func_match.group(1)
-                    comment_text = line.strip()[3:]  # Remove '// '
-                    
-                    if not comment_text.startswith(func_name):
-                        issues.append(self._create_issue(
-                            file_path=file_path,
-                            line_number=line_num,
-                            severity=LintSeverity.LOW,
-                            rule_id="FMT_004",
-                            message=f"Function comment should start with function name '{func_name}'",
-                            suggestion=f"Start comment with '{func_name} ...'"
-                        ))
+        if info.stripped.startswith('// ') and next_info.starts_func:
+            # Extract function name
+            func_match = _RE_FUNC_NAME.match(next_info.stripped)
+            if func_match:
+                func_name = func_match.group(1)
+                comment_text = info.stripped[3:]  # Remove '// '
+                
+                if not comment_text.startswith(func_name):
+                    self._emit(issues, "FMT_004", file_path, line_num, func_name=func_name)
         
         return issues
     
-    def _check_import_issues(self, file_path: Path, line_num: int, line: str) -> List[LintIssue]:
+    def _check_import_issues(self, file_path: Path, line_num: int, info: LineInfo) -> List[LintIssue]:
         """Check for import-related formatting issues"""
         issues = []
+        line = info.raw
         
         # Single import that should be in import block
-        if re.match(r'^import\s+"[^"]+"$', line.strip()):
+        if info.is_import and _RE_SINGLE_IMPORT.match(info.stripped):
             # This is a single import - suggest using import block for multiple imports
             # We'll only flag this if there are multiple single imports (check in file-level)
             pass
         
         # Import alias issues
         if 'import' in line and ' as ' in line:
-            issues.append(self._create_issue(
-                file_path=file_path,
-                line_number=line_num,
-                severity=LintSeverity.LOW,
-                rule_id="FMT_005",
-                message="Use Go import alias syntax (import alias \"package\")",
-                suggestion="Use: import alias \"package\" instead of import \"package\" as alias"
-            ))
+            self._emit(issues, "FMT_005", file_path, line_num)
         
         return issues
     
@@ -147,101 +148,71 @@ class FormatLinter(GoLinter):
         issues = []
         
         # Check line length (Go doesn't have strict limit, but 120 is reasonable)
+        # Most lines are short - skip the rstrip copy and exclusion scan for them
+        if len(line) <= 120:
+            return issues
+        
         line_length = len(line.rstrip('\n'))
         if line_length > 120:
             # Ignore certain cases
             if not any(pattern in line for pattern in ['http://', 'https://', '"', '`']):
-                issues.append(self._create_issue(
-                    file_path=file_path,
-                    line_number=line_num,
-                    severity=LintSeverity.LOW,
-                    rule_id="FMT_006",
-                    message=f"Line too long ({line_length} characters)",
-                    suggestion="Break long lines for better readability"
-                ))
+                self._emit(issues, "FMT_006", file_path, line_num, line_length=line_length)
         
         return issues
     
-    def _check_file_level_issues(self, file_path: Path, lines: List[str]) -> List[LintIssue]:
+    def _check_file_level_issues(self, file_path: Path, lines: List[LineInfo]) -> List[LintIssue]:
         """Check for file-level formatting issues"""
         issues = []
         
         # Multiple consecutive blank lines
         blank_line_count = 0
-        for line_num, line in enumerate(lines, 1):
-            if line.strip() == '':
+        for line_num, info in enumerate(lines, 1):
+            if info.is_blank:
                 blank_line_count += 1
             else:
                 if blank_line_count > 2:
-                    issues.append(self._create_issue(
-                        file_path=file_path,
-                        line_number=line_num - blank_line_count,
-                        severity=LintSeverity.LOW,
-                        rule_id="FMT_007",
-                        message=f"Multiple consecutive blank lines ({blank_line_count})",
-                        suggestion="Use at most 2 consecutive blank lines",
-                        auto_fixable=True
-                    ))
+                    self._emit(issues, "FMT_007", file_path, line_num - blank_line_count,
+                               blank_line_count=blank_line_count)
                 blank_line_count = 0
         
         # File should end with newline
-        if lines and not lines[-1].endswith('\n'):
-            issues.append(self._create_issue(
-                file_path=file_path,
-                line_number=len(lines),
-                severity=LintSeverity.LOW,
-                rule_id="FMT_008",
-                message="File should end with newline",
-                suggestion="Add newline at end of file",
-                auto_fixable=True
-            ))
+        if lines and not lines[-1].raw.endswith('\n'):
+            self._emit(issues, "FMT_008", file_path, len(lines))
         
         # Multiple single imports that could be grouped
         single_imports = []
-        for line_num, line in enumerate(lines, 1):
-            if re.match(r'^import\s+"[^"]+"$', line.strip()):
+        for line_num, info in enumerate(lines, 1):
+            if info.is_import and _RE_SINGLE_IMPORT.match(info.stripped):
                 single_imports.append(line_num)
         
         if len(single_imports) > 2:
-            issues.append(self._create_issue(
-                file_path=file_path,
-                line_number=single_imports[0],
-                severity=LintSeverity.LOW,
-                rule_id="FMT_009",
-                message=f"Multiple single imports ({len(single_imports)}) should use import block",
-                suggestion="Group imports in import ( ... ) block"
-            ))
+            self._emit(issues, "FMT_009", file_path, single_imports[0], count=len(single_imports))
         
         return issues
     
     def _fix_issue(self, issue: LintIssue) -> bool:
-        """Auto-fix formatting issues"""
+        """Auto-fix a single formatting issue"""
+        return self._fix_issues_for_file(issue.file_path, [issue]) > 0
+    
+    def _fix_issues_for_file(self, file_path: Path, issues: List[LintIssue]) -> int:
+        """Auto-fix all formatting issues in one file with a single read and write"""
+        fixed_count = 0
+        
         try:
-            with open(issue.file_path, 'r', encoding='utf-8') as f:
+            with open(file_path, 'r', encoding='utf-8') as f:
                 lines = f.readlines()
             
-            modified = False
-            
-            if issue.rule_id == "FMT_001":  # Trailing whitespace
-                if issue.line_number <= len(lines):
-                    line = lines[issue.line_number - 1]
-                    stripped = line.rstrip() + '\n' if line.endswith('\n') else line.rstrip()
-                    if line != stripped:
-                        lines[issue.line_number - 1] = stripped
-                        modified = True
+            collapse_blank_lines = False
             
-            elif issue.rule_id == "FMT_003":  # Duplicate comments
-                if issue.line_number <= len(lines) and issue.line_number < len(lines):
-                    current_line = lines[issue.line_number - 1].strip()
-                    next_line = lines[issue.line_number].strip()
-                    
-                    if (current_line.startswith('//') and next_line.startswith('//') and
-                        current_line[2:].strip() == next_line[2:].strip()):
-                        # Remove the duplicate line
-                        lines.pop(issue.line_number - 1)
-                        modified = True
+            # Work bottom-up so removing a line never shifts lines still to be fixed
+            for issue in sorted(issues, key=lambda i: i.line_number, reverse=True):
+                if issue.rule_id == "FMT_007":
+                    # Rewrites the whole file, so apply after the line-level fixes
+                    collapse_blank_lines = True
+                elif self._fix_line_issue(lines, issue):
+                    fixed_count += 1
             
-            elif issue.rule_id == "FMT_007":  # Multiple consecutive blank lines
+            if collapse_blank_lines:  # Multiple consecutive blank lines
                 # Find and remove excess blank lines
                 new_lines = []
                 blank_count = 0
@@ -257,19 +228,41 @@ class FormatLinter(GoLinter):
                 
                 if new_lines != lines:
                     lines = new_lines
-                    modified = True
+                    fixed_count += 1
             
-            elif issue.rule_id == "FMT_008":  # File should end with newline
-                if lines and not lines[-1].endswith('\n'):
-                    lines[-1] += '\n'
-                    modified = True
-            
-            if modified:
-                with open(issue.file_path, 'w', encoding='utf-8') as f:
+            if fixed_count:
+                with open(file_path, 'w', encoding='utf-8') as f:
                     f.writelines(lines)
-                return True
                 
         except Exception:
-            pass
+            return 0
+        
+        return fixed_count
+    
+    def _fix_line_issue(self, lines: List[str], issue: LintIssue) -> bool:
+        """Apply a line-level formatting fix to the in-memory lines"""
+        if issue.rule_id == "FMT_001":  # Trailing whitespace
+            if issue.line_number <= len(lines):
+                line = lines[issue.line_number - 1]
+                stripped = line.rstrip() + '\n' if line.endswith('\n') else line.rstrip()
+                if line != stripped:
+                    lines[issue.line_number - 1] = stripped
+                    return True
+        
+        elif issue.rule_id == "FMT_003":  # Duplicate comments
+            if issue.line_number < len(lines):
+                current_line = lines[issue.line_number - 1].strip()
+                next_line = lines[issue.line_number].strip()
+                
+                if (current_line.startswith('//') and next_line.startswith('//') and
+                    current_line[2:].strip() == next_line[2:].strip()):
+                    # Remove the duplicate line
+                    lines.pop(issue.line_number - 1)
+                    return True
+        
+        elif issue.rule_id == "FMT_008":  # File should end with newline
+            if lines and not lines[-1].endswith('\n'):
+                lines[-1] += '\n'
+                return True
         
-        return False
\ No newline at end of file
+        return False
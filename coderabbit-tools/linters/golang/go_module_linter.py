@@ -3,31 +3,331 @@ Go module and dependency linter
 Catches issues like indirect dependencies marked incorrectly, outdated versions
 """
 
+import codecs
+import hashlib
+import http.client
+import json
+import logging
+import mmap
+import os
+import queue
 import re
+import shutil
 import subprocess
+import threading
+import time
+import urllib.parse
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Set
+from typing import Dict, FrozenSet, Iterable, List, Optional, Set, Tuple
 
-from ..base_linter import GoLinter, LintIssue, LintSeverity
+from ..base_linter import (GoLinter, LintIssue, LintSeverity,
+                           is_generated_header, iter_go_files)
+
+logger = logging.getLogger(__name__)
+
+_IMPORT_BLOCK_RE = re.compile(rb'import\s*\(\s*\n(.*?)\n\s*\)', re.DOTALL)
+_SINGLE_IMPORT_RE = re.compile(rb'import\s+"([^"]+)"')
+_QUOTED_RE = re.compile(rb'"([^"]+)"')
+_UPPER_RE = re.compile(r'[A-Z]')
+_REQUIRE_PREFIX_RE = re.compile(r'^require\s+')
+_GOPROXY_SEP_RE = re.compile(r'[,|]')
+
+DEFAULT_GOPROXY = "https://proxy.golang.org"
+PROXY_MAX_WORKERS = 32
+PROXY_TIMEOUT = 10
+# Overall deadline for all lookups of one project, and a cap on each @latest response
+PROXY_BUDGET = 30
+PROXY_MAX_RESPONSE_BYTES = 64 * 1024
+GO_ENV_TIMEOUT = 10
+
+# Settings that decide whether and where modules are looked up
+_GO_ENV_VARS = ('GOPROXY', 'GOPRIVATE', 'GONOPROXY')
+
+# How much of each Go file is peeked at to reject binary and generated files
+SNIFF_BYTES = 4096
+
+# Serializes project analysis so concurrent lint()/lint_file() calls compute it once
+_ANALYSIS_LOCK = threading.Lock()
+
+
+def _looks_like_text(head: bytes) -> bool:
+    """Whether the leading bytes of a file are NUL-free UTF-8 (a cut-off last character is fine)"""
+    if b'\0' in head:
+        return False
+    try:
+        codecs.getincrementaldecoder('utf-8')().decode(head, final=False)
+    except UnicodeDecodeError:
+        return False
+    return True
+
+
+def _scan_file_imports(go_file: Path) -> Set[str]:
+    """Extract the import paths declared in a single Go file, ignoring generated files"""
+    imports = set()
+    
+    try:
+        with open(go_file, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return imports
+            
+            # Binary junk and generated files are decided by the header alone -
+            # peek at the buffer and bail before mapping the file
+            head = f.peek(SNIFF_BYTES)[:SNIFF_BYTES]
+            if not _looks_like_text(head) or is_generated_header(head):
+                return imports
+            
+            # Scan the mapped bytes directly; only matched paths are decoded
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                # Process import blocks
+                for block in _IMPORT_BLOCK_RE.findall(content):
+                    for line in block.split(b'\n'):
+                        line = line.strip()
+                        if line and not line.startswith(b'//'):
+                            # Extract quoted import path
+                            match = _QUOTED_RE.search(line)
+                            if match:
+                                imports.add(match.group(1).decode('utf-8', 'replace'))
+                
+                # Process single imports
+                imports.update(path.decode('utf-8', 'replace')
+                               for path in _SINGLE_IMPORT_RE.findall(content))
+    except Exception:
+        return set()
+    
+    return imports
+
+
+def _import_prefixes(imports: Set[str]) -> FrozenSet[str]:
+    """Every import path plus each of its leading path-element prefixes"""
+    prefixes = set()
+    for imp in imports:
+        parts = imp.split('/')
+        for i in range(1, len(parts) + 1):
+            prefixes.add('/'.join(parts[:i]))
+    return frozenset(prefixes)
+
+
+def _stat_key(path: Path) -> Tuple[int, int]:
+    """(mtime_ns, size) of a file, or (0, 0) if it does not exist"""
+    try:
+        st = path.stat()
+    except OSError:
+        return (0, 0)
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _go_files_fingerprint(go_files: Iterable[Path]) -> str:
+    """Cheap digest of the paths, mtimes and sizes of a project's Go files"""
+    digest = hashlib.blake2b(digest_size=16)
+    for go_file in go_files:
+        mtime_ns, size = _stat_key(go_file)
+        digest.update(f"{go_file}\0{mtime_ns}\0{size}\n".encode('utf-8', 'surrogateescape'))
+    return digest.hexdigest()
+
+
+def _go_env() -> Dict[str, str]:
+    """GOPROXY, GOPRIVATE and GONOPROXY as the go command sees them"""
+    # Keyed on the environment, which overrides the 'go env -w' config file
+    return _cached_go_env(tuple(os.environ.get(name) for name in _GO_ENV_VARS + ('GOENV',)))
+
+
+@lru_cache(maxsize=8)
+def _cached_go_env(environ: tuple) -> Dict[str, str]:
+    env = {name: value or '' for name, value in zip(_GO_ENV_VARS, environ)}
+    go = shutil.which('go')
+    if go is None:
+        return env
+    try:
+        result = subprocess.run([go, 'env', '-json', *_GO_ENV_VARS], capture_output=True,
+                                timeout=GO_ENV_TIMEOUT, check=True)
+        env.update(json.loads(result.stdout))
+    except (OSError, subprocess.SubprocessError, ValueError):
+        pass
+    return env
+
+
+def _goproxy_url(goproxy: str) -> Optional[str]:
+    """First HTTP(S) proxy from a GOPROXY list, or None if module lookups are disabled"""
+    for entry in _GOPROXY_SEP_RE.split(goproxy or DEFAULT_GOPROXY):
+        entry = entry.strip()
+        if entry in ('off', 'direct'):
+            return None
+        if entry.startswith(('https://', 'http://')):
+            return entry.rstrip('/')
+    return None
+
+
+def _matches_module_patterns(patterns: str, module: str) -> bool:
+    """Whether a module path matches a GOPRIVATE-style list of glob patterns
+    
+    As with the go command, a pattern matches any module path whose leading
+    path elements it matches.
+    """
+    parts = module.split('/')
+    for pattern in patterns.split(','):
+        pattern = pattern.strip().rstrip('/')
+        if not pattern:
+            continue
+        elements = pattern.count('/') + 1
+        if len(parts) >= elements and fnmatchcase('/'.join(parts[:elements]), pattern):
+            return True
+    return False
+
+
+def _escape_module_path(module: str) -> str:
+    """Case-encode a module path for the proxy protocol (uppercase -> '!' + lowercase)"""
+    return _UPPER_RE.sub(lambda m: '!' + m.group(0).lower(), module)
+
+
+def _version_key(version: str) -> tuple:
+    """Sort key for a semantic version; a prerelease sorts before its release"""
+    core, _, prerelease = version.lstrip('v').split('+')[0].partition('-')
+    numbers = tuple(int(part) if part.isdigit() else 0 for part in core.split('.'))
+    return numbers, not prerelease, prerelease
+
+
+def _fetch_latest_version(proxy: str, module: str) -> Optional[str]:
+    """Ask the module proxy for the latest version of a module"""
+    url = f"{proxy}/{urllib.parse.quote(_escape_module_path(module))}/@latest"
+    try:
+        with urllib.request.urlopen(url, timeout=PROXY_TIMEOUT) as response:
+            # @latest is a tiny JSON object - never buffer more than the cap
+            body = response.read(PROXY_MAX_RESPONSE_BYTES + 1)
+    except (OSError, ValueError, http.client.HTTPException):
+        return None
+    if len(body) > PROXY_MAX_RESPONSE_BYTES:
+        return None
+    try:
+        return json.loads(body).get('Version')
+    except (ValueError, AttributeError):
+        return None
+
+
+def _fetch_latest_versions_within_budget(proxy: str, modules: List[str]) -> Dict[str, Optional[str]]:
+    """Look up modules concurrently, returning whatever finished within PROXY_BUDGET
+    
+    The workers are daemon threads that take no new lookups once the budget is
+    spent; requests still in flight then are abandoned rather than waited
+    for, here or at interpreter exit.
+    """
+    deadline = time.monotonic() + PROXY_BUDGET
+    pending = queue.SimpleQueue()
+    for module in modules:
+        pending.put(module)
+    results: Dict[str, Optional[str]] = {}
+    
+    def work() -> None:
+        while time.monotonic() < deadline:
+            try:
+                module = pending.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                results[module] = _fetch_latest_version(proxy, module)
+            except Exception as e:
+                logger.warning("Error looking up %s: %s", module, e,
+                               exc_info=logger.isEnabledFor(logging.DEBUG))
+    
+    workers = [threading.Thread(target=work, daemon=True)
+               for _ in range(min(PROXY_MAX_WORKERS, len(modules)))]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join(max(0.0, deadline - time.monotonic()))
+    
+    return dict(results)
+
+
+@dataclass(frozen=True)
+class ProjectAnalysis:
+    """Everything GoModuleLinter derives from a project's go.mod and Go sources"""
+    direct_imports: FrozenSet[str]
+    import_prefixes: FrozenSet[str]
+    indirect_deps: Dict[str, str]
+    direct_deps: Dict[str, str]
+    dep_lines: Dict[str, int]
+    outdated: Dict[str, Tuple[str, str]]
 
 
 class GoModuleLinter(GoLinter):
     """Linter for go.mod files and dependency management"""
     
-    def __init__(self):
+    def __init__(self, offline: bool = False):
         super().__init__("go_module")
         self.file_patterns = ["go.mod", "*.go"]
+        # Skip module proxy lookups for outdated dependencies (also implied by GOPROXY=off)
+        self.offline = offline
+        # module -> latest version known to the proxy (None if the lookup failed),
+        # shared by every project linted by this instance
+        self.latest_versions: Dict[str, Optional[str]] = {}
+        # resolved project path -> (cache key, result); an entry is replaced when its
+        # key changes, and both are only touched while holding _ANALYSIS_LOCK
+        self._analyses: Dict[str, Tuple[tuple, ProjectAnalysis]] = {}
+        self._outdated: Dict[str, Tuple[tuple, Dict[str, Tuple[str, str]]]] = {}
     
     def lint(self, project_path: Path) -> List[LintIssue]:
-        """Lint go.mod and detect dependency issues"""
+        """Lint go.mod (or every module of a go.work workspace) and detect dependency issues"""
         issues = []
         
-        go_mod_path = project_path / "go.mod"
-        if go_mod_path.exists():
-            issues.extend(self._lint_go_mod(go_mod_path, project_path))
+        module_dirs = self._workspace_modules(project_path)
+        if len(module_dirs) > 1:
+            # One batch of proxy lookups for the whole workspace
+            self.preload_latest_versions(module_dirs)
+        
+        for module_dir in module_dirs:
+            go_mod_path = module_dir / "go.mod"
+            if go_mod_path.exists():
+                issues.extend(self._lint_go_mod(go_mod_path, module_dir))
         
         return issues
     
+    def preload_latest_versions(self, project_paths: Iterable[Path]) -> None:
+        """Look up the latest versions of all requirements of several projects in one batch"""
+        if self.offline:
+            return
+        
+        modules = set()
+        for project_path in project_paths:
+            try:
+                with open(Path(project_path) / "go.mod", 'r', encoding='utf-8') as f:
+                    indirect_deps, direct_deps, _ = self._parse_go_mod_dependencies(f)
+            except (OSError, UnicodeDecodeError):
+                continue
+            modules.update(indirect_deps)
+            modules.update(direct_deps)
+        
+        self._fetch_latest_versions(sorted(modules))
+    
+    def _workspace_modules(self, project_path: Path) -> List[Path]:
+        """Module directories listed by go.work 'use' directives, or just the project itself"""
+        go_work_path = project_path / "go.work"
+        if not go_work_path.exists():
+            return [project_path]
+        
+        module_dirs = []
+        in_use_block = False
+        try:
+            with open(go_work_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    line = line.split('//', 1)[0].strip()
+                    if line.startswith('use ('):
+                        in_use_block = True
+                    elif line == ')' and in_use_block:
+                        in_use_block = False
+                    elif line.startswith('use ') and not in_use_block:
+                        module_dirs.append(project_path / line[4:].strip().strip('"'))
+                    elif in_use_block and line:
+                        module_dirs.append(project_path / line.strip('"'))
+        except (OSError, UnicodeDecodeError):
+            return [project_path]
+        
+        return module_dirs or [project_path]
+    
     def lint_file(self, file_path: Path) -> List[LintIssue]:
         """Lint individual Go files for import usage"""
         if file_path.name == "go.mod":
@@ -43,22 +343,14 @@ class GoModuleLinter(GoLinter):
         issues = []
         
         try:
-            with open(go_mod_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                lines = content.splitlines()
-            
-            # Get direct imports from Go files
-            direct_imports = self._get_direct_imports(project_path)
-            
-            # Parse go.mod dependencies
-            indirect_deps, direct_deps = self._parse_go_mod_dependencies(lines)
+            analysis = self._analyze_project(project_path)
             
             # Check for incorrectly marked indirect dependencies
-            for line_num, (dep, version) in enumerate(indirect_deps.items(), 1):
-                if self._is_direct_dependency(dep, direct_imports):
+            for dep in analysis.indirect_deps:
+                if self._is_direct_dependency(dep, analysis.import_prefixes):
                     issues.append(self._create_issue(
                         file_path=go_mod_path,
-                        line_number=self._find_dependency_line(lines, dep),
+                        line_number=analysis.dep_lines.get(dep, 1),
                         severity=LintSeverity.MEDIUM,
                         rule_id="GO_MOD_001",
                         message=f"Dependency '{dep}' is marked as indirect but is directly imported",
@@ -66,12 +358,11 @@ class GoModuleLinter(GoLinter):
                         auto_fixable=True
                     ))
             
-            # Check for outdated dependencies (if go list works)
-            outdated_deps = self._check_outdated_dependencies(project_path)
-            for dep, (current, latest) in outdated_deps.items():
+            # Check for outdated dependencies (if the module proxy is reachable)
+            for dep, (current, latest) in analysis.outdated.items():
                 issues.append(self._create_issue(
                     file_path=go_mod_path,
-                    line_number=self._find_dependency_line(lines, dep),
+                    line_number=analysis.dep_lines.get(dep, 1),
                     severity=LintSeverity.LOW,
                     rule_id="GO_MOD_002",
                     message=f"Dependency '{dep}' is outdated: {current} -> {latest}",
@@ -79,52 +370,99 @@ class GoModuleLinter(GoLinter):
                 ))
                 
         except Exception as e:
-            print(f"Error linting {go_mod_path}: {e}")
+            logger.warning("Error linting %s: %s", go_mod_path, e,
+                           exc_info=logger.isEnabledFor(logging.DEBUG))
         
         return issues
     
-    def _get_direct_imports(self, project_path: Path) -> Set[str]:
-        """Get all direct imports from Go files in the project"""
+    def clear_cache(self) -> None:
+        """Forget memoized project analyses and outdated-dependency results"""
+        super().clear_cache()
+        with _ANALYSIS_LOCK:
+            self._analyses.clear()
+            self._outdated.clear()
+    
+    def _project_key(self, project_path: Path) -> tuple:
+        """Cache key that changes whenever go.mod or go.sum changes"""
+        project_path = project_path.resolve()
+        return (str(project_path),
+                _stat_key(project_path / "go.mod"),
+                _stat_key(project_path / "go.sum"))
+    
+    def _analyze_project(self, project_path: Path) -> ProjectAnalysis:
+        """Memoized project analysis, invalidated when go.mod, go.sum or any Go file changes"""
+        project_path = project_path.resolve()
+        # The fingerprint and the import scan share one fresh walk, so an added or
+        # removed file always shows up in both. GoLinter's generated-name filter is
+        # not applied: a file like wire_generated.go still needs its requirements.
+        go_files = list(iter_go_files(project_path))
+        key = self._project_key(project_path) + (_go_files_fingerprint(go_files),)
+        with _ANALYSIS_LOCK:
+            cached = self._analyses.get(key[0])
+            if cached is None or cached[0] != key:
+                cached = (key, self._build_analysis(project_path, go_files))
+                self._analyses[key[0]] = cached
+            return cached[1]
+    
+    def _build_analysis(self, project_path: Path, go_files: List[Path]) -> ProjectAnalysis:
+        """Analyze go.mod and the Go sources of a project from scratch"""
+        # Parse go.mod dependencies, streaming lines straight from the file
+        with open(project_path / "go.mod", 'r', encoding='utf-8') as f:
+            indirect_deps, direct_deps, dep_lines = self._parse_go_mod_dependencies(f)
+        
+        # Get direct imports from Go files, indexed by path prefix
+        direct_imports = frozenset(self._get_direct_imports(go_files))
+        
+        return ProjectAnalysis(
+            direct_imports=direct_imports,
+            import_prefixes=_import_prefixes(direct_imports),
+            indirect_deps=indirect_deps,
+            direct_deps=direct_deps,
+            dep_lines=dep_lines,
+            outdated=self._outdated_dependencies(project_path, {**direct_deps, **indirect_deps}),
+        )
+    
+    def _outdated_dependencies(self, project_path: Path, dependencies: Dict[str, str]) -> dict:
+        """Memoized _check_outdated_dependencies, invalidated when go.mod/go.sum change
+        
+        Only called from _build_analysis, with _ANALYSIS_LOCK held.
+        """
+        if self.offline:
+            return {}
+        key = self._project_key(project_path) + (tuple(sorted(dependencies.items())),)
+        try:
+            cached = self._outdated.get(key[0])
+            if cached is None or cached[0] != key:
+                cached = (key, self._check_outdated_dependencies(dependencies))
+                self._outdated[key[0]] = cached
+            return dict(cached[1])
+        except Exception as e:
+            # A failed lookup must not take the go.mod checks that need no network with it
+            logger.warning("Error checking %s for outdated dependencies: %s", project_path, e,
+                           exc_info=logger.isEnabledFor(logging.DEBUG))
+            return {}
+    
+    def _get_direct_imports(self, go_files: List[Path]) -> Set[str]:
+        """Get all direct imports from a project's Go files"""
         imports = set()
         
-        for go_file in project_path.rglob("*.go"):
-            if self._should_skip_file(go_file) or self._is_generated_file(go_file):
-                continue
-                
-            try:
-                with open(go_file, 'r', encoding='utf-8') as f:
-                    content = f.read()
-                
-                # Extract imports using regex
-                import_blocks = re.findall(r'import\s*\(\s*\n(.*?)\n\s*\)', content, re.DOTALL)
-                single_imports = re.findall(r'import\s+"([^"]+)"', content)
-                
-                # Process import blocks
-                for block in import_blocks:
-                    for line in block.split('\n'):
-                        line = line.strip()
-                        if line and not line.startswith('//'):
-                            # Extract quoted import path
-                            match = re.search(r'"([^"]+)"', line)
-                            if match:
-                                imports.add(match.group(1))
-                
-                # Process single imports
-                imports.update(single_imports)
-                
-            except Exception:
-                continue
+        # Reading and scanning files is independent per file, so fan it out
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as executor:
+            for file_imports in executor.map(_scan_file_imports, go_files):
+                imports.update(file_imports)
         
         return imports
     
-    def _parse_go_mod_dependencies(self, lines: List[str]) -> tuple:
-        """Parse go.mod to extract direct and indirect dependencies"""
+    def _parse_go_mod_dependencies(self, lines: Iterable[str]) -> tuple:
+        """Parse go.mod to extract direct and indirect dependencies and their line numbers"""
         indirect_deps = {}
         direct_deps = {}
+        dep_lines = {}
         in_require_block = False
         
-        for line in lines:
+        for line_num, line in enumerate(lines, 1):
             line = line.strip()
+            module = None
             
             if line.startswith('require ('):
                 in_require_block = True
@@ -134,17 +472,20 @@ class GoModuleLinter(GoLinter):
                 continue
             elif line.startswith('require ') and not in_require_block:
                 # Single require line
-                self._parse_require_line(line, direct_deps, indirect_deps)
+                module = self._parse_require_line(line, direct_deps, indirect_deps)
             elif in_require_block and line and not line.startswith('//'):
                 # Line within require block
-                self._parse_require_line(line, direct_deps, indirect_deps)
+                module = self._parse_require_line(line, direct_deps, indirect_deps)
+            
+            if module and module not in dep_lines:
+                dep_lines[module] = line_num
         
-        return indirect_deps, direct_deps
+        return indirect_deps, direct_deps, dep_lines
     
-    def _parse_require_line(self, line: str, direct_deps: dict, indirect_deps: dict):
-        """Parse a single require line"""
+    def _parse_require_line(self, line: str, direct_deps: dict, indirect_deps: dict) -> Optional[str]:
+        """Parse a single require line, returning the module it declares"""
         # Remove 'require ' prefix if present
-        line = re.sub(r'^require\s+', '', line)
+        line = _REQUIRE_PREFIX_RE.sub('', line)
         
         # Parse: module version [// indirect]
         parts = line.split()
@@ -157,59 +498,51 @@ class GoModuleLinter(GoLinter):
                 indirect_deps[module] = version
             else:
                 direct_deps[module] = version
-    
-    def _is_direct_dependency(self, dep: str, direct_imports: Set[str]) -> bool:
-        """Check if a dependency is directly imported"""
-        # Check exact match
-        if dep in direct_imports:
-            return True
-        
-        # Check if any import starts with this dependency path
-        for imp in direct_imports:
-            if imp.startswith(dep + '/'):
-                return True
+            return module
         
-        return False
+        return None
     
-    def _find_dependency_line(self, lines: List[str], dep: str) -> int:
-        """Find the line number where a dependency is declared"""
-        for i, line in enumerate(lines, 1):
-            if dep in line and ('require' in line or not line.strip().startswith('//')):
-                return i
-        return 1
+    def _is_direct_dependency(self, dep: str, import_prefixes: FrozenSet[str]) -> bool:
+        """Check if a dependency is directly imported (exactly or as a path prefix)"""
+        return dep in import_prefixes
     
-    def _check_outdated_dependencies(self, project_path: Path) -> dict:
-        """Check for outdated dependencies using go list"""
+    def _check_outdated_dependencies(self, dependencies: Dict[str, str]) -> dict:
+        """Check for outdated dependencies against the module proxy"""
         outdated = {}
         
-        try:
-            # Get current dependencies
-            result = subprocess.run(
-                ['go', 'list', '-m', '-u', 'all'],
-                capture_output=True,
-                text=True,
-                cwd=project_path,
-                timeout=30
-            )
-            
-            if result.returncode == 0:
-                for line in result.stdout.splitlines():
-                    parts = line.split()
-                    if len(parts) >= 3 and '[' in parts[2]:
-                        module = parts[0]
-                        current = parts[1]
-                        # Extract latest version from [v1.2.3]
-                        latest_match = re.search(r'\[([^\]]+)\]', parts[2])
-                        if latest_match:
-                            latest = latest_match.group(1)
-                            outdated[module] = (current, latest)
-                            
-        except (subprocess.SubprocessError, subprocess.TimeoutExpired):
-            # If go list fails, just continue without outdated checks
-            pass
+        latest_versions = self._fetch_latest_versions(list(dependencies))
+        for module, latest in latest_versions.items():
+            current = dependencies[module]
+            if _version_key(latest) > _version_key(current):
+                outdated[module] = (current, latest)
         
         return outdated
     
+    def _fetch_latest_versions(self, modules: List[str]) -> Dict[str, str]:
+        """Look up the latest version of each module concurrently via $GOPROXY
+        
+        Results are remembered in self.latest_versions, so a module required by
+        several projects is only looked up once. Private modules (GOPRIVATE,
+        GONOPROXY) are never sent to the proxy.
+        """
+        env = _go_env()
+        proxy = _goproxy_url(env['GOPROXY'])
+        if proxy is None or not modules:
+            return {}
+        
+        private = ','.join(filter(None, (env['GOPRIVATE'], env['GONOPROXY'])))
+        missing = [module for module in modules if module not in self.latest_versions
+                   and not _matches_module_patterns(private, module)]
+        if missing:
+            results = _fetch_latest_versions_within_budget(proxy, missing)
+            # Lookups that ran out of budget are remembered as failed too, so a
+            # workspace does not retry them for each of its modules
+            for module in missing:
+                self.latest_versions[module] = results.get(module)
+        
+        return {module: self.latest_versions[module] for module in modules
+                if self.latest_versions.get(module)}
+    
     def _fix_issue(self, issue: LintIssue) -> bool:
         """Auto-fix go.mod issues"""
         if issue.rule_id == "GO_MOD_001":  # Remove incorrect // indirect
@@ -3,16 +3,112 @@ Go HTTP client linter
 Catches issues with HTTP client configuration, timeout patterns, and URL handling
 """
 
+import logging
+import mmap
+import os
 import re
+from bisect import bisect_right
+from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import Iterable, Iterator, List, Match, Pattern, Set, Tuple
 
 from ..base_linter import GoLinter, LintIssue, LintSeverity
 
+logger = logging.getLogger(__name__)
+
+# rule_id -> (substring every match must contain, characters a match can start with,
+#             token regex); the substring is a cheap whole-file prescreen
+_TOKENS = {
+    "HTTP_001": (b'http.Client{', b'h', rb'http\.Client\{'),
+    "HTTP_002": (b'imeout', b'Tt', rb'[Tt]imeout\s*:'),
+    "HTTP_003": (b'://', b'h', rb'https?://'),
+    "HTTP_004": (b'url.Parse(', b'u', rb'url\.Parse\('),
+    "HTTP_005": (b'BaseURL', b'B', rb'BaseURL'),
+    "HTTP_006": (b'json.NewDecoder(', b'j', rb'json\.NewDecoder\('),
+    "HTTP_007": (b'ioutil.ReadAll(', b'i', rb'ioutil\.ReadAll\('),
+    "HTTP_008": (b'Error{', b'&', rb'&\w+Error\{'),
+    "HTTP_009": (b'StatusCode', b'S', rb'StatusCode'),
+}
+_RE_TIMEOUT_FIELD = re.compile(r'(Timeout|timeout)\s*:\s*\w+')
+_RE_ERROR_STRUCT_RETURN = re.compile(r'return.*&\w+Error\{')
+_RE_URL_LITERAL = re.compile(rb'["\']https?://[^"\'\n]+["\']')
+_RE_COMMENTED_URL = re.compile(rb'//.*https?://')
+# Lines that open ('const ...') or may close (a lone ')') a const declaration
+_RE_CONST_BOUNDARY = re.compile(rb'^[ \t\r\x0b\x0c]*(?:(const)|\)[ \t\r\x0b\x0c]*$)', re.MULTILINE)
+
+# rule_id -> (severity, message, suggestion, auto_fixable)
+_RULES = {
+    "HTTP_001": (LintSeverity.MEDIUM,
+                 "HTTP client timeout should be controlled via context, not client configuration",
+                 "Remove Timeout field and use context.WithTimeout() for requests", False),
+    "HTTP_002": (LintSeverity.MEDIUM, "Deprecated timeout configuration detected",
+                 "Use context-based timeout control for better request management", False),
+    "HTTP_003": (LintSeverity.MEDIUM, "URL string concatenation detected",
+                 "Use url.Parse() and ResolveReference() for proper URL construction", False),
+    "HTTP_004": (LintSeverity.HIGH, "URL parsing without error handling",
+                 "Always check error return from url.Parse()", False),
+    "HTTP_005": (LintSeverity.HIGH, "BaseURL configuration without validation",
+                 "Validate BaseURL is non-empty and has proper scheme/host", False),
+    "HTTP_006": (LintSeverity.HIGH, "JSON decoding without memory protection",
+                 "Use io.LimitReader to prevent memory exhaustion: "
+                 "json.NewDecoder(io.LimitReader(resp.Body, maxSize))", False),
+    "HTTP_007": (LintSeverity.HIGH, "Reading response body without size limit",
+                 "Use io.LimitReader to prevent memory exhaustion", False),
+    "HTTP_008": (LintSeverity.MEDIUM, "Direct error struct return without sentinel error wrapping",
+                 "Use fmt.Errorf(\"%w: %w\", ErrSentinel, &CustomError{}) for better error handling", False),
+    "HTTP_009": (LintSeverity.MEDIUM, "HTTP status error without proper error wrapping",
+                 "Use %w verb in fmt.Errorf for error wrapping", False),
+    "HTTP_010": (LintSeverity.MEDIUM, "Hardcoded URL {url} should be extracted to a constant",
+                 "Define as const or load from environment variable", False),
+}
+
+
+@lru_cache(maxsize=None)
+def _token_pattern(rule_ids: Tuple[str, ...]) -> Pattern:
+    """Single-pass tokenizer for the given rules
+    
+    One zero-width alternative per rule, so overlapping tokens are all found; the
+    named group that fired tells us which rule to check. The leading character
+    class lets the engine skip positions no token starts at.
+    """
+    first_chars = bytes(sorted({c for rule_id in rule_ids for c in _TOKENS[rule_id][1]}))
+    alternatives = b'|'.join(b'(?P<%s>%s)' % (rule_id.encode(), _TOKENS[rule_id][2])
+                             for rule_id in rule_ids)
+    return re.compile(b'(?=[%s])(?=(?:%s))' % (re.escape(first_chars), alternatives))
+
+
+def _line_at(buffer: mmap.mmap, pos: int) -> bytes:
+    """The line of buffer containing byte offset pos, without its line ending"""
+    start = buffer.rfind(b'\n', 0, pos) + 1
+    end = buffer.find(b'\n', pos)
+    if end == -1:
+        end = len(buffer)
+    line = buffer[start:end]
+    if line.endswith(b'\r'):
+        line = line[:-1]
+    return line
+
+
+def _numbered(content: mmap.mmap, matches: Iterable[Match]) -> Iterator[Tuple[int, Match]]:
+    """Pair matches (in ascending order) with their 1-based line numbers
+    
+    Newlines are only counted between consecutive matches, so a whole pass is
+    linear in the file size and needs no line offset table.
+    """
+    line_num = 1
+    counted = 0
+    for match in matches:
+        pos = match.start()
+        line_num += content[counted:pos].count(b'\n')
+        counted = pos
+        yield line_num, match
+
 
 class HttpClientLinter(GoLinter):
     """Linter for HTTP client configuration and patterns"""
     
+    rules = _RULES
+    
     def __init__(self):
         super().__init__("http_client")
     
@@ -21,197 +117,137 @@ class HttpClientLinter(GoLinter):
         issues = []
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                lines = content.splitlines()
-            
-            for line_num, line in enumerate(lines, 1):
-                # Check HTTP client patterns
-                issues.extend(self._check_timeout_patterns(file_path, line_num, line))
-                issues.extend(self._check_url_patterns(file_path, line_num, line))
-                issues.extend(self._check_memory_protection(file_path, line_num, line))
-                issues.extend(self._check_error_patterns(file_path, line_num, line))
-                
-            # Check for hardcoded URLs that should be constants
-            issues.extend(self._check_hardcoded_urls(file_path, content))
+            with open(file_path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return issues
+                # Map the file rather than reading it; only matched lines get decoded
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                    self._check_tokens(issues, file_path, content)
+                    
+                    # Check for hardcoded URLs that should be constants
+                    issues.extend(self._check_hardcoded_urls(file_path, content))
                 
         except Exception as e:
-            print(f"Error reading {file_path}: {e}")
+            logger.warning("Error reading %s: %s", file_path, e,
+                           exc_info=logger.isEnabledFor(logging.DEBUG))
         
         return issues
     
-    def _check_timeout_patterns(self, file_path: Path, line_num: int, line: str) -> List[LintIssue]:
-        """Check for timeout configuration anti-patterns"""
-        issues = []
-        
+    def _check_tokens(self, issues: List[LintIssue], file_path: Path, content: mmap.mmap) -> None:
+        """Tokenize the file once and check each line a rule token was found on"""
+        # Only tokenize for rules whose trigger occurs somewhere in the file
+        candidates = tuple(rule_id for rule_id, (trigger, _, _) in _TOKENS.items()
+                           if content.find(trigger) != -1)
+        if not candidates:
+            return
+        
+        # Group the rule tokens found by line, remembering an offset on that line
+        triggered_by_line = {}
+        for line_num, match in _numbered(content, _token_pattern(candidates).finditer(content)):
+            if line_num not in triggered_by_line:
+                triggered_by_line[line_num] = (match.start(), set())
+            triggered_by_line[line_num][1].add(match.lastgroup)
+        
+        for line_num, (pos, triggered) in triggered_by_line.items():
+            line = _line_at(content, pos).decode('utf-8', 'replace')
+            self._check_line(issues, file_path, line_num, line, triggered)
+    
+    def _check_line(self, issues: List[LintIssue], file_path: Path, line_num: int, line: str,
+                    triggered: Set[str]) -> None:
+        """Check the rules whose token appears on a line"""
         # HTTP client with timeout instead of context control
-        if 'http.Client{' in line and 'Timeout:' in line:
-            issues.append(self._create_issue(
-                file_path=file_path,
-                line_number=line_num,
-                severity=LintSeverity.MEDIUM,
-                rule_id="HTTP_001",
-                message="HTTP client timeout should be controlled via context, not client configuration",
-                suggestion="Remove Timeout field and use context.WithTimeout() for requests",
-                auto_fixable=False
-            ))
+        if "HTTP_001" in triggered and 'Timeout:' in line:
+            self._emit(issues, "HTTP_001", file_path, line_num)
         
         # Check for deprecated timeout configuration patterns
-        if re.search(r'(Timeout|timeout)\s*:\s*\w+', line) and 'Config' in line:
-            issues.append(self._create_issue(
-                file_path=file_path,
-                line_number=line_num,
-                severity=LintSeverity.MEDIUM,
-                rule_id="HTTP_002",
-                message="Deprecated timeout configuration detected",
-                suggestion="Use context-based timeout control for better request management",
-                auto_fixable=False
-            ))
-        
-        return issues
-    
-    def _check_url_patterns(self, file_path: Path, line_num: int, line: str) -> List[LintIssue]:
-        """Check for URL handling patterns"""
-        issues = []
+        if "HTTP_002" in triggered and 'Config' in line and _RE_TIMEOUT_FIELD.search(line):
+            self._emit(issues, "HTTP_002", file_path, line_num)
         
         # String concatenation for URLs
-        if '+' in line and ('http://' in line or 'https://' in line):
-            issues.append(self._create_issue(
-                file_path=file_path,
-                line_number=line_num,
-                severity=LintSeverity.MEDIUM,
-                rule_id="HTTP_003",
-                message="URL string concatenation detected",
-                suggestion="Use url.Parse() and ResolveReference() for proper URL construction",
-                auto_fixable=False
-            ))
+        if "HTTP_003" in triggered and '+' in line:
+            self._emit(issues, "HTTP_003", file_path, line_num)
         
         # Missing URL validation
-        if 'url.Parse(' in line and 'err' not in line:
-            issues.append(self._create_issue(
-                file_path=file_path,
-                line_number=line_num,
-                severity=LintSeverity.HIGH,
-                rule_id="HTTP_004",
-                message="URL parsing without error handling",
-                suggestion="Always check error return from url.Parse()",
-                auto_fixable=False
-            ))
-        
-        # BaseURL validation patterns
-        if 'BaseURL' in line and 'empty' not in line and 'nil' not in line:
-            # Look for configuration without validation
-            if 'Config' in line and 'panic' not in line:
-                issues.append(self._create_issue(
-                    file_path=file_path,
-                    line_number=line_num,
-                    severity=LintSeverity.HIGH,
-                    rule_id="HTTP_005",
-                    message="BaseURL configuration without validation",
-                    suggestion="Validate BaseURL is non-empty and has proper scheme/host",
-                    auto_fixable=False
-                ))
+        if "HTTP_004" in triggered and 'err' not in line:
+            self._emit(issues, "HTTP_004", file_path, line_num)
         
-        return issues
-    
-    def _check_memory_protection(self, file_path: Path, line_num: int, line: str) -> List[LintIssue]:
-        """Check for memory protection patterns"""
-        issues = []
+        # BaseURL configuration without validation
+        if ("HTTP_005" in triggered and 'empty' not in line and 'nil' not in line
+                and 'Config' in line and 'panic' not in line):
+            self._emit(issues, "HTTP_005", file_path, line_num)
         
         # JSON decoding without size limits
-        if 'json.NewDecoder(' in line and 'io.LimitReader' not in line and 'resp.Body' in line:
-            issues.append(self._create_issue(
-                file_path=file_path,
-                line_number=line_num,
-                severity=LintSeverity.HIGH,
-                rule_id="HTTP_006",
-                message="JSON decoding without memory protection",
-                suggestion="Use io.LimitReader to prevent memory exhaustion: "
-                          "json.NewDecoder(io.LimitReader(resp.Body, maxSize))",
-                auto_fixable=False
-            ))
+        if "HTTP_006" in triggered and 'io.LimitReader' not in line and 'resp.Body' in line:
+            self._emit(issues, "HTTP_006", file_path, line_num)
         
         # Missing response body limits
-        if 'ioutil.ReadAll(' in line and 'resp.Body' in line:
-            issues.append(self._create_issue(
-                file_path=file_path,
-                line_number=line_num,
-                severity=LintSeverity.HIGH,
-                rule_id="HTTP_007",
-                message="Reading response body without size limit",
-                suggestion="Use io.LimitReader to prevent memory exhaustion",
-                auto_fixable=False
-            ))
-        
-        return issues
-    
-    def _check_error_patterns(self, file_path: Path, line_num: int, line: str) -> List[LintIssue]:
-        """Check for error handling patterns"""
-        issues = []
+        if "HTTP_007" in triggered and 'resp.Body' in line:
+            self._emit(issues, "HTTP_007", file_path, line_num)
         
         # Direct error struct return instead of sentinel error wrapping
-        if re.search(r'return.*&\w+Error{', line) and 'fmt.Errorf' not in line:
-            issues.append(self._create_issue(
-                file_path=file_path,
-                line_number=line_num,
-                severity=LintSeverity.MEDIUM,
-                rule_id="HTTP_008",
-                message="Direct error struct return without sentinel error wrapping",
-                suggestion="Use fmt.Errorf(\"%w: %w\", ErrSentinel, &CustomError{}) for better error handling",
-                auto_fixable=False
-            ))
+        if ("HTTP_008" in triggered and 'fmt.Errorf' not in line
+                and _RE_ERROR_STRUCT_RETURN.search(line)):
+            self._emit(issues, "HTTP_008", file_path, line_num)
         
         # HTTP status code handling without proper error wrapping
-        if 'StatusCode' in line and 'fmt.Errorf' in line and '%w' not in line:
-            issues.append(self._create_issue(
-                file_path=file_path,
-                line_number=line_num,
-                severity=LintSeverity.MEDIUM,
-                rule_id="HTTP_009",
-                message="HTTP status error without proper error wrapping",
-                suggestion="Use %w verb in fmt.Errorf for error wrapping",
-                auto_fixable=False
-            ))
-        
-        return issues
+        if "HTTP_009" in triggered and 'fmt.Errorf' in line and '%w' not in line:
+            self._emit(issues, "HTTP_009", file_path, line_num)
     
-    def _check_hardcoded_urls(self, file_path: Path, content: str) -> List[LintIssue]:
+    def _check_hardcoded_urls(self, file_path: Path, content: mmap.mmap) -> List[LintIssue]:
         """Check for hardcoded URLs that should be constants"""
         issues = []
         
-        # Find hardcoded HTTP URLs in string literals (not in constants)
-        lines = content.splitlines()
-        in_const_block = False
+        # Most Go files contain no URL at all
+        if content.find(b'://') == -1:
+            return issues
         
-        for line_num, line in enumerate(lines, 1):
-            # Track const blocks
-            if line.strip().startswith('const'):
-                in_const_block = True
-                continue
-            elif line.strip() == ')' and in_const_block:
-                in_const_block = False
+        const_ranges = self._const_ranges(content)
+        
+        # Find hardcoded HTTP URLs in string literals (not in constants); like a
+        # per-line search, only the first literal on each line is considered
+        last_line = 0
+        for line_num, url_match in _numbered(content, _RE_URL_LITERAL.finditer(content)):
+            if line_num == last_line:
                 continue
-            elif line.strip() == '' or line.strip().startswith('//'):
+            last_line = line_num
+            
+            # Skip if we're in a const block
+            index = bisect_right(const_ranges, (line_num, float('inf'))) - 1
+            if index >= 0 and line_num <= const_ranges[index][1]:
                 continue
             
-            # Skip if we're in a const block or if line defines a const
-            if in_const_block or 'const ' in line:
+            # Skip blank/comment lines, const definitions and URLs in comments
+            line = _line_at(content, url_match.start())
+            if (line.lstrip().startswith(b'//') or b'const ' in line
+                    or _RE_COMMENTED_URL.search(line)):
                 continue
-                
-            # Look for hardcoded URLs in assignments or function calls
-            url_match = re.search(r'["\']https?://[^"\']+["\']', line)
-            if url_match and not re.search(r'//.*https?://', line):  # Skip comments
-                url = url_match.group()
-                # Skip localhost and test URLs
-                if 'localhost' not in url and '127.0.0.1' not in url and 'example.com' not in url:
-                    issues.append(self._create_issue(
-                        file_path=file_path,
-                        line_number=line_num,
-                        severity=LintSeverity.MEDIUM,
-                        rule_id="HTTP_010",
-                        message=f"Hardcoded URL {url} should be extracted to a constant",
-                        suggestion="Define as const or load from environment variable",
-                        auto_fixable=False
-                    ))
-        
-        return issues
\ No newline at end of file
+            
+            url = url_match.group()
+            # Skip localhost and test URLs
+            if b'localhost' not in url and b'127.0.0.1' not in url and b'example.com' not in url:
+                self._emit(issues, "HTTP_010", file_path, line_num,
+                           url=url.decode('utf-8', 'replace'))
+        
+        return issues
+    
+    def _const_ranges(self, content: mmap.mmap) -> List[Tuple[int, float]]:
+        """(first, last) line spans skipped as const declarations
+        
+        A span runs from a line starting with 'const' to the next line that is
+        just ')', or to the end of the file.
+        """
+        ranges = []
+        block_start = None
+        
+        for line_num, match in _numbered(content, _RE_CONST_BOUNDARY.finditer(content)):
+            if match.group(1):
+                if block_start is None:
+                    block_start = line_num
+            elif block_start is not None:
+                ranges.append((block_start, line_num))
+                block_start = None
+        
+        if block_start is not None:
+            ranges.append((block_start, float('inf')))
+        
+        return ranges
\ No newline at end of file
@@ -3,278 +3,251 @@ Go security linter
 Catches security issues like hardcoded secrets, JWT vulnerabilities, etc.
 """
 
+import logging
+import mmap
+import os
 import re
 from pathlib import Path
 from typing import List
 
 from ..base_linter import GoLinter, LintIssue, LintSeverity
 
+logger = logging.getLogger(__name__)
+
+# group name -> (string literal body after the opening quote, secret type) for
+# well-known credential formats, in reporting order
+_SECRET_PATTERNS = {
+    "stripe_live": (r'sk_live_[a-zA-Z0-9]{24,}["\']', 'Stripe live secret key'),
+    "stripe_test": (r'sk_test_[a-zA-Z0-9]{24,}["\']', 'Stripe test secret key'),
+    "stripe_publishable": (r'pk_live_[a-zA-Z0-9]{24,}["\']', 'Stripe live publishable key'),
+    "aws_access_key": (r'AKIA[0-9A-Z]{16}["\']', 'AWS access key'),
+    "aws_secret_key": (r'[0-9a-zA-Z/+]{40}["\']', 'AWS secret key'),
+    "google_oauth": (r'ya29\.[0-9A-Za-z\-_]+["\']', 'Google OAuth access token'),
+    "google_api_key": (r'AIza[0-9A-Za-z\-_]{35}["\']', 'Google API key'),
+    "github_pat": (r'ghp_[A-Za-z0-9_]{36}["\']', 'GitHub personal access token'),
+    "github_app": (r'ghs_[A-Za-z0-9_]{36}["\']', 'GitHub app token'),
+}
+# One pass finds every format: the lookahead consumes only the opening quote,
+# so a closing quote can still open the next literal. The formats are
+# disjoint, so at most one group can match at any quote.
+_RE_SECRETS = re.compile(r'["\'](?=%s)' % '|'.join(
+    f'(?P<{name}>{body})' for name, (body, _) in _SECRET_PATTERNS.items()))
+_RE_GENERIC_SECRET = re.compile(r'(?i)(?:secret|key|token|password)\s*[:=]\s*["\'][A-Za-z0-9+/=]{20,}["\']')
+# A default key literal is a quoted "your-" followed by "-secret" and then a quote
+_RE_DEFAULT_KEY_START = re.compile(r'(?i)["\']your-')
+_RE_DEFAULT_KEY_SECRET = re.compile(r'(?i)-secret')
+_RE_SENSITIVE_NAME = re.compile(r'(?i)(?:token|key|secret|password|salt|nonce)')
+_RE_SQL_KEYWORD = re.compile(r'(?i)(SELECT|INSERT|UPDATE|DELETE)')
+# (name, substrings that indicate its use) for weak hash algorithms
+_WEAK_HASHES = (
+    ('md5', ('crypto/md5', 'md5.Sum')),
+    ('sha1', ('crypto/sha1', 'sha1.Sum')),
+)
+_RE_INSECURE_HTTP = re.compile(r'["\']http://(?!localhost|127\.0\.0\.1)')
+
+# Every security rule needs one of these on a line to fire. The engine tries
+# every alternative at every offset; a lookahead on the characters a trigger
+# can start with lets it skip most offsets.
+_RULE_TRIGGERS = r'(?=["\'sSkKtTpPyYiIuUdDjAm])(?:%s)' % '|'.join([
+    r'["\'](?:%s)' % '|'.join(body for body, _ in _SECRET_PATTERNS.values()),
+    r'(?i:secret|key|token|password|your-|select|insert|update|delete)',
+    r'SigningMethodNone|ParseWithClaims|jwt\.Parse|time\.Now\(\)|Authorization|json\.NewEncoder',
+    r'md5|sha1|math/rand',
+    r'["\']http://',
+    r'InsecureSkipVerify',
+])
+_RE_RULE_TRIGGERS = re.compile(_RULE_TRIGGERS.encode())
+
+
+# rule_id -> (severity, message, suggestion, auto_fixable)
+_RULES = {
+    "SEC_001": (LintSeverity.HIGH, "Hardcoded {secret_type} detected",
+                "Use environment variables or secure config management", False),
+    "SEC_002": (LintSeverity.MEDIUM, "Possible hardcoded secret or key",
+                "Verify this is not a real secret. Use environment variables for actual secrets.", False),
+    "SEC_003": (LintSeverity.HIGH, "Default JWT signing key detected",
+                "Use a secure, randomly generated signing key from environment variables", False),
+    "SEC_004": (LintSeverity.HIGH, "JWT 'none' algorithm is insecure",
+                "Use HMAC (HS256) or RSA (RS256) signing methods", False),
+    "SEC_005": (LintSeverity.MEDIUM, "JWT parsing without explicit algorithm validation",
+                "Use jwt.WithValidMethods() to restrict allowed signing algorithms", False),
+    "SEC_006": (LintSeverity.MEDIUM, "Weak hash algorithm {algorithm} detected",
+                "Use SHA-256 or stronger hash algorithms", False),
+    "SEC_007": (LintSeverity.HIGH, "Using math/rand for cryptographic purposes",
+                "Use crypto/rand for cryptographically secure random numbers", False),
+    "SEC_008": (LintSeverity.HIGH, "Potential SQL injection via string concatenation",
+                "Use parameterized queries with ? placeholders", False),
+    "SEC_009": (LintSeverity.MEDIUM, "Using fmt.Sprintf for SQL query construction",
+                "Use parameterized queries instead of string formatting", False),
+    "SEC_010": (LintSeverity.MEDIUM, "Insecure HTTP URL detected", "Use HTTPS for external URLs", False),
+    "SEC_011": (LintSeverity.HIGH, "TLS certificate verification disabled",
+                "Enable TLS verification for production code", False),
+    "SEC_012": (LintSeverity.MEDIUM, "JWT parsing without clock skew handling",
+                "Add clock skew leeway (30s) for JWT timestamp validation", False),
+    "SEC_013": (LintSeverity.MEDIUM, "JWT time validation should use UTC",
+                "Use time.Now().UTC() for consistent JWT timestamp validation", False),
+    "SEC_014": (LintSeverity.MEDIUM, "Bearer token parsing without case-insensitive prefix check",
+                "Use case-insensitive Bearer token parsing with strings.ToLower()", False),
+    "SEC_015": (LintSeverity.HIGH, "JWT signing key should be required environment variable",
+                "Fail fast with log.Fatal() if JWT_SIGNING_KEY is not set", False),
+    "SEC_016": (LintSeverity.MEDIUM, "JSON encoding without error handling",
+                "Handle JSON encoding errors and provide fallback response", False),
+}
+
+
+def _has_default_jwt_key(line: str) -> bool:
+    """Check for a placeholder signing key literal like "your-jwt-secret"
+    
+    Same as searching for ["']your-.*-secret.*["'], but each step resumes where
+    the previous one matched, so no line can make the engine backtrack.
+    """
+    start = _RE_DEFAULT_KEY_START.search(line)
+    if start is None:
+        return False
+    secret = _RE_DEFAULT_KEY_SECRET.search(line, start.end())
+    if secret is None:
+        return False
+    return line.find('"', secret.end()) != -1 or line.find("'", secret.end()) != -1
+
 
 class SecurityLinter(GoLinter):
     """Linter for security vulnerabilities in Go code"""
     
+    rules = _RULES
+    
     def __init__(self):
         super().__init__("security")
     
     def _lint_go_file(self, file_path: Path) -> List[LintIssue]:
         """Check Go file for security issues"""
         issues = []
+        # Test files are exempt from some checks
+        is_test_file = file_path.name.endswith('_test.go')
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-            
-            for line_num, line in enumerate(lines, 1):
-                # Check for hardcoded secrets
-                issues.extend(self._check_hardcoded_secrets(file_path, line_num, line))
-                
-                # Check for JWT security issues
-                issues.extend(self._check_jwt_security(file_path, line_num, line))
-                
-                # Check for weak crypto
-                issues.extend(self._check_weak_crypto(file_path, line_num, line))
-                
-                # Check for unsafe SQL
-                issues.extend(self._check_sql_injection(file_path, line_num, line))
-                
-                # Check for insecure HTTP
-                issues.extend(self._check_insecure_http(file_path, line_num, line))
-                
-        except Exception as e:
-            print(f"Error reading {file_path}: {e}")
+            with open(file_path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return issues
+                # Map the file rather than reading it; only candidate lines get decoded
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                    for line_num, line in self._iter_matching_lines(content, _RE_RULE_TRIGGERS):
+                        # Check for hardcoded secrets
+                        self._check_hardcoded_secrets(issues, file_path, line_num, line, is_test_file)
+                        
+                        # Check for JWT security issues (lower-cased once for the case-insensitive checks)
+                        self._check_jwt_security(issues, file_path, line_num, line, line.lower())
+                        
+                        # Check for weak crypto
+                        self._check_weak_crypto(issues, file_path, line_num, line)
+                        
+                        # Check for unsafe SQL
+                        self._check_sql_injection(issues, file_path, line_num, line)
+                        
+                        # Check for insecure HTTP
+                        self._check_insecure_http(issues, file_path, line_num, line)
+                        
+        except (OSError, ValueError) as e:
+            # Unreadable files; anything else is a linter bug and is left to
+            # surface from _lint_file_safely
+            logger.warning("Error reading %s: %s", file_path, e,
+                           exc_info=logger.isEnabledFor(logging.DEBUG))
         
         return issues
     
-    def _check_hardcoded_secrets(self, file_path: Path, line_num: int, line: str) -> List[LintIssue]:
+    def _check_hardcoded_secrets(self, issues: List[LintIssue], file_path: Path, line_num: int,
+                                 line: str, is_test_file: bool) -> None:
         """Check for hardcoded secrets and API keys"""
-        issues = []
+        # Every secret pattern matches inside a string literal
+        if '"' not in line and "'" not in line:
+            return
         
-        # Skip test files for some checks
-        is_test_file = file_path.name.endswith('_test.go')
-        
-        # Patterns for different types of secrets
-        secret_patterns = [
-            (r'["\']sk_live_[a-zA-Z0-9]{24,}["\']', 'Stripe live secret key'),
-            (r'["\']sk_test_[a-zA-Z0-9]{24,}["\']', 'Stripe test secret key'),
-            (r'["\']pk_live_[a-zA-Z0-9]{24,}["\']', 'Stripe live publishable key'),
-            (r'["\']AKIA[0-9A-Z]{16}["\']', 'AWS access key'),
-            (r'["\'][0-9a-zA-Z/+]{40}["\']', 'AWS secret key'),
-            (r'["\']ya29\.[0-9A-Za-z\-_]+["\']', 'Google OAuth access token'),
-            (r'["\']AIza[0-9A-Za-z\-_]{35}["\']', 'Google API key'),
-            (r'["\']ghp_[A-Za-z0-9_]{36}["\']', 'GitHub personal access token'),
-            (r'["\']ghs_[A-Za-z0-9_]{36}["\']', 'GitHub app token'),
-        ]
-        
-        for pattern, secret_type in secret_patterns:
-            if re.search(pattern, line):
-                issues.append(self._create_issue(
-                    file_path=file_path,
-                    line_number=line_num,
-                    severity=LintSeverity.HIGH,
-                    rule_id="SEC_001",
-                    message=f"Hardcoded {secret_type} detected",
-                    suggestion="Use environment variables or secure config management"
-                ))
+        found = {match.lastgroup for match in _RE_SECRETS.finditer(line)}
+        for name, (_, secret_type) in _SECRET_PATTERNS.items():
+            if name in found:
+                self._emit(issues, "SEC_001", file_path, line_num, secret_type=secret_type)
         
         # Generic high-entropy string check (but not in test files)
         if not is_test_file:
             # Look for suspicious variable assignments with high-entropy strings
-            if re.search(r'(?:secret|key|token|password)\s*[:=]\s*["\'][A-Za-z0-9+/=]{20,}["\']', line, re.IGNORECASE):
-                issues.append(self._create_issue(
-                    file_path=file_path,
-                    line_number=line_num,
-                    severity=LintSeverity.MEDIUM,
-                    rule_id="SEC_002",
-                    message="Possible hardcoded secret or key",
-                    suggestion="Verify this is not a real secret. Use environment variables for actual secrets."
-                ))
-        
-        return issues
+            if _RE_GENERIC_SECRET.search(line):
+                self._emit(issues, "SEC_002", file_path, line_num)
     
-    def _check_jwt_security(self, file_path: Path, line_num: int, line: str) -> List[LintIssue]:
+    def _check_jwt_security(self, issues: List[LintIssue], file_path: Path, line_num: int,
+                            line: str, lowered: str) -> None:
         """Check for JWT security issues"""
-        issues = []
-        
         # Check for default JWT signing keys
-        if re.search(r'["\']your-.*-secret.*["\']', line, re.IGNORECASE):
-            issues.append(self._create_issue(
-                file_path=file_path,
-                line_number=line_num,
-                severity=LintSeverity.HIGH,
-                rule_id="SEC_003",
-                message="Default JWT signing key detected",
-                suggestion="Use a secure, randomly generated signing key from environment variables"
-            ))
+        if '-' in line and _has_default_jwt_key(line):
+            self._emit(issues, "SEC_003", file_path, line_num)
         
         # Check for weak JWT algorithms
         if 'SigningMethodNone' in line:
-            issues.append(self._create_issue(
-                file_path=file_path,
-                line_number=line_num,
-                severity=LintSeverity.HIGH,
-                rule_id="SEC_004",
-                message="JWT 'none' algorithm is insecure",
-                suggestion="Use HMAC (HS256) or RSA (RS256) signing methods"
-            ))
+            self._emit(issues, "SEC_004", file_path, line_num)
         
         # Check for missing JWT validation
         if 'ParseWithClaims' in line and 'WithValidMethods' not in line:
-            issues.append(self._create_issue(
-                file_path=file_path,
-                line_number=line_num,
-                severity=LintSeverity.MEDIUM,
-                rule_id="SEC_005",
-                message="JWT parsing without explicit algorithm validation",
-                suggestion="Use jwt.WithValidMethods() to restrict allowed signing algorithms"
-            ))
+            self._emit(issues, "SEC_005", file_path, line_num)
         
         # Check for missing clock skew handling
         if 'ParseWithClaims' in line or 'jwt.Parse' in line:
-            if 'leeway' not in line.lower() and 'skew' not in line.lower():
-                issues.append(self._create_issue(
-                    file_path=file_path,
-                    line_number=line_num,
-                    severity=LintSeverity.MEDIUM,
-                    rule_id="SEC_012",
-                    message="JWT parsing without clock skew handling",
-                    suggestion="Add clock skew leeway (30s) for JWT timestamp validation"
-                ))
+            if 'leeway' not in lowered and 'skew' not in lowered:
+                self._emit(issues, "SEC_012", file_path, line_num)
         
         # Check for non-UTC time in JWT validation
-        if 'time.Now()' in line and 'jwt' in line.lower():
+        if 'time.Now()' in line and 'jwt' in lowered:
             if '.UTC()' not in line:
-                issues.append(self._create_issue(
-                    file_path=file_path,
-                    line_number=line_num,
-                    severity=LintSeverity.MEDIUM,
-                    rule_id="SEC_013",
-                    message="JWT time validation should use UTC",
-                    suggestion="Use time.Now().UTC() for consistent JWT timestamp validation"
-                ))
+                self._emit(issues, "SEC_013", file_path, line_num)
         
         # Check for improper Bearer token parsing
         if 'Authorization' in line and 'Bearer' in line:
             if 'strings.HasPrefix' not in line and 'strings.ToLower' not in line:
-                issues.append(self._create_issue(
-                    file_path=file_path,
-                    line_number=line_num,
-                    severity=LintSeverity.MEDIUM,
-                    rule_id="SEC_014",
-                    message="Bearer token parsing without case-insensitive prefix check",
-                    suggestion="Use case-insensitive Bearer token parsing with strings.ToLower()"
-                ))
+                self._emit(issues, "SEC_014", file_path, line_num)
         
         # Check for missing JWT signing key environment variable requirement
         if 'JWT_SIGNING_KEY' in line and 'os.Getenv' in line:
             if 'log.Fatal' not in line and 'panic' not in line and 'err' not in line:
-                issues.append(self._create_issue(
-                    file_path=file_path,
-                    line_number=line_num,
-                    severity=LintSeverity.HIGH,
-                    rule_id="SEC_015",
-                    message="JWT signing key should be required environment variable",
-                    suggestion="Fail fast with log.Fatal() if JWT_SIGNING_KEY is not set"
-                ))
+                self._emit(issues, "SEC_015", file_path, line_num)
         
         # Check for missing error handling in JSON encoding
         if 'json.NewEncoder' in line and 'Encode' in line:
             if 'err' not in line:
-                issues.append(self._create_issue(
-                    file_path=file_path,
-                    line_number=line_num,
-                    severity=LintSeverity.MEDIUM,
-                    rule_id="SEC_016",
-                    message="JSON encoding without error handling",
-                    suggestion="Handle JSON encoding errors and provide fallback response"
-                ))
-        
-        return issues
+                self._emit(issues, "SEC_016", file_path, line_num)
     
-    def _check_weak_crypto(self, file_path: Path, line_num: int, line: str) -> List[LintIssue]:
+    def _check_weak_crypto(self, issues: List[LintIssue], file_path: Path, line_num: int,
+                           line: str) -> None:
         """Check for weak cryptographic practices"""
-        issues = []
-        
         # Check for weak hash algorithms
-        weak_hashes = ['md5', 'sha1']
-        for weak_hash in weak_hashes:
-            if f'crypto/{weak_hash}' in line or f'{weak_hash}.Sum' in line:
-                issues.append(self._create_issue(
-                    file_path=file_path,
-                    line_number=line_num,
-                    severity=LintSeverity.MEDIUM,
-                    rule_id="SEC_006",
-                    message=f"Weak hash algorithm {weak_hash.upper()} detected",
-                    suggestion="Use SHA-256 or stronger hash algorithms"
-                ))
+        for weak_hash, needles in _WEAK_HASHES:
+            if needles[0] in line or needles[1] in line:
+                self._emit(issues, "SEC_006", file_path, line_num, algorithm=weak_hash.upper())
         
         # Check for math/rand instead of crypto/rand
         if 'math/rand' in line and 'crypto' not in line:
             # Look for security-sensitive contexts
-            if re.search(r'(?:token|key|secret|password|salt|nonce)', line, re.IGNORECASE):
-                issues.append(self._create_issue(
-                    file_path=file_path,
-                    line_number=line_num,
-                    severity=LintSeverity.HIGH,
-                    rule_id="SEC_007",
-                    message="Using math/rand for cryptographic purposes",
-                    suggestion="Use crypto/rand for cryptographically secure random numbers"
-                ))
-        
-        return issues
+            if _RE_SENSITIVE_NAME.search(line):
+                self._emit(issues, "SEC_007", file_path, line_num)
     
-    def _check_sql_injection(self, file_path: Path, line_num: int, line: str) -> List[LintIssue]:
+    def _check_sql_injection(self, issues: List[LintIssue], file_path: Path, line_num: int,
+                             line: str) -> None:
         """Check for potential SQL injection vulnerabilities"""
-        issues = []
+        keyword = _RE_SQL_KEYWORD.search(line)
+        if keyword is None:
+            return
         
-        # Check for string concatenation in SQL queries
-        if re.search(r'(SELECT|INSERT|UPDATE|DELETE).*\+.*', line, re.IGNORECASE):
-            if 'fmt.Sprintf' in line or '+' in line:
-                issues.append(self._create_issue(
-                    file_path=file_path,
-                    line_number=line_num,
-                    severity=LintSeverity.HIGH,
-                    rule_id="SEC_008",
-                    message="Potential SQL injection via string concatenation",
-                    suggestion="Use parameterized queries with ? placeholders"
-                ))
+        # Check for string concatenation in SQL queries (a '+' after the first keyword)
+        if line.find('+', keyword.end()) != -1:
+            self._emit(issues, "SEC_008", file_path, line_num)
         
         # Check for fmt.Sprintf in SQL contexts
-        if 'fmt.Sprintf' in line and re.search(r'(SELECT|INSERT|UPDATE|DELETE)', line, re.IGNORECASE):
-            issues.append(self._create_issue(
-                file_path=file_path,
-                line_number=line_num,
-                severity=LintSeverity.MEDIUM,
-                rule_id="SEC_009",
-                message="Using fmt.Sprintf for SQL query construction",
-                suggestion="Use parameterized queries instead of string formatting"
-            ))
-        
-        return issues
+        if 'fmt.Sprintf' in line:
+            self._emit(issues, "SEC_009", file_path, line_num)
     
-    def _check_insecure_http(self, file_path: Path, line_num: int, line: str) -> List[LintIssue]:
+    def _check_insecure_http(self, issues: List[LintIssue], file_path: Path, line_num: int,
+                             line: str) -> None:
         """Check for insecure HTTP practices"""
-        issues = []
-        
         # Check for http:// URLs in production code
-        if re.search(r'["\']http://(?!localhost|127\.0\.0\.1)', line):
-            issues.append(self._create_issue(
-                file_path=file_path,
-                line_number=line_num,
-                severity=LintSeverity.MEDIUM,
-                rule_id="SEC_010",
-                message="Insecure HTTP URL detected",
-                suggestion="Use HTTPS for external URLs"
-            ))
+        if 'http://' in line and _RE_INSECURE_HTTP.search(line):
+            self._emit(issues, "SEC_010", file_path, line_num)
         
         # Check for disabled TLS verification
         if 'InsecureSkipVerify' in line and 'true' in line:
-            issues.append(self._create_issue(
-                file_path=file_path,
-                line_number=line_num,
-                severity=LintSeverity.HIGH,
-                rule_id="SEC_011",
-                message="TLS certificate verification disabled",
-                suggestion="Enable TLS verification for production code"
-            ))
-        
-        return issues
\ No newline at end of file
+            self._emit(issues, "SEC_011", file_path, line_num)
\ No newline at end of file
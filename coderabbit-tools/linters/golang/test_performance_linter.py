@@ -4,242 +4,234 @@ Catches performance issues in test code like improper use of t.Parallel(), ineff
 Based on CodeRabbit issues: Fix #18 (t.Parallel in fuzz), Fix #30 (build constraints), Fix #21 (test timelines)
 """
 
+import logging
+import mmap
+import os
 import re
 from pathlib import Path
-from typing import List
+from typing import List, Set
 
 from ..base_linter import GoLinter, LintIssue, LintSeverity
 
+logger = logging.getLogger(__name__)
+
+_RE_SHORT_TIMEOUT = re.compile(r'[1-4]\s*\*\s*time\.Second')
+_RE_SECONDS_TIMEOUT = re.compile(r'[1-9]\s*\*\s*time\.Second')
+_RE_DATABASE_TIMEOUT = re.compile(r'1[5-9]\s*\*\s*time\.Second')
+_RE_SKIP_YEAR = re.compile(r'20(?:2[5-9]|[3-9]\d)')
+_RE_FUZZ_DECL = re.compile(rb'func Fuzz')
+
+# Every test performance rule needs one of these on a line to fire (TESTPERF_004's
+# database keywords only matter next to a time.Second timeout)
+_RE_RULE_TRIGGERS = re.compile(rb't\.Parallel\(\)|sql\.Open|http\.NewRequest|time\.Second|//go:build'
+                               rb'|TestPlaceholder|t\.Skip\(|make\(chan error|go func')
+
+
+# rule_id -> (severity, message, suggestion, auto_fixable)
+_RULES = {
+    "TESTPERF_001": (LintSeverity.MEDIUM, "t.Parallel() should not be used in fuzz tests",
+                     "Remove t.Parallel() from fuzz tests as they are resource-intensive", True),
+    "TESTPERF_002": (LintSeverity.MEDIUM, "Resource created without cleanup",
+                     "Use defer or t.Cleanup() to ensure resource cleanup", False),
+    "TESTPERF_003": (LintSeverity.MEDIUM, "Short timeout may cause test failures in CI",
+                     "Use 15s timeout for database/external service tests to handle CI latency", False),
+    "TESTPERF_004": (LintSeverity.MEDIUM, "Database test timeout should be 15s for CI reliability",
+                     "Use 15 * time.Second for database connection timeouts in tests", False),
+    "TESTPERF_005": (LintSeverity.LOW, "Modern build constraint without legacy fallback",
+                     "Add legacy // +build constraint for backward compatibility", False),
+    "TESTPERF_006": (LintSeverity.MEDIUM, "Placeholder test without build constraints",
+                     "Add //go:build !integration constraint to exclude from integration tests", False),
+    "TESTPERF_007": (LintSeverity.LOW, "Placeholder test without implementation timeline",
+                     "Add TODO comment with completion timeline for placeholder tests", False),
+    "TESTPERF_008": (LintSeverity.MEDIUM, "Placeholder test past implementation deadline",
+                     "Change t.Skip() to t.FailNow() for overdue placeholder tests", False),
+    "TESTPERF_009": (LintSeverity.MEDIUM, "Error channel for synchronization",
+                     "Consider using sync.WaitGroup for more robust goroutine coordination", False),
+    "TESTPERF_010": (LintSeverity.HIGH, "Concurrent slice append without synchronization",
+                     "Use sync.Mutex to protect concurrent slice appends", False),
+}
+
 
 class TestPerformanceLinter(GoLinter):
     """Linter for test performance issues in Go code"""
     
+    rules = _RULES
+    
     def __init__(self):
         super().__init__("test_performance")
+        self.file_patterns = ["*_test.go"]
     
     def _lint_go_file(self, file_path: Path) -> List[LintIssue]:
         """Check Go test file for performance issues"""
         issues = []
         
-        # Only lint test files
+        # Only lint test files (lint() never passes others, but lint_file() may)
         if not file_path.name.endswith('_test.go'):
             return issues
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read()
-                lines = content.splitlines()
-            
-            for line_num, line in enumerate(lines, 1):
-                # Check for t.Parallel() usage issues
-                issues.extend(self._check_parallel_usage(file_path, line_num, line, content))
-                
-                # Check for resource cleanup issues
-                issues.extend(self._check_resource_cleanup(file_path, line_num, line))
-                
-                # Check for test timeout issues
-                issues.extend(self._check_test_timeouts(file_path, line_num, line))
-                
-                # Check for build constraint issues
-                issues.extend(self._check_build_constraints(file_path, line_num, line, lines))
-                
-                # Check for placeholder test issues
-                issues.extend(self._check_placeholder_tests(file_path, line_num, line))
-                
-                # Check for sync patterns
-                issues.extend(self._check_sync_patterns(file_path, line_num, line))
+            with open(file_path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return issues
+                # Map the file rather than reading it; only candidate lines get decoded
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                    # Build constraints are only looked for in the first lines
+                    header = [content.readline() for _ in range(5)]
+                    has_modern = any(b'//go:build' in line for line in header)
+                    has_legacy = any(b'// +build' in line for line in header)
+                    has_integration_exclusion = any(b'!integration' in line for line in header)
+                    
+                    # Lines within 10 of a fuzz test declaration (counting the declaration
+                    # itself), for the t.Parallel() check
+                    fuzz_window = set()
+                    for fuzz_line, _ in self._iter_matching_lines(content, _RE_FUZZ_DECL):
+                        fuzz_window.update(range(fuzz_line, fuzz_line + 10))
+                    
+                    for line_num, line in self._iter_matching_code_lines(content, _RE_RULE_TRIGGERS):
+                        # Lower-cased once for the case-insensitive keyword checks
+                        lowered = line.lower()
+                        
+                        # Check for t.Parallel() usage issues
+                        self._check_parallel_usage(issues, file_path, line_num, line, fuzz_window)
+                        
+                        # Check for resource cleanup issues
+                        self._check_resource_cleanup(issues, file_path, line_num, line, lowered)
+                        
+                        # Check for test timeout issues
+                        self._check_test_timeouts(issues, file_path, line_num, line, lowered)
+                        
+                        # Check for build constraint issues
+                        self._check_build_constraints(issues, file_path, line_num, line, has_modern,
+                                                      has_legacy, has_integration_exclusion)
+                        
+                        # Check for placeholder test issues
+                        self._check_placeholder_tests(issues, file_path, line_num, line, lowered)
+                        
+                        # Check for sync patterns
+                        self._check_sync_patterns(issues, file_path, line_num, line)
                 
-        except Exception as e:
-            print(f"Error reading {file_path}: {e}")
+        except (OSError, ValueError) as e:
+            # I/O and decode errors only; other exceptions are linter bugs
+            logger.warning("Error reading %s: %s", file_path, e,
+                           exc_info=logger.isEnabledFor(logging.DEBUG))
         
         return issues
     
-    def _check_parallel_usage(self, file_path: Path, line_num: int, line: str, content: str) -> List[LintIssue]:
+    def _check_parallel_usage(self, issues: List[LintIssue], file_path: Path, line_num: int,
+                              line: str, fuzz_window: Set[int]) -> None:
         """Check for improper t.Parallel() usage"""
-        issues = []
-        
-        # Check for t.Parallel() in fuzz tests
-        if 't.Parallel()' in line:
-            # Check if we're in a fuzz test function
-            lines = content.splitlines()
-            for i in range(max(0, line_num - 10), line_num):
-                if i < len(lines) and 'func Fuzz' in lines[i]:
-                    issues.append(self._create_issue(
-                        file_path=file_path,
-                        line_number=line_num,
-                        severity=LintSeverity.MEDIUM,
-                        rule_id="TESTPERF_001",
-                        message="t.Parallel() should not be used in fuzz tests",
-                        suggestion="Remove t.Parallel() from fuzz tests as they are resource-intensive",
-                        auto_fixable=True
-                    ))
-                    break
-        
-        return issues
+        # Check for t.Parallel() in fuzz tests, i.e. just after a fuzz test declaration
+        if 't.Parallel()' in line and line_num in fuzz_window:
+            self._emit(issues, "TESTPERF_001", file_path, line_num)
     
-    def _check_resource_cleanup(self, file_path: Path, line_num: int, line: str) -> List[LintIssue]:
+    def _check_resource_cleanup(self, issues: List[LintIssue], file_path: Path, line_num: int,
+                                line: str, lowered: str) -> None:
         """Check for proper resource cleanup in tests"""
-        issues = []
-        
         # Check for missing cleanup functions
         if 'sql.Open' in line or 'http.NewRequest' in line:
-            if 'defer' not in line and 'cleanup' not in line.lower():
-                issues.append(self._create_issue(
-                    file_path=file_path,
-                    line_number=line_num,
-                    severity=LintSeverity.MEDIUM,
-                    rule_id="TESTPERF_002",
-                    message="Resource created without cleanup",
-                    suggestion="Use defer or t.Cleanup() to ensure resource cleanup"
-                ))
-        
-        return issues
+            if 'defer' not in line and 'cleanup' not in lowered:
+                self._emit(issues, "TESTPERF_002", file_path, line_num)
     
-    def _check_test_timeouts(self, file_path: Path, line_num: int, line: str) -> List[LintIssue]:
+    def _check_test_timeouts(self, issues: List[LintIssue], file_path: Path, line_num: int,
+                             line: str, lowered: str) -> None:
         """Check for appropriate test timeouts"""
-        issues = []
+        # Both rules look for an N * time.Second timeout
+        if 'time.Second' not in line:
+            return
         
         # Check for very short timeouts that might cause CI failures
-        if re.search(r'[1-4]\s*\*\s*time\.Second', line):
+        if _RE_SHORT_TIMEOUT.search(line):
             if 'context.WithTimeout' in line or 'time.After' in line:
-                issues.append(self._create_issue(
-                    file_path=file_path,
-                    line_number=line_num,
-                    severity=LintSeverity.MEDIUM,
-                    rule_id="TESTPERF_003",
-                    message="Short timeout may cause test failures in CI",
-                    suggestion="Use 15s timeout for database/external service tests to handle CI latency"
-                ))
+                self._emit(issues, "TESTPERF_003", file_path, line_num)
         
         # Recommend specific timeout for database tests
-        if 'mysql' in line.lower() or 'database' in line.lower():
-            if re.search(r'[1-9]\s*\*\s*time\.Second', line) and not re.search(r'1[5-9]\s*\*\s*time\.Second', line):
-                issues.append(self._create_issue(
-                    file_path=file_path,
-                    line_number=line_num,
-                    severity=LintSeverity.MEDIUM,
-                    rule_id="TESTPERF_004",
-                    message="Database test timeout should be 15s for CI reliability",
-                    suggestion="Use 15 * time.Second for database connection timeouts in tests"
-                ))
-        
-        return issues
+        if 'mysql' in lowered or 'database' in lowered:
+            if _RE_SECONDS_TIMEOUT.search(line) and not _RE_DATABASE_TIMEOUT.search(line):
+                self._emit(issues, "TESTPERF_004", file_path, line_num)
     
-    def _check_build_constraints(self, file_path: Path, line_num: int, line: str, lines: List[str]) -> List[LintIssue]:
+    def _check_build_constraints(self, issues: List[LintIssue], file_path: Path, line_num: int,
+                                 line: str, has_modern: bool, has_legacy: bool,
+                                 has_integration_exclusion: bool) -> None:
         """Check for proper build constraints in test files"""
-        issues = []
-        
         # Check if file has both modern and legacy build constraints
         if line_num <= 3:  # Only check top of file
-            has_modern = any('//go:build' in l for l in lines[:5])
-            has_legacy = any('// +build' in l for l in lines[:5])
-            
             if has_modern and not has_legacy:
                 if '//go:build' in line:
-                    issues.append(self._create_issue(
-                        file_path=file_path,
-                        line_number=line_num,
-                        severity=LintSeverity.LOW,
-                        rule_id="TESTPERF_005",
-                        message="Modern build constraint without legacy fallback",
-                        suggestion="Add legacy // +build constraint for backward compatibility"
-                    ))
+                    self._emit(issues, "TESTPERF_005", file_path, line_num)
         
         # Check for placeholder tests without build constraints
         if 'TestPlaceholder' in line or 't.Skip(' in line:
             # Check if file has integration exclusion
-            has_integration_exclusion = any('!integration' in l for l in lines[:5])
             if not has_integration_exclusion:
-                issues.append(self._create_issue(
-                    file_path=file_path,
-                    line_number=line_num,
-                    severity=LintSeverity.MEDIUM,
-                    rule_id="TESTPERF_006",
-                    message="Placeholder test without build constraints",
-                    suggestion="Add //go:build !integration constraint to exclude from integration tests"
-                ))
-        
-        return issues
+                self._emit(issues, "TESTPERF_006", file_path, line_num)
     
-    def _check_placeholder_tests(self, file_path: Path, line_num: int, line: str) -> List[LintIssue]:
+    def _check_placeholder_tests(self, issues: List[LintIssue], file_path: Path, line_num: int,
+                                 line: str, lowered: str) -> None:
         """Check for placeholder test patterns"""
-        issues = []
+        # Both rules look at t.Skip() calls
+        if 't.Skip(' not in line:
+            return
         
         # Check for placeholder tests without timelines
-        if 't.Skip(' in line and 'placeholder' in line.lower():
-            if 'TODO' not in line and 'timeline' not in line.lower():
-                issues.append(self._create_issue(
-                    file_path=file_path,
-                    line_number=line_num,
-                    severity=LintSeverity.LOW,
-                    rule_id="TESTPERF_007",
-                    message="Placeholder test without implementation timeline",
-                    suggestion="Add TODO comment with completion timeline for placeholder tests"
-                ))
+        if 'placeholder' in lowered:
+            if 'TODO' not in line and 'timeline' not in lowered:
+                self._emit(issues, "TESTPERF_007", file_path, line_num)
         
         # Check for placeholder tests that should be changed to t.FailNow()
-        if 't.Skip(' in line and re.search(r'20(2[5-9]|[3-9]\d)', line):
-            issues.append(self._create_issue(
-                file_path=file_path,
-                line_number=line_num,
-                severity=LintSeverity.MEDIUM,
-                rule_id="TESTPERF_008",
-                message="Placeholder test past implementation deadline",
-                suggestion="Change t.Skip() to t.FailNow() for overdue placeholder tests"
-            ))
-        
-        return issues
+        if '20' in line and _RE_SKIP_YEAR.search(line):
+            self._emit(issues, "TESTPERF_008", file_path, line_num)
     
-    def _check_sync_patterns(self, file_path: Path, line_num: int, line: str) -> List[LintIssue]:
+    def _check_sync_patterns(self, issues: List[LintIssue], file_path: Path, line_num: int,
+                             line: str) -> None:
         """Check for proper synchronization patterns in tests"""
-        issues = []
-        
         # Check for proper WaitGroup usage over error channels
         if 'make(chan error' in line:
-            issues.append(self._create_issue(
-                file_path=file_path,
-                line_number=line_num,
-                severity=LintSeverity.MEDIUM,
-                rule_id="TESTPERF_009",
-                message="Error channel for synchronization",
-                suggestion="Consider using sync.WaitGroup for more robust goroutine coordination"
-            ))
+            self._emit(issues, "TESTPERF_009", file_path, line_num)
         
         # Check for concurrent slice append without mutex
         if 'append(' in line and 'go func' in line:
-            issues.append(self._create_issue(
-                file_path=file_path,
-                line_number=line_num,
-                severity=LintSeverity.HIGH,
-                rule_id="TESTPERF_010",
-                message="Concurrent slice append without synchronization",
-                suggestion="Use sync.Mutex to protect concurrent slice appends"
-            ))
-        
-        return issues
+            self._emit(issues, "TESTPERF_010", file_path, line_num)
     
     def _fix_issue(self, issue: LintIssue) -> bool:
         """Auto-fix specific test performance issues"""
-        if issue.rule_id == "TESTPERF_001":  # Remove t.Parallel() from fuzz tests
-            try:
-                with open(issue.file_path, 'r', encoding='utf-8') as f:
-                    lines = f.readlines()
+        return self._fix_issues_for_file(issue.file_path, [issue]) > 0
+    
+    def _fix_issues_for_file(self, file_path: Path, issues: List[LintIssue]) -> int:
+        """Auto-fix all test performance issues in one file with a single read and write"""
+        fixed_count = 0
+        
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                lines = f.readlines()
+            
+            # Work bottom-up so removing a line never shifts lines still to be fixed
+            for issue in sorted(issues, key=lambda i: i.line_number, reverse=True):
+                if self._fix_line_issue(lines, issue):
+                    fixed_count += 1
+            
+            if fixed_count:
+                with open(file_path, 'w', encoding='utf-8') as f:
+                    f.writelines(lines)
                 
-                line = lines[issue.line_number - 1]
-                if 't.Parallel()' in line:
-                    # Remove the entire line if it only contains t.Parallel()
-                    if line.strip() == 't.Parallel()':
-                        lines.pop(issue.line_number - 1)
-                    else:
-                        # Remove just the t.Parallel() call
-                        lines[issue.line_number - 1] = line.replace('t.Parallel()', '').strip() + '\n'
-                    
-                    with open(issue.file_path, 'w', encoding='utf-8') as f:
-                        f.writelines(lines)
-                    
-                    return True
-                        
-            except Exception as e:
-                print(f"Error fixing {issue.file_path}: {e}")
+        except Exception as e:
+            logger.warning("Error fixing %s: %s", file_path, e,
+                           exc_info=logger.isEnabledFor(logging.DEBUG))
+            return 0
+        
+        return fixed_count
+    
+    def _fix_line_issue(self, lines: List[str], issue: LintIssue) -> bool:
+        """Apply a line-level test performance fix to the in-memory lines"""
+        # Remove t.Parallel() from fuzz tests
+        if issue.rule_id == "TESTPERF_001" and issue.line_number <= len(lines):
+            line = lines[issue.line_number - 1]
+            if 't.Parallel()' in line:
+                # Remove the entire line if it only contains t.Parallel()
+                if line.strip() == 't.Parallel()':
+                    lines.pop(issue.line_number - 1)
+                else:
+                    # Remove just the t.Parallel() call
+                    lines[issue.line_number - 1] = line.replace('t.Parallel()', '').strip() + '\n'
+                return True
         
         return False
\ No newline at end of file
@@ -4,16 +4,54 @@ Catches issues with string length counting, case sensitivity, and text processin
 Based on CodeRabbit issues: Fix #16 (unicode counting), Fix #17 (case-insensitive validation)
 """
 
+import logging
+import mmap
+import os
 import re
 from pathlib import Path
 from typing import List
 
 from ..base_linter import GoLinter, LintIssue, LintSeverity
 
+logger = logging.getLogger(__name__)
+
+_RE_LEN_STRING_LIMIT = re.compile(r'len\([^)]*string[^)]*\)\s*[<>]=?\s*\d+')
+_RE_LEN_GREATER_THAN = re.compile(r'len\([^)]*\)\s*>\s*\d{2,}')
+# String equality comparisons with an enum-like name on either side, which should be case-insensitive
+_RE_ENUM_COMPARISON = re.compile(r'(?i)(?:condition|status|type)\s*==\s*["\'][^"\']*["\']'
+                                 r'|["\'][^"\']*["\']\s*==\s*(?:condition|status|type)')
+_RE_USER_INPUT_VALIDATE = re.compile(r'(?i)(name|email|username|title|description).*validate')
+_RE_MAGIC_LENGTH = re.compile(r'len\([^)]+\)\s*[<>]=?\s*(50|100|200|255|500|1000|2000)')
+_RE_STRING_VALIDATE = re.compile(r'(?i)string.*validate')
+# len() of a string expression, rewritten to utf8.RuneCountInString() by the UNICODE_001 fix
+_RE_LEN_OF_STRING = re.compile(r'len\(([^)]*string[^)]*)\)')
+
+# Every unicode rule needs one of these on a line to fire
+_RE_RULE_TRIGGERS = re.compile(rb'len\(|==|(?i:validate)')
+
+
+# rule_id -> (severity, message, suggestion, auto_fixable)
+_RULES = {
+    "UNICODE_001": (LintSeverity.HIGH, "Using len() for string validation counts bytes, not Unicode characters",
+                    "Use utf8.RuneCountInString() for character count validation", True),
+    "UNICODE_002": (LintSeverity.MEDIUM, "String length check may not handle Unicode correctly",
+                    "Consider using utf8.RuneCountInString() if Unicode support is needed", False),
+    "UNICODE_003": (LintSeverity.MEDIUM, "String comparison should be case-insensitive for enum-like values",
+                    "Use strings.EqualFold() or strings.ToLower() for case-insensitive comparison", False),
+    "UNICODE_004": (LintSeverity.LOW, "User input validation may need Unicode normalization",
+                    "Consider using golang.org/x/text/unicode/norm for consistent text processing", False),
+    "UNICODE_005": (LintSeverity.LOW, "Hardcoded string length limit found",
+                    "Define string length constants with descriptive names", False),
+    "UNICODE_006": (LintSeverity.MEDIUM, "User input validation should check UTF-8 validity",
+                    "Use utf8.ValidString() to ensure valid UTF-8 encoding", False),
+}
+
 
 class UnicodeStringLinter(GoLinter):
     """Linter for Unicode and string handling issues in Go code"""
     
+    rules = _RULES
+    
     def __init__(self):
         super().__init__("unicode_string")
     
@@ -22,159 +60,120 @@ class UnicodeStringLinter(GoLinter):
         issues = []
         
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
-            
-            for line_num, line in enumerate(lines, 1):
-                # Check for incorrect string length counting
-                issues.extend(self._check_string_length_counting(file_path, line_num, line))
-                
-                # Check for case-insensitive string comparisons
-                issues.extend(self._check_case_insensitive_comparisons(file_path, line_num, line))
-                
-                # Check for proper Unicode normalization
-                issues.extend(self._check_unicode_normalization(file_path, line_num, line))
-                
-                # Check for string validation patterns
-                issues.extend(self._check_string_validation_patterns(file_path, line_num, line))
+            with open(file_path, 'rb') as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    return issues
+                # Map the file rather than reading it; only candidate lines get decoded
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                    for line_num, line in self._iter_matching_code_lines(content, _RE_RULE_TRIGGERS):
+                        # Lower-cased once for the case-insensitive keyword checks
+                        lowered = line.lower()
+                        
+                        # Check for incorrect string length counting
+                        self._check_string_length_counting(issues, file_path, line_num, line, lowered)
+                        
+                        # Check for case-insensitive string comparisons
+                        self._check_case_insensitive_comparisons(issues, file_path, line_num, line)
+                        
+                        # Check for proper Unicode normalization
+                        self._check_unicode_normalization(issues, file_path, line_num, line, lowered)
+                        
+                        # Check for string validation patterns
+                        self._check_string_validation_patterns(issues, file_path, line_num, line, lowered)
                 
-        except Exception as e:
-            print(f"Error reading {file_path}: {e}")
+        except (OSError, ValueError) as e:
+            logger.warning("Error reading %s: %s", file_path, e,
+                           exc_info=logger.isEnabledFor(logging.DEBUG))
         
         return issues
     
-    def _check_string_length_counting(self, file_path: Path, line_num: int, line: str) -> List[LintIssue]:
+    def _check_string_length_counting(self, issues: List[LintIssue], file_path: Path, line_num: int,
+                                      line: str, lowered: str) -> None:
         """Check for byte vs character counting issues"""
-        issues = []
+        # Both rules look at len() calls
+        if 'len(' not in line:
+            return
         
         # Check for len() used on strings in validation contexts
-        if re.search(r'len\([^)]*string[^)]*\)\s*[<>]=?\s*\d+', line):
+        if _RE_LEN_STRING_LIMIT.search(line):
             # Look for validation context keywords
             validation_keywords = ['validate', 'check', 'length', 'max', 'min', 'limit']
-            if any(keyword in line.lower() for keyword in validation_keywords):
-                issues.append(self._create_issue(
-                    file_path=file_path,
-                    line_number=line_num,
-                    severity=LintSeverity.HIGH,
-                    rule_id="UNICODE_001",
-                    message="Using len() for string validation counts bytes, not Unicode characters",
-                    suggestion="Use utf8.RuneCountInString() for character count validation",
-                    auto_fixable=True
-                ))
+            if any(keyword in lowered for keyword in validation_keywords):
+                self._emit(issues, "UNICODE_001", file_path, line_num)
         
         # Check for hardcoded byte-based length checks
-        if re.search(r'len\([^)]*\)\s*>\s*\d{2,}', line) and 'string' in line:
-            issues.append(self._create_issue(
-                file_path=file_path,
-                line_number=line_num,
-                severity=LintSeverity.MEDIUM,
-                rule_id="UNICODE_002",
-                message="String length check may not handle Unicode correctly",
-                suggestion="Consider using utf8.RuneCountInString() if Unicode support is needed"
-            ))
-        
-        return issues
+        if _RE_LEN_GREATER_THAN.search(line) and 'string' in line:
+            self._emit(issues, "UNICODE_002", file_path, line_num)
     
-    def _check_case_insensitive_comparisons(self, file_path: Path, line_num: int, line: str) -> List[LintIssue]:
+    def _check_case_insensitive_comparisons(self, issues: List[LintIssue], file_path: Path, line_num: int,
+                                            line: str) -> None:
         """Check for missing case-insensitive string comparisons"""
-        issues = []
+        # Every pattern below is an equality comparison
+        if '==' not in line:
+            return
         
         # Check for string equality comparisons that should be case-insensitive
-        enum_patterns = [
-            r'condition\s*==\s*["\'][^"\']*["\']',
-            r'["\'][^"\']*["\']\s*==\s*condition',
-            r'status\s*==\s*["\'][^"\']*["\']',
-            r'["\'][^"\']*["\']\s*==\s*status',
-            r'type\s*==\s*["\'][^"\']*["\']',
-            r'["\'][^"\']*["\']\s*==\s*type'
-        ]
-        
-        for pattern in enum_patterns:
-            if re.search(pattern, line, re.IGNORECASE):
-                # Check if strings.ToLower or strings.EqualFold is not used
-                if 'strings.ToLower' not in line and 'strings.EqualFold' not in line:
-                    issues.append(self._create_issue(
-                        file_path=file_path,
-                        line_number=line_num,
-                        severity=LintSeverity.MEDIUM,
-                        rule_id="UNICODE_003",
-                        message="String comparison should be case-insensitive for enum-like values",
-                        suggestion="Use strings.EqualFold() or strings.ToLower() for case-insensitive comparison"
-                    ))
-        
-        return issues
+        if _RE_ENUM_COMPARISON.search(line):
+            # Check if strings.ToLower or strings.EqualFold is not used
+            if 'strings.ToLower' not in line and 'strings.EqualFold' not in line:
+                self._emit(issues, "UNICODE_003", file_path, line_num)
     
-    def _check_unicode_normalization(self, file_path: Path, line_num: int, line: str) -> List[LintIssue]:
+    def _check_unicode_normalization(self, issues: List[LintIssue], file_path: Path, line_num: int,
+                                     line: str, lowered: str) -> None:
         """Check for Unicode normalization issues"""
-        issues = []
-        
         # Check for user input validation without normalization
-        if re.search(r'(name|email|username|title|description).*validate', line, re.IGNORECASE):
-            if 'norm' not in line.lower() and 'unicode' not in line.lower():
-                issues.append(self._create_issue(
-                    file_path=file_path,
-                    line_number=line_num,
-                    severity=LintSeverity.LOW,
-                    rule_id="UNICODE_004",
-                    message="User input validation may need Unicode normalization",
-                    suggestion="Consider using golang.org/x/text/unicode/norm for consistent text processing"
-                ))
-        
-        return issues
+        if _RE_USER_INPUT_VALIDATE.search(line):
+            if 'norm' not in lowered and 'unicode' not in lowered:
+                self._emit(issues, "UNICODE_004", file_path, line_num)
     
-    def _check_string_validation_patterns(self, file_path: Path, line_num: int, line: str) -> List[LintIssue]:
+    def _check_string_validation_patterns(self, issues: List[LintIssue], file_path: Path, line_num: int,
+                                          line: str, lowered: str) -> None:
         """Check for common string validation anti-patterns"""
-        issues = []
-        
         # Check for hardcoded magic numbers in string validation
-        if re.search(r'len\([^)]+\)\s*[<>]=?\s*(50|100|200|255|500|1000|2000)', line):
-            issues.append(self._create_issue(
-                file_path=file_path,
-                line_number=line_num,
-                severity=LintSeverity.LOW,
-                rule_id="UNICODE_005",
-                message="Hardcoded string length limit found",
-                suggestion="Define string length constants with descriptive names"
-            ))
+        if 'len(' in line and _RE_MAGIC_LENGTH.search(line):
+            self._emit(issues, "UNICODE_005", file_path, line_num)
         
         # Check for missing UTF-8 validity checks
-        if re.search(r'string.*validate', line, re.IGNORECASE) and 'utf8.Valid' not in line:
-            if 'user' in line.lower() or 'input' in line.lower():
-                issues.append(self._create_issue(
-                    file_path=file_path,
-                    line_number=line_num,
-                    severity=LintSeverity.MEDIUM,
-                    rule_id="UNICODE_006",
-                    message="User input validation should check UTF-8 validity",
-                    suggestion="Use utf8.ValidString() to ensure valid UTF-8 encoding"
-                ))
-        
-        return issues
+        if _RE_STRING_VALIDATE.search(line) and 'utf8.Valid' not in line:
+            if 'user' in lowered or 'input' in lowered:
+                self._emit(issues, "UNICODE_006", file_path, line_num)
     
     def _fix_issue(self, issue: LintIssue) -> bool:
         """Auto-fix specific Unicode issues"""
-        if issue.rule_id == "UNICODE_001":
-            try:
-                with open(issue.file_path, 'r', encoding='utf-8') as f:
-                    lines = f.readlines()
-                
-                line = lines[issue.line_number - 1]
-                # Replace len(string) with utf8.RuneCountInString(string) in validation contexts
-                fixed_line = re.sub(
-                    r'len\(([^)]*string[^)]*)\)',
-                    r'utf8.RuneCountInString(\1)',
-                    line
-                )
+        return self._fix_issues_for_file(issue.file_path, [issue]) > 0
+    
+    def _fix_issues_for_file(self, file_path: Path, issues: List[LintIssue]) -> int:
+        """Auto-fix all Unicode issues in one file with a single read and write"""
+        fixed_count = 0
+        
+        try:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                lines = f.readlines()
+            
+            for issue in issues:
+                if self._fix_line_issue(lines, issue):
+                    fixed_count += 1
+            
+            if fixed_count:
+                with open(file_path, 'w', encoding='utf-8') as f:
+                    f.writelines(lines)
                 
-                if fixed_line != line:
-                    lines[issue.line_number - 1] = fixed_line
-                    
-                    with open(issue.file_path, 'w', encoding='utf-8') as f:
-                        f.writelines(lines)
-                    
-                    return True
-                        
-            except Exception as e:
-                print(f"Error fixing {issue.file_path}: {e}")
+        except Exception as e:
+            logger.warning("Error fixing %s: %s", file_path, e,
+                           exc_info=logger.isEnabledFor(logging.DEBUG))
+            return 0
+        
+        return fixed_count
+    
+    def _fix_line_issue(self, lines: List[str], issue: LintIssue) -> bool:
+        """Apply a line-level Unicode fix to the in-memory lines"""
+        if issue.rule_id == "UNICODE_001" and issue.line_number <= len(lines):
+            line = lines[issue.line_number - 1]
+            # Replace len(string) with utf8.RuneCountInString(string) in validation contexts
+            fixed_line = _RE_LEN_OF_STRING.sub(r'utf8.RuneCountInString(\1)', line)
+            
+            if fixed_line != line:
+                lines[issue.line_number - 1] = fixed_line
+                return True
         
         return False
\ No newline at end of file
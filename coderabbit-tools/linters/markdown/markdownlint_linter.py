@@ -2,13 +2,142 @@
 Markdown linter that integrates with markdownlint-cli
 """
 
-import json
+import hashlib
+import os
+import re
 import subprocess
 import shutil
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import List
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
 
-from ..base_linter import MarkdownLinter, LintIssue, LintSeverity
+from ..base_linter import MarkdownLinter, LintIssue, LintSeverity, _linter_fingerprint
+
+try:
+    # orjson decodes the JSON report several times faster, straight from bytes
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+# Smallest batch worth its own markdownlint process (each one pays Node.js startup)
+MIN_BATCH_FILES = 16
+
+# Files markdownlint-cli reads its configuration and ignore list from, in the directory it runs in
+CONFIG_FILES = ('.markdownlint.jsonc', '.markdownlint.json', '.markdownlint.yaml', '.markdownlint.yml',
+                '.markdownlintrc', '.markdownlintignore')
+
+# One text-format result: "path:line[:column] MD010/no-hard-tabs Description [Detail]"
+_RE_STDERR_ISSUE = re.compile(rb'(?P<path>.+?):(?P<line>\d+)(?::\d+)?(?::\s*|\s+)'
+                              rb'(?P<rule>[^\s/]+)\S*\s*(?P<message>.*)')
+
+# A blank line followed by more blank lines; the MD012 fix keeps only the first
+_RE_BLANK_LINE_RUN = re.compile(r'(?m)^([^\S\n]*\n)(?:[^\S\n]*(?:\n|\Z))+')
+
+# High priority: structural issues that affect readability
+_HIGH_PRIORITY_RULES = frozenset({
+    'MD001',  # Header levels increment by one
+    'MD003',  # Header style consistency
+    'MD022',  # Headers surrounded by blank lines
+    'MD025',  # Multiple top-level headers
+    'MD026',  # Trailing punctuation in headers
+})
+
+# Medium priority: formatting and consistency
+_MEDIUM_PRIORITY_RULES = frozenset({
+    'MD004',  # Unordered list style
+    'MD005',  # Inconsistent indentation for list items
+    'MD007',  # Unordered list indentation
+    'MD009',  # Trailing spaces
+    'MD010',  # Hard tabs
+    'MD011',  # Reversed link syntax
+    'MD012',  # Multiple consecutive blank lines
+    'MD013',  # Line length
+    'MD018',  # No space after hash on atx style header
+    'MD019',  # Multiple spaces after hash on atx style header
+    'MD023',  # Headers must start at the beginning of the line
+    'MD029',  # Ordered list item prefix
+    'MD030',  # Spaces after list markers
+    'MD032',  # Lists should be surrounded by blank lines
+    'MD034',  # Bare URLs used
+    'MD037',  # Spaces inside emphasis markers
+    'MD038',  # Spaces inside code span elements
+    'MD039',  # Spaces inside link text
+    'MD040',  # Fenced code blocks should have a language specified
+    'MD046',  # Code block style
+    'MD047',  # Files should end with a single newline character
+})
+
+# Specific suggestions for common markdownlint rules
+_RULE_SUGGESTIONS = {
+    'MD001': 'Use incremental header levels (# then ## then ###)',
+    'MD003': 'Use consistent header style throughout the document',
+    'MD004': 'Use consistent marker for unordered lists (* or - or +)',
+    'MD009': 'Remove trailing spaces from lines',
+    'MD010': 'Replace hard tabs with spaces',
+    'MD012': 'Remove multiple consecutive blank lines',
+    'MD013': 'Break long lines or increase line length limit',
+    'MD022': 'Add blank lines around headers',
+    'MD025': 'Use only one top-level header per document',
+    'MD034': 'Use link syntax [text](url) instead of bare URLs',
+    'MD040': 'Add language identifier to fenced code blocks',
+    'MD047': 'Add single newline at end of file',
+}
+
+# Rules _fix_issue knows how to fix
+_AUTO_FIXABLE_RULES = frozenset({'MD047', 'MD012', 'MD010'})
+
+
+@lru_cache(maxsize=None)
+def _argv_budget() -> int:
+    """Bytes of file arguments one markdownlint command line can take"""
+    try:
+        arg_max = os.sysconf('SC_ARG_MAX')
+    except (AttributeError, ValueError, OSError):
+        # No sysconf (Windows): CreateProcess limits the command line to 32767 characters
+        arg_max = 32767
+    # The environment counts against the same limit; keep half of what is left as headroom
+    environ_size = sum(len(key) + len(value) + 2 for key, value in os.environ.items())
+    return max((arg_max - environ_size) // 2, 4096)
+
+
+def _argv_batches(markdown_files: List[Path]) -> Iterator[List[Path]]:
+    """Split files into runs whose paths fit on one markdownlint command line"""
+    budget = _argv_budget()
+    batch = []
+    batch_size = 0
+    for file_path in markdown_files:
+        # The path, its terminating NUL and its argv pointer
+        arg_size = len(os.fsencode(file_path)) + 9
+        if batch and batch_size + arg_size > budget:
+            yield batch
+            batch = []
+            batch_size = 0
+        batch.append(file_path)
+        batch_size += arg_size
+    if batch:
+        yield batch
+
+
+@lru_cache(maxsize=None)
+def _markdownlint_version() -> str:
+    """Version reported by the installed markdownlint-cli ('' if it cannot be run)"""
+    try:
+        return subprocess.run(['markdownlint', '--version'], capture_output=True, text=True).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return ''
+
+
+def _config_digest(project_path: Path) -> bytes:
+    """Digest of the markdownlint configuration in effect for a project"""
+    digest = hashlib.blake2b(digest_size=16)
+    for name in CONFIG_FILES:
+        try:
+            with open(project_path / name, 'rb') as f:
+                digest.update(name.encode() + b'\0' + hashlib.blake2b(f.read(), digest_size=16).digest())
+        except OSError:
+            pass
+    return digest.digest()
 
 
 class MarkdownLintLinter(MarkdownLinter):
@@ -24,44 +153,123 @@ class MarkdownLintLinter(MarkdownLinter):
     
     def lint(self, project_path: Path) -> List[LintIssue]:
         """Run markdownlint on all markdown files"""
+        return list(self.lint_iter(project_path))
+    
+    def lint_iter(self, project_path: Path) -> Iterator[LintIssue]:
+        """Run markdownlint on all markdown files, yielding issues as each batch of files is linted"""
         if not self.markdownlint_available:
             print("Warning: markdownlint-cli not found. Install with: npm install -g markdownlint-cli")
-            return []
-        
-        all_issues = []
+            return
         
         # Find all markdown files
-        markdown_files = []
-        for pattern in self.file_patterns:
-            for file_path in project_path.rglob(pattern):
-                if not self._should_skip_file(file_path):
-                    markdown_files.append(file_path)
+        markdown_files = self._collect_files(project_path)
+        
+        cache_entries = {}
+        if markdown_files and self.cache_dir is not None:
+            # Only files without persisted issues for their current content are linted
+            markdown_files, cached_issues, cache_entries = self._partition_cached(markdown_files, project_path)
+            yield from cached_issues
         
-        if not markdown_files:
+        if markdown_files:
+            yield from self._iter_batches(markdown_files, project_path, cache_entries)
+    
+    def lint_files(self, paths: Sequence[Path]) -> List[LintIssue]:
+        """Lint a set of markdown files as lint_file() would, sharing markdownlint processes between them"""
+        if not self.markdownlint_available or not paths:
             return []
         
-        # Run markdownlint
+        # Like lint_file(), markdownlint runs in the current directory
+        return list(self._iter_batches(list(paths), None, {}))
+    
+    def _iter_batches(self, markdown_files: List[Path], project_path: Optional[Path],
+                      cache_entries: Dict[Path, Path]) -> Iterator[LintIssue]:
+        """Run markdownlint over files, in parallel batches when there are enough of them"""
+        # markdownlint is single-threaded, so larger sets of files are split into one
+        # batch per core, each linted by its own markdownlint process
+        workers = min(os.cpu_count() or 1, -(-len(markdown_files) // MIN_BATCH_FILES))
+        batch_size = -(-len(markdown_files) // workers)
+        # Each batch is split further where its paths would overflow the command line
+        batches = [batch for i in range(0, len(markdown_files), batch_size)
+                   for batch in _argv_batches(markdown_files[i:i + batch_size])]
+        
+        if workers <= 1:
+            for batch in batches:
+                yield from self._run_markdownlint(batch, project_path, cache_entries)
+            return
+        
+        # Threads suffice, as the work happens in the child processes
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for batch_issues in executor.map(
+                    lambda batch: self._run_markdownlint(batch, project_path, cache_entries), batches):
+                yield from batch_issues
+    
+    def _partition_cached(self, markdown_files: List[Path],
+                          project_path: Path) -> Tuple[List[Path], List[LintIssue], Dict[Path, Path]]:
+        """Split files into those with cached issues for their current content and the rest
+        
+        Returns the files still to lint, the cached issues of the others, and
+        the cache entry each file still to lint should be stored under.
+        """
+        # Results also depend on the markdownlint version and the project's configuration
+        identity = (_linter_fingerprint(type(self)) + b'\0' + _markdownlint_version().encode() + b'\0'
+                    + _config_digest(project_path) + b'\0')
+        to_lint = []
+        cached_issues = []
+        cache_entries = {}
+        
+        for file_path in markdown_files:
+            try:
+                with open(file_path, 'rb') as f:
+                    content_digest = hashlib.blake2b(f.read(), digest_size=16).digest()
+            except OSError:
+                to_lint.append(file_path)
+                continue
+            
+            entry = self._cache_entry(identity + os.path.abspath(file_path).encode('utf-8', 'surrogateescape')
+                                      + b'\0' + content_digest)
+            issues = self._load_cached_issues(entry, file_path)
+            if issues is None:
+                to_lint.append(file_path)
+                cache_entries[file_path] = entry
+            else:
+                cached_issues.extend(issues)
+        
+        return to_lint, cached_issues, cache_entries
+    
+    def _store_batch_issues(self, markdown_files: List[Path], issues: List[LintIssue],
+                            cache_entries: Dict[Path, Path]) -> None:
+        """Persist a linted batch's issues per file, including files without any"""
+        issues_by_file = {file_path: [] for file_path in markdown_files if file_path in cache_entries}
+        for issue in issues:
+            if issue.file_path not in issues_by_file:
+                # Reported under a path we did not pass - don't risk caching a file as clean
+                return
+            issues_by_file[issue.file_path].append(issue)
+        
+        for file_path, file_issues in issues_by_file.items():
+            self._store_cached_issues(cache_entries[file_path], file_issues)
+    
+    def _run_markdownlint(self, markdown_files: List[Path], project_path: Optional[Path],
+                          cache_entries: Dict[Path, Path]) -> List[LintIssue]:
+        """Run markdownlint once over a batch of markdown files, caching the results of a completed run
+        
+        markdownlint runs in project_path, or in the current directory if that is None.
+        """
+        all_issues = []
+        
         try:
             # Use --json flag for structured output
             cmd = ['markdownlint', '--json'] + [str(f) for f in markdown_files]
-            result = subprocess.run(cmd, capture_output=True, text=True, cwd=project_path)
+            # Raw bytes: the JSON decoder takes them as is, and stderr is parsed without decoding
+            result = subprocess.run(cmd, capture_output=True, cwd=project_path)
             
-            if result.stdout:
-                # Parse JSON output
-                try:
-                    lint_results = json.loads(result.stdout)
-                    # Validate that lint_results is a proper dictionary
-                    if isinstance(lint_results, dict):
-                        all_issues.extend(self._parse_markdownlint_output(lint_results, project_path))
-                    else:
-                        # If not a dict, try parsing stderr instead
-                        all_issues.extend(self._parse_markdownlint_stderr(result.stderr, project_path))
-                except json.JSONDecodeError:
-                    # Fallback to stderr parsing if JSON failed
-                    all_issues.extend(self._parse_markdownlint_stderr(result.stderr, project_path))
-            elif result.stderr:
-                # Parse stderr output (non-JSON format)
-                all_issues.extend(self._parse_markdownlint_stderr(result.stderr, project_path))
+            all_issues = self._parse_result(result, project_path)
+            
+            # markdownlint exits with 1 when it found issues; any other failure is not
+            # cached, nor is exit code 1 with output that yielded no issues (an
+            # unrecognized format), which would otherwise mark every file clean
+            if cache_entries and (result.returncode == 0 or (result.returncode == 1 and all_issues)):
+                self._store_batch_issues(markdown_files, all_issues, cache_entries)
                 
         except subprocess.SubprocessError as e:
             print(f"Error running markdownlint: {e}")
@@ -75,25 +283,33 @@ class MarkdownLintLinter(MarkdownLinter):
         
         try:
             cmd = ['markdownlint', '--json', str(file_path)]
-            result = subprocess.run(cmd, capture_output=True, text=True)
-            
-            if result.stdout:
-                try:
-                    lint_results = json.loads(result.stdout)
-                    return self._parse_markdownlint_output(lint_results, file_path.parent)
-                except json.JSONDecodeError:
-                    return self._parse_markdownlint_stderr(result.stderr, file_path.parent)
-            elif result.stderr:
-                return self._parse_markdownlint_stderr(result.stderr, file_path.parent)
+            result = subprocess.run(cmd, capture_output=True)
+            return self._parse_result(result, file_path.parent)
                 
         except subprocess.SubprocessError:
             pass
         
         return []
     
+    def _parse_result(self, result: subprocess.CompletedProcess, project_path: Optional[Path]) -> List[LintIssue]:
+        """Parse a markdownlint run's issues from its JSON report, or from its text output without one"""
+        if result.stdout:
+            try:
+                lint_results = _json_loads(result.stdout)
+            except ValueError:
+                # Either decoder's error is a ValueError
+                lint_results = None
+            # Anything but the expected {path: [issue, ...]} mapping is not a report
+            if isinstance(lint_results, dict):
+                return self._parse_markdownlint_output(lint_results, project_path)
+        
+        return self._parse_markdownlint_stderr(result.stderr, project_path)
+    
     def _parse_markdownlint_output(self, lint_results: dict, project_path: Path) -> List[LintIssue]:
         """Parse JSON output from markdownlint"""
         issues = []
+        # (severity, suggestion, auto_fixable) per rule; a report names far fewer rules than issues
+        rule_info = {}
         
         for file_path_str, file_issues in lint_results.items():
             # Skip if file_issues is not a list (could be malformed JSON)
@@ -101,10 +317,11 @@ class MarkdownLintLinter(MarkdownLinter):
                 continue
             
             # Validate that file_path_str looks like a valid file path
-            if not file_path_str or file_path_str.startswith('"') or not Path(file_path_str).suffix:
+            if not file_path_str or file_path_str.startswith('"'):
                 continue
-                
             file_path = Path(file_path_str)
+            if not file_path.suffix:
+                continue
             
             for issue in file_issues:
                 # Skip if issue is not a dictionary
@@ -125,10 +342,12 @@ class MarkdownLintLinter(MarkdownLinter):
                 if detail:
                     message += f": {detail}"
                 
-                # Map rule severity
-                severity = self._map_rule_severity(rule_id)
-                
-                suggestion = self._get_rule_suggestion(rule_id, issue)
+                info = rule_info.get(rule_id)
+                if info is None:
+                    info = rule_info[rule_id] = (self._map_rule_severity(rule_id),
+                                                 self._get_rule_suggestion(rule_id, issue),
+                                                 rule_id in _AUTO_FIXABLE_RULES)
+                severity, suggestion, auto_fixable = info
                 
                 issues.append(self._create_issue(
                     file_path=file_path,
@@ -137,32 +356,28 @@ class MarkdownLintLinter(MarkdownLinter):
                     rule_id=rule_id,
                     message=message,
                     suggestion=suggestion,
-                    auto_fixable=rule_id in ['MD047', 'MD012', 'MD010']  # Some auto-fixable rules
+                    auto_fixable=auto_fixable
                 ))
         
         return issues
     
-    def _parse_markdownlint_stderr(self, stderr: str, project_path: Path) -> List[LintIssue]:
-        """Parse text output from markdownlint stderr"""
+    def _parse_markdownlint_stderr(self, stderr: bytes, project_path: Path) -> List[LintIssue]:
+        """Parse text output from markdownlint stderr (only matched fields are decoded)"""
         issues = []
+        # Text output repeats the path on every line, so each is decoded and built once
+        file_paths = {}
         
-        for line in stderr.strip().split('\n'):
-            if not line.strip():
-                continue
-                
-            # Format: filename:line_number rule_id description
-            parts = line.split(':', 3)
-            if len(parts) >= 3:
-                file_path = Path(parts[0])
-                try:
-                    line_number = int(parts[1])
-                except ValueError:
-                    line_number = 1
-                
-                rule_and_desc = parts[2] if len(parts) > 2 else 'unknown issue'
-                rule_parts = rule_and_desc.strip().split(' ', 1)
-                rule_id = rule_parts[0] if rule_parts else 'unknown'
-                message = rule_parts[1] if len(rule_parts) > 1 else 'Markdown issue'
+        for line in stderr.splitlines():
+            # Lines that are not results (summaries, Node.js warnings) are skipped
+            match = _RE_STDERR_ISSUE.match(line)
+            if match:
+                raw_path = match.group('path')
+                file_path = file_paths.get(raw_path)
+                if file_path is None:
+                    file_path = file_paths[raw_path] = Path(os.fsdecode(raw_path))
+                line_number = int(match.group('line'))
+                rule_id = match.group('rule').decode('utf-8', 'replace')
+                message = match.group('message').decode('utf-8', 'replace') or 'Markdown issue'
                 
                 severity = self._map_rule_severity(rule_id)
                 suggestion = self._get_rule_suggestion(rule_id, {})
@@ -180,105 +395,58 @@ class MarkdownLintLinter(MarkdownLinter):
     
     def _map_rule_severity(self, rule_id: str) -> LintSeverity:
         """Map markdownlint rule IDs to severity levels"""
-        # High priority: structural issues that affect readability
-        high_priority_rules = {
-            'MD001',  # Header levels increment by one
-            'MD003',  # Header style consistency
-            'MD022',  # Headers surrounded by blank lines
-            'MD025',  # Multiple top-level headers
-            'MD026',  # Trailing punctuation in headers
-        }
-        
-        # Medium priority: formatting and consistency
-        medium_priority_rules = {
-            'MD004',  # Unordered list style
-            'MD005',  # Inconsistent indentation for list items
-            'MD007',  # Unordered list indentation
-            'MD009',  # Trailing spaces
-            'MD010',  # Hard tabs
-            'MD011',  # Reversed link syntax
-            'MD012',  # Multiple consecutive blank lines
-            'MD013',  # Line length
-            'MD018',  # No space after hash on atx style header
-            'MD019',  # Multiple spaces after hash on atx style header
-            'MD023',  # Headers must start at the beginning of the line
-            'MD029',  # Ordered list item prefix
-            'MD030',  # Spaces after list markers
-            'MD032',  # Lists should be surrounded by blank lines
-            'MD034',  # Bare URLs used
-            'MD037',  # Spaces inside emphasis markers
-            'MD038',  # Spaces inside code span elements
-            'MD039',  # Spaces inside link text
-            'MD040',  # Fenced code blocks should have a language specified
-            'MD046',  # Code block style
-            'MD047',  # Files should end with a single newline character
-        }
-        
-        if rule_id in high_priority_rules:
+        if rule_id in _HIGH_PRIORITY_RULES:
             return LintSeverity.HIGH
-        elif rule_id in medium_priority_rules:
+        elif rule_id in _MEDIUM_PRIORITY_RULES:
             return LintSeverity.MEDIUM
         else:
             return LintSeverity.LOW
     
     def _get_rule_suggestion(self, rule_id: str, issue: dict) -> str:
         """Get specific suggestions for common markdownlint rules"""
-        suggestions = {
-            'MD001': 'Use incremental header levels (# then ## then ###)',
-            'MD003': 'Use consistent header style throughout the document',
-            'MD004': 'Use consistent marker for unordered lists (* or - or +)',
-            'MD009': 'Remove trailing spaces from lines',
-            'MD010': 'Replace hard tabs with spaces',
-            'MD012': 'Remove multiple consecutive blank lines',
-            'MD013': 'Break long lines or increase line length limit',
-            'MD022': 'Add blank lines around headers',
-            'MD025': 'Use only one top-level header per document',
-            'MD034': 'Use link syntax [text](url) instead of bare URLs',
-            'MD040': 'Add language identifier to fenced code blocks',
-            'MD047': 'Add single newline at end of file',
-        }
-        
-        return suggestions.get(rule_id, 'Check markdownlint documentation for details')
+        return _RULE_SUGGESTIONS.get(rule_id, 'Check markdownlint documentation for details')
     
     def _fix_issue(self, issue: LintIssue) -> bool:
         """Auto-fix certain markdown issues"""
         if not issue.auto_fixable:
             return False
         
+        return self._fix_issues_for_file(issue.file_path, [issue]) > 0
+    
+    def _fix_issues_for_file(self, file_path: Path, issues: List[LintIssue]) -> int:
+        """Auto-fix all markdown issues in one file with a single read and write"""
+        fixed_count = 0
+        
         try:
-            with open(issue.file_path, 'r', encoding='utf-8') as f:
-                lines = f.readlines()
+            content = file_path.read_text(encoding='utf-8')
             
-            if issue.rule_id == 'MD047':  # File should end with newline
-                if lines and not lines[-1].endswith('\n'):
-                    lines[-1] += '\n'
-                    with open(issue.file_path, 'w', encoding='utf-8') as f:
-                        f.writelines(lines)
-                    return True
+            # Every fix is idempotent and none undoes another, so each rule is applied
+            # once however often it was reported, and counts once if it changed anything
+            for rule_id in {issue.rule_id for issue in issues}:
+                new_content = self._fix_rule_content(content, rule_id)
+                if new_content != content:
+                    content = new_content
+                    fixed_count += 1
             
-            elif issue.rule_id == 'MD012':  # Multiple consecutive blank lines
-                # Remove extra blank lines
-                new_lines = []
-                prev_blank = False
-                for line in lines:
-                    is_blank = line.strip() == ''
-                    if not (is_blank and prev_blank):
-                        new_lines.append(line)
-                    prev_blank = is_blank
-                
-                if new_lines != lines:
-                    with open(issue.file_path, 'w', encoding='utf-8') as f:
-                        f.writelines(new_lines)
-                    return True
-            
-            elif issue.rule_id == 'MD010':  # Hard tabs
-                new_lines = [line.replace('\t', '    ') for line in lines]
-                if new_lines != lines:
-                    with open(issue.file_path, 'w', encoding='utf-8') as f:
-                        f.writelines(new_lines)
-                    return True
+            if fixed_count:
+                file_path.write_text(content, encoding='utf-8')
                     
         except Exception:
-            pass
+            return 0
+        
+        return fixed_count
+    
+    def _fix_rule_content(self, content: str, rule_id: str) -> str:
+        """Return the file content with one rule fixed (the same content if there is nothing to fix)"""
+        if rule_id == 'MD047':  # File should end with newline
+            if content and not content.endswith('\n'):
+                return content + '\n'
+        
+        elif rule_id == 'MD012':  # Multiple consecutive blank lines
+            # Keep the first line of each run of blank (whitespace-only) lines
+            return _RE_BLANK_LINE_RUN.sub(r'\1', content)
+        
+        elif rule_id == 'MD010':  # Hard tabs
+            return content.replace('\t', '    ')
         
-        return False
\ No newline at end of file
+        return content
\ No newline at end of file
@@ -10,6 +10,59 @@ from typing import List
 
 from ..base_linter import NodeJSLinter, LintIssue, LintSeverity
 
+# Any of these means the file contains JSX
+_JSX_PATTERNS = (
+    re.compile(r'<\w+[^>]*>'),  # JSX tags
+    re.compile(r'</\w+>'),      # Closing JSX tags
+    re.compile(r'React\.createElement'),
+    re.compile(r'jsx\s*\('),
+)
+
+_RE_IMG_TAG = re.compile(r'<img\s+')
+_RE_EMPTY_ALT = re.compile(r'alt\s*=\s*[\'\"]\s*[\'\""]')
+_RE_BACKGROUND_IMAGE = re.compile(r'backgroundImage\s*:')
+_RE_BACKGROUND_URL = re.compile(r'background.*url\(')
+
+# div/span/p with click handlers (should be button/link); the lookahead keeps the match to the
+# tag name, so findall sees every kind of element on the line even when their tags overlap
+_RE_CLICKABLE_ELEMENT = re.compile(r'<(div|span|p)(?=[^>]*onClick)')
+_RE_BUTTON_OR_LINK_ROLE = re.compile(r'role\s*=\s*[\'\"](button|link)')
+_RE_BUTTON_TAG = re.compile(r'<button[^>]*>')
+_RE_LINK_TAG = re.compile(r'<a\s+')
+_RE_ARIA_LABEL = re.compile(r'aria-label\s*=')
+_RE_ARIA_LABEL_OR_LABELLEDBY = re.compile(r'aria-label\s*=|aria-labelledby\s*=')
+# Text content or an interpolated expression after a tag
+_RE_TEXT_CONTENT = re.compile(r'>\s*\w+|{\w+}')
+
+_RE_INPUT_TAG = re.compile(r'<input\s+')
+_RE_FORM_TAG = re.compile(r'<form\s*>|<form\s+[^>]*>')
+_RE_SELECT_TAG = re.compile(r'<select\s+')
+
+_RE_HEADING_TAG = re.compile(r'<h([1-6])')
+_VALID_ARIA_ATTRS = frozenset({
+    'label', 'labelledby', 'describedby', 'hidden', 'expanded', 'controls',
+    'haspopup', 'selected', 'checked', 'disabled', 'required', 'invalid',
+    'live', 'atomic', 'relevant', 'busy', 'dropeffect', 'grabbed',
+    'activedescendant', 'owns', 'flowto', 'level', 'multiline',
+    'multiselectable', 'orientation', 'readonly', 'sort', 'valuemax',
+    'valuemin', 'valuenow', 'valuetext', 'autocomplete', 'keyshortcuts',
+    'roledescription', 'placeholder', 'posinset', 'setsize'
+})
+# aria-* attributes whose name is not one of the valid ones
+_RE_INVALID_ARIA_ATTR = re.compile(r'aria-(?!(?:%s)\b)(\w+)\s*=' % '|'.join(sorted(_VALID_ARIA_ATTRS)))
+_RE_REDUNDANT_BUTTON_ROLE = re.compile(r'<button[^>]*role\s*=\s*[\'\""]button[\'\""]')
+
+# Hardcoded colors that might have contrast issues, each reported separately
+_COLOR_PATTERNS = (
+    re.compile(r'color\s*:\s*[\'\""]#[a-fA-F0-9]{3,6}[\'\""]'),
+    re.compile(r'backgroundColor\s*:\s*[\'\""]#[a-fA-F0-9]{3,6}[\'\""]'),
+    re.compile(r'style.*color.*#[a-fA-F0-9]{3,6}'),
+)
+
+_RE_INTERACTIVE_TAG = re.compile(r'<(button|a|input|select|textarea)')
+_RE_TABINDEX = re.compile(r'tabIndex\s*=\s*[\'\""]?(\d+)[\'\""]?')
+_RE_DISPLAY_NONE = re.compile(r'display\s*:\s*[\'\""]none[\'\""]')
+
 
 class AccessibilityLinter(NodeJSLinter):
     """Linter for accessibility (a11y) issues"""
@@ -33,16 +86,20 @@ class AccessibilityLinter(NodeJSLinter):
             if not self._contains_jsx(content):
                 return []
                 
-            # Check for various accessibility issues
-            issues.extend(self._check_missing_alt_text(file_path, lines))
-            issues.extend(self._check_interactive_elements(file_path, lines))
-            issues.extend(self._check_form_accessibility(file_path, lines))
-            issues.extend(self._check_semantic_html(file_path, lines))
-            issues.extend(self._check_aria_attributes(file_path, lines))
-            issues.extend(self._check_color_contrast(file_path, lines))
-            issues.extend(self._check_keyboard_navigation(file_path, lines))
-            issues.extend(self._check_focus_management(file_path, lines))
-            issues.extend(self._check_screen_reader_support(file_path, lines))
+            # Check for various accessibility issues, all per-line checks in one pass
+            for line_num, line in enumerate(lines, 1):
+                self._check_missing_alt_text(issues, file_path, line_num, line)
+                self._check_interactive_elements(issues, file_path, line_num, line, lines)
+                self._check_form_accessibility(issues, file_path, line_num, line, lines)
+                self._check_semantic_html(issues, file_path, line_num, line)
+                self._check_aria_attributes(issues, file_path, line_num, line)
+                self._check_color_contrast(issues, file_path, line_num, line)
+                self._check_keyboard_navigation(issues, file_path, line_num, line)
+                self._check_screen_reader_support(issues, file_path, line_num, line)
+            
+            # File-level checks
+            self._check_main_landmark(issues, file_path, content)
+            self._check_focus_management(issues, file_path, content)
             
         except Exception as e:
             print(f"Error reading {file_path}: {e}")
@@ -51,332 +108,271 @@ class AccessibilityLinter(NodeJSLinter):
     
     def _contains_jsx(self, content: str) -> bool:
         """Check if file contains JSX"""
-        jsx_patterns = [
-            r'<\w+[^>]*>',  # JSX tags
-            r'</\w+>',      # Closing JSX tags
-            r'React\.createElement',
-            r'jsx\s*\(',
-        ]
-        
-        return any(re.search(pattern, content) for pattern in jsx_patterns)
+        return any(pattern.search(content) for pattern in _JSX_PATTERNS)
     
-    def _check_missing_alt_text(self, file_path: Path, lines: List[str]) -> List[LintIssue]:
+    def _check_missing_alt_text(self, issues: List[LintIssue], file_path: Path, line_num: int,
+                                line: str) -> None:
         """Check for images missing alt text"""
-        issues = []
+        # Check for img tags without alt attribute
+        if _RE_IMG_TAG.search(line) and 'alt=' not in line:
+            issues.append(self._create_issue(
+                file_path=file_path,
+                line_number=line_num,
+                severity=LintSeverity.HIGH,
+                rule_id="a11y-missing-alt",
+                message="Image missing alt attribute",
+                suggestion="Add alt attribute with descriptive text, or alt=\"\" for decorative images"
+            ))
+        
+        # Check for img with empty alt but no role="presentation"
+        if _RE_EMPTY_ALT.search(line) and 'role=' not in line:
+            issues.append(self._create_issue(
+                file_path=file_path,
+                line_number=line_num,
+                severity=LintSeverity.MEDIUM,
+                rule_id="a11y-empty-alt",
+                message="Image with empty alt should have role=\"presentation\" for clarity",
+                suggestion="Add role=\"presentation\" to indicate decorative image"
+            ))
         
-        for line_num, line in enumerate(lines, 1):
-            # Check for img tags without alt attribute
-            if re.search(r'<img\s+', line) and 'alt=' not in line:
+        # Check for background images in CSS without text alternatives
+        if _RE_BACKGROUND_IMAGE.search(line) or _RE_BACKGROUND_URL.search(line):
+            issues.append(self._create_issue(
+                file_path=file_path,
+                line_number=line_num,
+                severity=LintSeverity.MEDIUM,
+                rule_id="a11y-background-image",
+                message="Background images are not accessible to screen readers",
+                suggestion="Consider using <img> with alt text or provide alternative text content"
+            ))
+    
+    def _check_interactive_elements(self, issues: List[LintIssue], file_path: Path, line_num: int,
+                                    line: str, lines: List[str]) -> None:
+        """Check interactive elements for accessibility"""
+        # Check for div/span with click handlers (should be button/link), once per kind of element
+        clickable_tags = set(_RE_CLICKABLE_ELEMENT.findall(line))
+        # Check if it has proper accessibility attributes
+        if clickable_tags and not _RE_BUTTON_OR_LINK_ROLE.search(line):
+            for _ in clickable_tags:
                 issues.append(self._create_issue(
                     file_path=file_path,
                     line_number=line_num,
                     severity=LintSeverity.HIGH,
-                    rule_id="a11y-missing-alt",
-                    message="Image missing alt attribute",
-                    suggestion="Add alt attribute with descriptive text, or alt=\"\" for decorative images"
+                    rule_id="a11y-interactive-element",
+                    message="Interactive element should be a button or link, or have proper role",
+                    suggestion="Use <button> or <a>, or add role=\"button\" and keyboard event handlers"
                 ))
-            
-            # Check for img with empty alt but no role="presentation"
-            if re.search(r'alt\s*=\s*[\'\"]\s*[\'\""]', line) and 'role=' not in line:
+        
+        # Check for buttons without accessible text
+        if _RE_BUTTON_TAG.search(line):
+            # Check if button has text content or aria-label
+            if not _RE_ARIA_LABEL_OR_LABELLEDBY.search(line):
+                # Look ahead for text content
+                has_text_content = False
+                for check_line_num in range(line_num, min(line_num + 3, len(lines))):
+                    check_line = lines[check_line_num - 1]
+                    if _RE_TEXT_CONTENT.search(check_line):
+                        has_text_content = True
+                        break
+                
+                if not has_text_content:
+                    issues.append(self._create_issue(
+                        file_path=file_path,
+                        line_number=line_num,
+                        severity=LintSeverity.HIGH,
+                        rule_id="a11y-button-no-text",
+                        message="Button missing accessible text",
+                        suggestion="Add text content, aria-label, or aria-labelledby attribute"
+                    ))
+        
+        # Check for links without text or aria-label
+        if _RE_LINK_TAG.search(line) and not _RE_ARIA_LABEL.search(line):
+            if not _RE_TEXT_CONTENT.search(line):
                 issues.append(self._create_issue(
                     file_path=file_path,
                     line_number=line_num,
-                    severity=LintSeverity.MEDIUM,
-                    rule_id="a11y-empty-alt",
-                    message="Image with empty alt should have role=\"presentation\" for clarity",
-                    suggestion="Add role=\"presentation\" to indicate decorative image"
+                    severity=LintSeverity.HIGH,
+                    rule_id="a11y-link-no-text",
+                    message="Link missing accessible text",
+                    suggestion="Add descriptive text content or aria-label attribute"
                 ))
+    
+    def _check_form_accessibility(self, issues: List[LintIssue], file_path: Path, line_num: int,
+                                  line: str, lines: List[str]) -> None:
+        """Check form elements for accessibility"""
+        # Check for input without label
+        if _RE_INPUT_TAG.search(line):
+            has_label_association = any([
+                'id=' in line and 'htmlFor=' in '\n'.join(lines[max(0, line_num-5):line_num+5]),
+                'aria-label=' in line,
+                'aria-labelledby=' in line,
+                'title=' in line
+            ])
             
-            # Check for background images in CSS without text alternatives
-            if re.search(r'backgroundImage\s*:', line) or re.search(r'background.*url\(', line):
+            if not has_label_association:
                 issues.append(self._create_issue(
                     file_path=file_path,
                     line_number=line_num,
-                    severity=LintSeverity.MEDIUM,
-                    rule_id="a11y-background-image",
-                    message="Background images are not accessible to screen readers",
-                    suggestion="Consider using <img> with alt text or provide alternative text content"
+                    severity=LintSeverity.HIGH,
+                    rule_id="a11y-input-no-label",
+                    message="Input missing associated label",
+                    suggestion="Add label with htmlFor, aria-label, or aria-labelledby"
                 ))
-                
-        return issues
-    
-    def _check_interactive_elements(self, file_path: Path, lines: List[str]) -> List[LintIssue]:
-        """Check interactive elements for accessibility"""
-        issues = []
         
-        for line_num, line in enumerate(lines, 1):
-            # Check for div/span with click handlers (should be button/link)
-            interactive_patterns = [
-                r'<div[^>]*onClick',
-                r'<span[^>]*onClick',
-                r'<p[^>]*onClick',
-            ]
-            
-            for pattern in interactive_patterns:
-                if re.search(pattern, line):
-                    # Check if it has proper accessibility attributes
-                    if not re.search(r'role\s*=\s*[\'\"](button|link)', line):
-                        issues.append(self._create_issue(
-                            file_path=file_path,
-                            line_number=line_num,
-                            severity=LintSeverity.HIGH,
-                            rule_id="a11y-interactive-element",
-                            message="Interactive element should be a button or link, or have proper role",
-                            suggestion="Use <button> or <a>, or add role=\"button\" and keyboard event handlers"
-                        ))
-            
-            # Check for buttons without accessible text
-            if re.search(r'<button[^>]*>', line):
-                # Check if button has text content or aria-label
-                if not re.search(r'aria-label\s*=|aria-labelledby\s*=', line):
-                    # Look ahead for text content
-                    has_text_content = False
-                    for check_line_num in range(line_num, min(line_num + 3, len(lines))):
-                        check_line = lines[check_line_num - 1]
-                        if re.search(r'>\s*\w+', check_line) or re.search(r'{\w+}', check_line):
-                            has_text_content = True
-                            break
-                    
-                    if not has_text_content:
-                        issues.append(self._create_issue(
-                            file_path=file_path,
-                            line_number=line_num,
-                            severity=LintSeverity.HIGH,
-                            rule_id="a11y-button-no-text",
-                            message="Button missing accessible text",
-                            suggestion="Add text content, aria-label, or aria-labelledby attribute"
-                        ))
-            
-            # Check for links without text or aria-label
-            if re.search(r'<a\s+', line) and not re.search(r'aria-label\s*=', line):
-                if not re.search(r'>\s*\w+|{\w+}', line):
-                    issues.append(self._create_issue(
-                        file_path=file_path,
-                        line_number=line_num,
-                        severity=LintSeverity.HIGH,
-                        rule_id="a11y-link-no-text",
-                        message="Link missing accessible text",
-                        suggestion="Add descriptive text content or aria-label attribute"
-                    ))
-                    
-        return issues
-    
-    def _check_form_accessibility(self, file_path: Path, lines: List[str]) -> List[LintIssue]:
-        """Check form elements for accessibility"""
-        issues = []
+        # Check for form without accessible name
+        if _RE_FORM_TAG.search(line):
+            if not _RE_ARIA_LABEL_OR_LABELLEDBY.search(line):
+                issues.append(self._create_issue(
+                    file_path=file_path,
+                    line_number=line_num,
+                    severity=LintSeverity.MEDIUM,
+                    rule_id="a11y-form-no-name",
+                    message="Form missing accessible name",
+                    suggestion="Add aria-label or aria-labelledby to describe form purpose"
+                ))
         
-        for line_num, line in enumerate(lines, 1):
-            # Check for input without label
-            if re.search(r'<input\s+', line):
-                has_label_association = any([
-                    'id=' in line and 'htmlFor=' in '\n'.join(lines[max(0, line_num-5):line_num+5]),
-                    'aria-label=' in line,
-                    'aria-labelledby=' in line,
-                    'title=' in line
-                ])
-                
-                if not has_label_association:
-                    issues.append(self._create_issue(
-                        file_path=file_path,
-                        line_number=line_num,
-                        severity=LintSeverity.HIGH,
-                        rule_id="a11y-input-no-label",
-                        message="Input missing associated label",
-                        suggestion="Add label with htmlFor, aria-label, or aria-labelledby"
-                    ))
-            
-            # Check for form without accessible name
-            if re.search(r'<form\s*>', line) or re.search(r'<form\s+[^>]*>', line):
-                if not re.search(r'aria-label\s*=|aria-labelledby\s*=', line):
-                    issues.append(self._create_issue(
-                        file_path=file_path,
-                        line_number=line_num,
-                        severity=LintSeverity.MEDIUM,
-                        rule_id="a11y-form-no-name",
-                        message="Form missing accessible name",
-                        suggestion="Add aria-label or aria-labelledby to describe form purpose"
-                    ))
-            
-            # Check for select without label
-            if re.search(r'<select\s+', line):
-                if not re.search(r'aria-label\s*=|aria-labelledby\s*=', line):
-                    issues.append(self._create_issue(
-                        file_path=file_path,
-                        line_number=line_num,
-                        severity=LintSeverity.HIGH,
-                        rule_id="a11y-select-no-label",
-                        message="Select element missing label",
-                        suggestion="Add aria-label or associate with label element"
-                    ))
-                    
-        return issues
+        # Check for select without label
+        if _RE_SELECT_TAG.search(line):
+            if not _RE_ARIA_LABEL_OR_LABELLEDBY.search(line):
+                issues.append(self._create_issue(
+                    file_path=file_path,
+                    line_number=line_num,
+                    severity=LintSeverity.HIGH,
+                    rule_id="a11y-select-no-label",
+                    message="Select element missing label",
+                    suggestion="Add aria-label or associate with label element"
+                ))
     
-    def _check_semantic_html(self, file_path: Path, lines: List[str]) -> List[LintIssue]:
+    def _check_semantic_html(self, issues: List[LintIssue], file_path: Path, line_num: int,
+                             line: str) -> None:
         """Check for proper semantic HTML usage"""
-        issues = []
+        # Check for div soup (too many divs)
+        div_count = line.count('<div')
+        if div_count > 3:
+            issues.append(self._create_issue(
+                file_path=file_path,
+                line_number=line_num,
+                severity=LintSeverity.LOW,
+                rule_id="a11y-div-soup",
+                message="Consider using semantic HTML elements instead of multiple divs",
+                suggestion="Use <section>, <article>, <nav>, <header>, <main>, <aside>, <footer>"
+            ))
         
-        for line_num, line in enumerate(lines, 1):
-            # Check for div soup (too many divs)
-            div_count = line.count('<div')
-            if div_count > 3:
+        # Check for headings hierarchy
+        heading_match = _RE_HEADING_TAG.search(line)
+        if heading_match:
+            heading_level = int(heading_match.group(1))
+            if heading_level > 1:
+                # Basic check - this would need more sophisticated tracking
                 issues.append(self._create_issue(
                     file_path=file_path,
                     line_number=line_num,
                     severity=LintSeverity.LOW,
-                    rule_id="a11y-div-soup",
-                    message="Consider using semantic HTML elements instead of multiple divs",
-                    suggestion="Use <section>, <article>, <nav>, <header>, <main>, <aside>, <footer>"
+                    rule_id="a11y-heading-hierarchy",
+                    message=f"Ensure heading hierarchy is logical (h{heading_level} should follow h{heading_level-1})",
+                    suggestion="Maintain logical heading order for screen reader navigation"
                 ))
-            
-            # Check for missing main landmark
-            content = '\n'.join(lines)
-            if 'function App(' in content or 'const App =' in content:
-                if '<main' not in content and 'role="main"' not in content:
-                    issues.append(self._create_issue(
-                        file_path=file_path,
-                        line_number=line_num,
-                        severity=LintSeverity.MEDIUM,
-                        rule_id="a11y-missing-main",
-                        message="Page missing main landmark",
-                        suggestion="Add <main> element or role=\"main\" to identify main content"
-                    ))
-            
-            # Check for headings hierarchy
-            heading_match = re.search(r'<h([1-6])', line)
-            if heading_match:
-                heading_level = int(heading_match.group(1))
-                if heading_level > 1:
-                    # Basic check - this would need more sophisticated tracking
-                    issues.append(self._create_issue(
-                        file_path=file_path,
-                        line_number=line_num,
-                        severity=LintSeverity.LOW,
-                        rule_id="a11y-heading-hierarchy",
-                        message=f"Ensure heading hierarchy is logical (h{heading_level} should follow h{heading_level-1})",
-                        suggestion="Maintain logical heading order for screen reader navigation"
-                    ))
-                    
-        return issues
     
-    def _check_aria_attributes(self, file_path: Path, lines: List[str]) -> List[LintIssue]:
+    def _check_aria_attributes(self, issues: List[LintIssue], file_path: Path, line_num: int,
+                               line: str) -> None:
         """Check for proper ARIA attribute usage"""
-        issues = []
+        # Check for invalid ARIA attributes
+        for attr in _RE_INVALID_ARIA_ATTR.findall(line):
+            issues.append(self._create_issue(
+                file_path=file_path,
+                line_number=line_num,
+                severity=LintSeverity.MEDIUM,
+                rule_id="a11y-invalid-aria",
+                message=f"Invalid ARIA attribute: aria-{attr}",
+                suggestion="Use valid ARIA attributes from the ARIA specification"
+            ))
         
-        for line_num, line in enumerate(lines, 1):
-            # Check for invalid ARIA attributes
-            aria_matches = re.findall(r'aria-(\w+)\s*=', line)
-            valid_aria_attrs = {
-                'label', 'labelledby', 'describedby', 'hidden', 'expanded', 'controls',
-                'haspopup', 'selected', 'checked', 'disabled', 'required', 'invalid',
-                'live', 'atomic', 'relevant', 'busy', 'dropeffect', 'grabbed',
-                'activedescendant', 'owns', 'flowto', 'level', 'multiline',
-                'multiselectable', 'orientation', 'readonly', 'sort', 'valuemax',
-                'valuemin', 'valuenow', 'valuetext', 'autocomplete', 'keyshortcuts',
-                'roledescription', 'placeholder', 'posinset', 'setsize'
-            }
-            
-            for attr in aria_matches:
-                if attr not in valid_aria_attrs:
-                    issues.append(self._create_issue(
-                        file_path=file_path,
-                        line_number=line_num,
-                        severity=LintSeverity.MEDIUM,
-                        rule_id="a11y-invalid-aria",
-                        message=f"Invalid ARIA attribute: aria-{attr}",
-                        suggestion="Use valid ARIA attributes from the ARIA specification"
-                    ))
-            
-            # Check for redundant ARIA roles
-            if re.search(r'<button[^>]*role\s*=\s*[\'\""]button[\'\""]', line):
+        # Check for redundant ARIA roles
+        if _RE_REDUNDANT_BUTTON_ROLE.search(line):
+            issues.append(self._create_issue(
+                file_path=file_path,
+                line_number=line_num,
+                severity=LintSeverity.LOW,
+                rule_id="a11y-redundant-role",
+                message="Redundant role=\"button\" on button element",
+                suggestion="Remove redundant role attribute - button has implicit button role"
+            ))
+        
+        # Check for aria-hidden on focusable elements
+        if 'aria-hidden="true"' in line and any(attr in line for attr in ['tabindex', 'onClick', 'onFocus']):
+            issues.append(self._create_issue(
+                file_path=file_path,
+                line_number=line_num,
+                severity=LintSeverity.HIGH,
+                rule_id="a11y-hidden-focusable",
+                message="Focusable element should not have aria-hidden=\"true\"",
+                suggestion="Remove aria-hidden or make element non-focusable"
+            ))
+    
+    def _check_color_contrast(self, issues: List[LintIssue], file_path: Path, line_num: int,
+                              line: str) -> None:
+        """Check for potential color contrast issues"""
+        # Check for hardcoded colors that might have contrast issues
+        for pattern in _COLOR_PATTERNS:
+            if pattern.search(line):
                 issues.append(self._create_issue(
                     file_path=file_path,
                     line_number=line_num,
                     severity=LintSeverity.LOW,
-                    rule_id="a11y-redundant-role",
-                    message="Redundant role=\"button\" on button element",
-                    suggestion="Remove redundant role attribute - button has implicit button role"
+                    rule_id="a11y-color-contrast",
+                    message="Hardcoded colors may not meet contrast requirements",
+                    suggestion="Use design system colors and test contrast ratios (4.5:1 minimum)"
                 ))
-            
-            # Check for aria-hidden on focusable elements
-            if 'aria-hidden="true"' in line and any(attr in line for attr in ['tabindex', 'onClick', 'onFocus']):
+    
+    def _check_keyboard_navigation(self, issues: List[LintIssue], file_path: Path, line_num: int,
+                                   line: str) -> None:
+        """Check for keyboard navigation support"""
+        # Check for elements with onClick but no onKeyDown
+        if 'onClick=' in line and 'onKeyDown=' not in line:
+            # Check if it's a proper interactive element
+            if not _RE_INTERACTIVE_TAG.search(line):
                 issues.append(self._create_issue(
                     file_path=file_path,
                     line_number=line_num,
-                    severity=LintSeverity.HIGH,
-                    rule_id="a11y-hidden-focusable",
-                    message="Focusable element should not have aria-hidden=\"true\"",
-                    suggestion="Remove aria-hidden or make element non-focusable"
+                    severity=LintSeverity.MEDIUM,
+                    rule_id="a11y-keyboard-handler",
+                    message="Interactive element missing keyboard event handler",
+                    suggestion="Add onKeyDown handler for Enter/Space keys or use proper interactive element"
                 ))
-                
-        return issues
-    
-    def _check_color_contrast(self, file_path: Path, lines: List[str]) -> List[LintIssue]:
-        """Check for potential color contrast issues"""
-        issues = []
         
-        for line_num, line in enumerate(lines, 1):
-            # Check for hardcoded colors that might have contrast issues
-            color_patterns = [
-                r'color\s*:\s*[\'\""]#[a-fA-F0-9]{3,6}[\'\""]',
-                r'backgroundColor\s*:\s*[\'\""]#[a-fA-F0-9]{3,6}[\'\""]',
-                r'style.*color.*#[a-fA-F0-9]{3,6}',
-            ]
-            
-            for pattern in color_patterns:
-                if re.search(pattern, line):
-                    issues.append(self._create_issue(
-                        file_path=file_path,
-                        line_number=line_num,
-                        severity=LintSeverity.LOW,
-                        rule_id="a11y-color-contrast",
-                        message="Hardcoded colors may not meet contrast requirements",
-                        suggestion="Use design system colors and test contrast ratios (4.5:1 minimum)"
-                    ))
-                    
-        return issues
+        # Check for tabindex values other than 0 or -1
+        tabindex_match = _RE_TABINDEX.search(line)
+        if tabindex_match:
+            tabindex_value = int(tabindex_match.group(1))
+            if tabindex_value > 0:
+                issues.append(self._create_issue(
+                    file_path=file_path,
+                    line_number=line_num,
+                    severity=LintSeverity.MEDIUM,
+                    rule_id="a11y-positive-tabindex",
+                    message="Positive tabIndex values can create confusing tab order",
+                    suggestion="Use tabIndex={0} to include in tab order or tabIndex={-1} to exclude"
+                ))
     
-    def _check_keyboard_navigation(self, file_path: Path, lines: List[str]) -> List[LintIssue]:
-        """Check for keyboard navigation support"""
-        issues = []
-        
-        for line_num, line in enumerate(lines, 1):
-            # Check for elements with onClick but no onKeyDown
-            if 'onClick=' in line and 'onKeyDown=' not in line:
-                # Check if it's a proper interactive element
-                if not re.search(r'<(button|a|input|select|textarea)', line):
-                    issues.append(self._create_issue(
-                        file_path=file_path,
-                        line_number=line_num,
-                        severity=LintSeverity.MEDIUM,
-                        rule_id="a11y-keyboard-handler",
-                        message="Interactive element missing keyboard event handler",
-                        suggestion="Add onKeyDown handler for Enter/Space keys or use proper interactive element"
-                    ))
-            
-            # Check for tabindex values other than 0 or -1
-            tabindex_match = re.search(r'tabIndex\s*=\s*[\'\""]?(\d+)[\'\""]?', line)
-            if tabindex_match:
-                tabindex_value = int(tabindex_match.group(1))
-                if tabindex_value > 0:
-                    issues.append(self._create_issue(
-                        file_path=file_path,
-                        line_number=line_num,
-                        severity=LintSeverity.MEDIUM,
-                        rule_id="a11y-positive-tabindex",
-                        message="Positive tabIndex values can create confusing tab order",
-                        suggestion="Use tabIndex={0} to include in tab order or tabIndex={-1} to exclude"
-                    ))
-                    
-        return issues
+    def _check_main_landmark(self, issues: List[LintIssue], file_path: Path, content: str) -> None:
+        """Check that an app component has a main landmark"""
+        if 'function App(' in content or 'const App =' in content:
+            if '<main' not in content and 'role="main"' not in content:
+                issues.append(self._create_issue(
+                    file_path=file_path,
+                    line_number=1,
+                    severity=LintSeverity.MEDIUM,
+                    rule_id="a11y-missing-main",
+                    message="Page missing main landmark",
+                    suggestion="Add <main> element or role=\"main\" to identify main content"
+                ))
     
-    def _check_focus_management(self, file_path: Path, lines: List[str]) -> List[LintIssue]:
+    def _check_focus_management(self, issues: List[LintIssue], file_path: Path, content: str) -> None:
         """Check for proper focus management"""
-        issues = []
-        
-        content = '\n'.join(lines)
+        lowered = content.lower()
         
         # Check for modals without focus trapping
-        if any(keyword in content.lower() for keyword in ['modal', 'dialog', 'popup']):
+        if any(keyword in lowered for keyword in ['modal', 'dialog', 'popup']):
             if 'focus()' not in content and 'autoFocus' not in content:
                 issues.append(self._create_issue(
                     file_path=file_path,
@@ -388,7 +384,7 @@ class AccessibilityLinter(NodeJSLinter):
                 ))
         
         # Check for skip links
-        if 'function App(' in content and 'skip' not in content.lower():
+        if 'function App(' in content and 'skip' not in lowered:
             issues.append(self._create_issue(
                 file_path=file_path,
                 line_number=1,
@@ -397,34 +393,28 @@ class AccessibilityLinter(NodeJSLinter):
                 message="Consider adding skip navigation link for keyboard users",
                 suggestion="Add skip link to jump to main content"
             ))
-            
-        return issues
     
-    def _check_screen_reader_support(self, file_path: Path, lines: List[str]) -> List[LintIssue]:
+    def _check_screen_reader_support(self, issues: List[LintIssue], file_path: Path, line_num: int,
+                                     line: str) -> None:
         """Check for screen reader support"""
-        issues = []
+        # Check for elements that change without screen reader notification
+        if _RE_DISPLAY_NONE.search(line) and 'aria-hidden' not in line:
+            issues.append(self._create_issue(
+                file_path=file_path,
+                line_number=line_num,
+                severity=LintSeverity.MEDIUM,
+                rule_id="a11y-screen-reader-hidden",
+                message="Hidden content should be properly announced to screen readers",
+                suggestion="Add aria-hidden=\"true\" or use sr-only class for screen reader only content"
+            ))
         
-        for line_num, line in enumerate(lines, 1):
-            # Check for elements that change without screen reader notification
-            if re.search(r'display\s*:\s*[\'\""]none[\'\""]', line) and 'aria-hidden' not in line:
-                issues.append(self._create_issue(
-                    file_path=file_path,
-                    line_number=line_num,
-                    severity=LintSeverity.MEDIUM,
-                    rule_id="a11y-screen-reader-hidden",
-                    message="Hidden content should be properly announced to screen readers",
-                    suggestion="Add aria-hidden=\"true\" or use sr-only class for screen reader only content"
-                ))
-            
-            # Check for loading states without proper announcement
-            if 'loading' in line.lower() and 'aria-live' not in line:
-                issues.append(self._create_issue(
-                    file_path=file_path,
-                    line_number=line_num,
-                    severity=LintSeverity.MEDIUM,
-                    rule_id="a11y-loading-announcement",
-                    message="Loading states should be announced to screen readers",
-                    suggestion="Add aria-live=\"polite\" or aria-live=\"assertive\" for dynamic content"
-                ))
-                
-        return issues
\ No newline at end of file
+        # Check for loading states without proper announcement
+        if 'loading' in line.lower() and 'aria-live' not in line:
+            issues.append(self._create_issue(
+                file_path=file_path,
+                line_number=line_num,
+                severity=LintSeverity.MEDIUM,
+                rule_id="a11y-loading-announcement",
+                message="Loading states should be announced to screen readers",
+                suggestion="Add aria-live=\"polite\" or aria-live=\"assertive\" for dynamic content"
+            ))
\ No newline at end of file